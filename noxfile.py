@@ -72,7 +72,11 @@ def mypy(session: nox.Session) -> None:
     session.run("mypy", *MYPY_OPTIONS, ".")
 
 
-@nox_uv.session(tags=["test"], uv_groups=["pytest"])
+@nox_uv.session(
+    tags=["test"],
+    uv_groups=["pytest"],
+    uv_extras=["calamine", "xlsxwriter"],
+)
 @nox.parametrize("database_engine", DATABASE_ENGINES)
 @nox.parametrize(
     ("python", "django"),
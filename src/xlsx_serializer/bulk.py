@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+__all__ = [
+    "load",
+]
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from graphlib import CycleError, TopologicalSorter
+from typing import IO, TYPE_CHECKING, Any, Final
+
+from django.core.management.color import no_style
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    DatabaseError,
+    IntegrityError,
+    connections,
+    router,
+    transaction,
+)
+
+from xlsx_serializer.core import Deserializer, _get_model_dependencies, _get_option
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from concurrent.futures import Future
+    from pathlib import Path
+
+    import openpyxl
+
+    from django.core.serializers.base import DeserializedObject
+    from django.db.models import Model
+
+DEFAULT_BATCH_SIZE: Final[int] = 1000
+
+
+def _supports_bulk_create(model: type[Model]) -> bool:
+    opts = model._meta
+
+    # Multi-table inherited models can't be bulk created. The models whose fields are
+    # automatically updated on save are saved one by one as well, so the values read
+    # from the workbook are kept (just like by the `loaddata` command).
+    return not opts.parents and not any(
+        getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+        for field in opts.concrete_fields
+    )
+
+
+def _has_self_references(model: type[Model]) -> bool:
+    # The objects referring to the objects of the same model may refer to the ones
+    # inserted by another batch, so their batches can't be inserted concurrently.
+    opts = model._meta
+
+    return any(
+        field.remote_field.model is model
+        for field in opts.concrete_fields + opts.many_to_many
+        if field.remote_field
+    )
+
+
+def _depends_on_cycle(model: type[Model]) -> bool:
+    # The objects of the models in a cycle of dependencies (or depending on one) may
+    # refer to the objects inserted later, so their batches can't be committed one by
+    # one. Self-references are ignored (see `_has_self_references()`).
+    dependencies: dict[type[Model], set[type[Model]]] = {}
+    pending_models = [model]
+    while pending_models:
+        if (pending_model := pending_models.pop()) not in dependencies:
+            dependencies[pending_model] = _get_model_dependencies(pending_model) - {
+                pending_model,
+            }
+            pending_models += dependencies[pending_model]
+
+    try:
+        TopologicalSorter(dependencies).prepare()
+    except CycleError:
+        return True
+
+    return False
+
+
+class _BulkLoader:
+    # Collects the deserialized objects into single-model batches. Each batch is
+    # inserted (or updated, if the objects already exist and the database supports it)
+    # by a single query, followed by a single query per many-to-many field. Given an
+    # executor, the batches of a model are inserted concurrently, each over its own
+    # database connection and in its own transaction. Once a batch can't be inserted
+    # concurrently due to its references, it and all the following batches are
+    # inserted over the caller's connection, in a single transaction entered into the
+    # given stack (so their objects may refer to each other, whatever their order).
+
+    def __init__(
+        self,
+        using: str,
+        batch_size: int,
+        executor: ThreadPoolExecutor | None = None,
+        stack: ExitStack | None = None,
+    ) -> None:
+        self._using = using
+        self._batch_size = batch_size
+        self._batch: list[DeserializedObject] = []
+        self._executor = executor
+        self._stack = stack
+        self._futures: list[Future[None]] = []
+        self._futures_model: type[Model] | None = None
+
+        self.models: set[type[Model]] = set()
+        self.object_count = 0
+        self.deferred_objects: list[DeserializedObject] = []
+
+    def add(self, deserialized_object: DeserializedObject) -> None:
+        # The batches are flushed in the order of the objects, so the objects related
+        # by foreign keys are inserted after the objects they refer to.
+        if self._batch and (
+            len(self._batch) >= self._batch_size
+            or type(self._batch[0].object) is not type(deserialized_object.object)
+        ):
+            self.flush()
+
+        self._batch.append(deserialized_object)
+
+    def flush(self) -> None:
+        if not (batch := self._batch):
+            return
+        self._batch = []
+
+        model = type(batch[0].object)
+        if not router.allow_migrate_model(self._using, model):
+            return
+
+        # The objects of the next model may refer to the ones being inserted, so the
+        # pending batches have to be committed first.
+        if model is not self._futures_model:
+            self.wait()
+
+        independent = not _has_self_references(model) and not _depends_on_cycle(model)
+        if self._executor is not None and independent and _supports_bulk_create(model):
+            self._futures.append(
+                self._executor.submit(self._save_concurrently, model, batch),
+            )
+            self._futures_model = model
+        else:
+            if not independent and self._stack is not None:
+                self._executor = None
+                self._stack.enter_context(transaction.atomic(using=self._using))
+                self._stack = None
+            self._save(model, batch)
+
+        self.models.add(model)
+        self.object_count += len(batch)
+        self.deferred_objects += [
+            deserialized_object
+            for deserialized_object in batch
+            if deserialized_object.deferred_fields
+        ]
+
+    def wait(self) -> None:
+        # Wait for the batches inserted concurrently, and raise the first error.
+        futures, self._futures, self._futures_model = self._futures, [], None
+        for future in futures:
+            future.result()
+
+    def _save(self, model: type[Model], batch: list[DeserializedObject]) -> None:
+        try:
+            if _supports_bulk_create(model):
+                self._bulk_create(model, batch)
+            else:
+                for deserialized_object in batch:
+                    deserialized_object.save(using=self._using)
+        # psycopg raises `ValueError` if data contains NUL characters.
+        except (DatabaseError, IntegrityError, ValueError) as e:
+            e.args = (f"Could not load {model._meta.label} objects: {e}",)
+            raise
+
+    def _save_concurrently(
+        self,
+        model: type[Model],
+        batch: list[DeserializedObject],
+    ) -> None:
+        # Database connections are local to threads, so each batch is inserted over
+        # the executor thread's connection, which is closed afterward.
+        try:
+            with transaction.atomic(using=self._using):
+                self._save(model, batch)
+        finally:
+            connections[self._using].close()
+
+    def _bulk_create(
+        self,
+        model: type[Model],
+        batch: list[DeserializedObject],
+    ) -> None:
+        opts = model._meta
+        connection = connections[self._using]
+
+        # Existing objects are updated, like by the `loaddata` command. Upserts are
+        # available in Django 4.1+, with database backends supporting them.
+        update_fields = [
+            field.name for field in opts.concrete_fields if not field.primary_key
+        ]
+        options: dict[str, Any]
+        if not getattr(
+            connection.features,
+            "supports_update_conflicts_with_target",
+            False,
+        ):
+            options = {}
+        elif update_fields:
+            options = {
+                "update_conflicts": True,
+                "unique_fields": [opts.pk.name],
+                "update_fields": update_fields,
+            }
+        else:
+            options = {"ignore_conflicts": True}
+
+        manager = model._default_manager.using(self._using)
+        objects = [deserialized_object.object for deserialized_object in batch]
+        if options:
+            # The primary keys aren't set on the objects inserted while ignoring the
+            # conflicts (or upserted, before Django 5.0), so the objects without them
+            # (which can't conflict with the existing ones anyway) are inserted
+            # without the options; their many-to-many relations refer to them below.
+            manager.bulk_create(
+                [obj for obj in objects if obj.pk is not None],
+                **options,
+            )
+            manager.bulk_create([obj for obj in objects if obj.pk is None])
+        else:
+            manager.bulk_create(objects)
+
+        # Replace the objects' many-to-many relations. The rows of the auto-created
+        # intermediate models are deleted and inserted in bulk; the relations through
+        # custom intermediate models are set by the related managers.
+        relations: dict[str, list[tuple[Model, Sequence[Any]]]] = {}
+        for deserialized_object in batch:
+            for name, values in (deserialized_object.m2m_data or {}).items():
+                relations.setdefault(name, []).append(
+                    (deserialized_object.object, values),
+                )
+
+        many_to_many = {field.name: field for field in opts.many_to_many}
+        for name, object_values in relations.items():
+            field = many_to_many[name]
+            through = field.remote_field.through
+            if through is None or not through._meta.auto_created:
+                for obj, values in object_values:
+                    getattr(obj, name).set(values)
+                continue
+
+            through_fields = {
+                through_field.name: through_field
+                for through_field in through._meta.local_fields
+            }
+            source_attname = through_fields[field.m2m_field_name()].attname
+            target_attname = through_fields[field.m2m_reverse_field_name()].attname
+
+            through_manager = through._default_manager.using(self._using)
+            through_manager.filter(
+                **{f"{source_attname}__in": [obj.pk for obj, _ in object_values]},
+            ).delete()
+            through_manager.bulk_create(
+                [
+                    through(**{source_attname: obj.pk, target_attname: value})
+                    for obj, values in object_values
+                    for value in dict.fromkeys(values)
+                ],
+                batch_size=self._batch_size,
+            )
+
+
+def load(
+    stream_or_string: str | Path | bytes | IO[bytes] | openpyxl.Workbook,
+    *,
+    using: str = DEFAULT_DB_ALIAS,
+    **options: Any,
+) -> int:
+    # Load the workbook's objects into the database in batches inserted in bulk, rather
+    # than saving them one by one (like the `loaddata` command does). Note that the
+    # models' `save()` methods aren't called and no signals are sent. The `batch_size`
+    # option sets the number of objects per batch; the remaining options are passed to
+    # the deserializer. Returns the number of objects loaded.
+    #
+    # With the `workers` option, the workbook is parsed by as many worker processes
+    # (see `Deserializer`), and the batches of each model are inserted concurrently by
+    # as many threads. The batches are then committed one by one, so the objects are
+    # loaded in a single transaction only if the function is called inside one (in
+    # which case the batches are inserted sequentially). The batches of the models in
+    # dependency cycles, and the ones following them, are inserted sequentially in a
+    # single transaction.
+    batch_size = _get_option(options, "batch_size") or DEFAULT_BATCH_SIZE
+    options.pop("batch_size", None)
+
+    connection = connections[using]
+    workers = _get_option(options, "workers") or 1
+    concurrent = workers > 1 and not connection.in_atomic_block
+
+    with ExitStack() as stack:
+        if concurrent:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+            loader = _BulkLoader(using, batch_size, executor, stack)
+        else:
+            stack.enter_context(transaction.atomic(using=using))
+            loader = _BulkLoader(using, batch_size)
+        stack.enter_context(connection.constraint_checks_disabled())
+
+        for deserialized_object in Deserializer(
+            stream_or_string,
+            using=using,
+            handle_forward_references=True,
+            **options,
+        ):
+            loader.add(deserialized_object)
+        loader.flush()
+        loader.wait()
+
+        # Finally, save the fields referring to the objects that followed them.
+        for deserialized_object in loader.deferred_objects:
+            deserialized_object.save_deferred_fields(using=using)
+
+        # Since the constraint checks were disabled, check for any invalid keys.
+        connection.check_constraints(
+            table_names=[model._meta.db_table for model in loader.models],
+        )
+
+    # Reset the database sequences, as the objects may have been inserted with their
+    # primary keys.
+    if loader.object_count and (
+        sequence_sql := connection.ops.sequence_reset_sql(
+            no_style(),
+            list(loader.models),
+        )
+    ):
+        with connection.cursor() as cursor:
+            for line in sequence_sql:
+                cursor.execute(line)
+
+    return loader.object_count
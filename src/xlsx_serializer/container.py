@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+__all__ = [
+    "COMPRESSIONS",
+    "WorkbookArchive",
+    "get_compression",
+    "read_sheet_parts",
+    "recompress_archive",
+]
+
+import shutil
+from typing import IO, TYPE_CHECKING, Final
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import quoteattr
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from django.core.serializers.base import SerializationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SPREADSHEETML_NAMESPACE: Final[str] = (
+    "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+)
+
+RELATIONSHIPS_NAMESPACE: Final[str] = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+
+PACKAGE_RELATIONSHIPS_NAMESPACE: Final[str] = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+
+XML_DECLARATION: Final[str] = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+)
+
+# The compressions of the workbooks' zip containers, i.e., the methods and levels
+# used to compress their parts. Storing the parts trades the file size for the time
+# spent compressing them, which matters for the files that are read by programs only.
+COMPRESSIONS: Final[dict[str, tuple[int, int | None]]] = {
+    "stored": (ZIP_STORED, None),
+    "fast": (ZIP_DEFLATED, 1),
+    "default": (ZIP_DEFLATED, None),
+    "best": (ZIP_DEFLATED, 9),
+}
+
+DEFAULT_STYLES: Final[bytes] = (
+    f"{XML_DECLARATION}"
+    f'<styleSheet xmlns="{SPREADSHEETML_NAMESPACE}">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border>'
+    "</borders>"
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+    "</cellStyleXfs>"
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" '
+    'xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>'
+    "</cellStyles>"
+    "</styleSheet>"
+).encode()
+
+
+class WorkbookArchive:
+    # Writes an XLSX workbook's zip container sheet part by sheet part. The sheet
+    # parts (i.e., the worksheets' XML files) are written to the archive as they are
+    # added, while the workbook-level parts (the workbook, relationships, styles, and
+    # content types) are written when the archive is closed. The sheet parts must be
+    # self-contained, i.e., they must not refer to the shared strings table.
+
+    def __init__(
+        self,
+        file: str | Path | IO[bytes],
+        *,
+        compression: str = "default",
+    ) -> None:
+        method, level = get_compression(compression)
+        self._archive = ZipFile(
+            file,
+            "w",
+            method,
+            allowZip64=True,
+            compresslevel=level,
+        )
+        self._sheet_names: list[str] = []
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return self._sheet_names.copy()
+
+    def open_sheet(self, name: str) -> IO[bytes]:
+        self._sheet_names.append(name)
+
+        return self._archive.open(
+            f"xl/worksheets/sheet{len(self._sheet_names)}.xml",
+            "w",
+            force_zip64=True,
+        )
+
+    def write_sheet(self, name: str, source: IO[bytes]) -> None:
+        with self.open_sheet(name) as sheet_part:
+            shutil.copyfileobj(source, sheet_part)
+
+    def close(self, styles: bytes = DEFAULT_STYLES, theme: bytes | None = None) -> None:
+        sheet_ids = range(1, len(self._sheet_names) + 1)
+
+        overrides = [
+            (
+                "/xl/workbook.xml",
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml",
+            ),
+            (
+                "/xl/styles.xml",
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml",
+            ),
+            *(
+                (
+                    f"/xl/worksheets/sheet{sheet_id}.xml",
+                    "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml",
+                )
+                for sheet_id in sheet_ids
+            ),
+        ]
+        relationships = [
+            (
+                "worksheet",
+                f"worksheets/sheet{sheet_id}.xml",
+            )
+            for sheet_id in sheet_ids
+        ]
+        relationships.append(("styles", "styles.xml"))
+
+        if theme is not None:
+            overrides.append(
+                (
+                    "/xl/theme/theme1.xml",
+                    "application/vnd.openxmlformats-officedocument.theme+xml",
+                ),
+            )
+            relationships.append(("theme", "theme/theme1.xml"))
+            self._archive.writestr("xl/theme/theme1.xml", theme)
+
+        self._archive.writestr("xl/styles.xml", styles)
+        self._archive.writestr(
+            "xl/workbook.xml",
+            (
+                f"{XML_DECLARATION}"
+                f'<workbook xmlns="{SPREADSHEETML_NAMESPACE}" '
+                f'xmlns:r="{RELATIONSHIPS_NAMESPACE}"><sheets>'
+                + "".join(
+                    f"<sheet name={quoteattr(sheet_name)} sheetId="
+                    f'"{sheet_id}" r:id="rId{sheet_id}"/>'
+                    for sheet_id, sheet_name in zip(
+                        sheet_ids,
+                        self._sheet_names,
+                        strict=True,
+                    )
+                )
+                + "</sheets></workbook>"
+            ),
+        )
+        self._archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            (
+                f"{XML_DECLARATION}"
+                f'<Relationships xmlns="{PACKAGE_RELATIONSHIPS_NAMESPACE}">'
+                + "".join(
+                    f'<Relationship Id="rId{relationship_id}" '
+                    f'Type="{RELATIONSHIPS_NAMESPACE}/{relationship_type}" '
+                    f'Target="{target}"/>'
+                    for relationship_id, (relationship_type, target) in enumerate(
+                        relationships,
+                        start=1,
+                    )
+                )
+                + "</Relationships>"
+            ),
+        )
+        self._archive.writestr(
+            "_rels/.rels",
+            (
+                f"{XML_DECLARATION}"
+                f'<Relationships xmlns="{PACKAGE_RELATIONSHIPS_NAMESPACE}">'
+                f'<Relationship Id="rId1" '
+                f'Type="{RELATIONSHIPS_NAMESPACE}/officeDocument" '
+                f'Target="xl/workbook.xml"/>'
+                "</Relationships>"
+            ),
+        )
+        self._archive.writestr(
+            "[Content_Types].xml",
+            (
+                f"{XML_DECLARATION}"
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+                'content-types">'
+                '<Default Extension="rels" ContentType="application/'
+                'vnd.openxmlformats-package.relationships+xml"/>'
+                '<Default Extension="xml" ContentType="application/xml"/>'
+                + "".join(
+                    f'<Override PartName="{part_name}" ContentType="{content_type}"/>'
+                    for part_name, content_type in overrides
+                )
+                + "</Types>"
+            ),
+        )
+
+        self._archive.close()
+
+
+def get_compression(name: str) -> tuple[int, int | None]:
+    # Get the compression method and level (`None` meaning the default one) of the
+    # zip containers' parts.
+    try:
+        return COMPRESSIONS[name]
+    except KeyError:
+        msg = (
+            f"the compression {name!r} isn't supported; use one of: "
+            f"{', '.join(map(repr, COMPRESSIONS))}"
+        )
+        raise SerializationError(msg) from None
+
+
+def recompress_archive(
+    source: IO[bytes],
+    file: str | Path | IO[bytes],
+    *,
+    compression: str,
+) -> None:
+    # Copy all the parts of the source zip container into a new one, compressed as
+    # selected.
+    method, level = get_compression(compression)
+    with (
+        ZipFile(source) as source_archive,
+        ZipFile(
+            file,
+            "w",
+            method,
+            allowZip64=True,
+            compresslevel=level,
+        ) as archive,
+    ):
+        for name in source_archive.namelist():
+            with (
+                source_archive.open(name) as source_part,
+                archive.open(name, "w", force_zip64=True) as part,
+            ):
+                shutil.copyfileobj(source_part, part)
+
+
+def read_sheet_parts(archive: ZipFile) -> list[tuple[str, str]]:
+    # Map the workbook's relationships into the paths of the related parts.
+    relationships = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))  # noqa: S314
+    targets = {
+        relationship.attrib["Id"]: (
+            target.lstrip("/")
+            if (target := relationship.attrib["Target"]).startswith("/")
+            else f"xl/{target}"
+        )
+        for relationship in relationships
+    }
+
+    # Collect the sheets in the workbook order.
+    workbook = ET.fromstring(archive.read("xl/workbook.xml"))  # noqa: S314
+    return [
+        (
+            sheet.attrib["name"],
+            targets[sheet.attrib[f"{{{RELATIONSHIPS_NAMESPACE}}}id"]],
+        )
+        for sheet in workbook.iterfind(
+            f"{{{SPREADSHEETML_NAMESPACE}}}sheets/{{{SPREADSHEETML_NAMESPACE}}}sheet",
+        )
+    ]
@@ -5,36 +5,122 @@ __all__ = [
     "Serializer",
 ]
 
-import ast
 import io
 import json
+import shutil
 import sys
+import tempfile
 import warnings
-from contextlib import suppress
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from graphlib import CycleError, TopologicalSorter
+from itertools import chain, islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Final
+from typing import IO, TYPE_CHECKING, Any, ClassVar, Final, NamedTuple, TypeVar
 
 import openpyxl
 
+import django
 from django.apps import apps
+from django.conf import settings
 from django.core.serializers import python
-from django.core.serializers.base import DeserializedObject, SerializationError
-from django.db import models
+from django.core.serializers.base import (
+    DeserializationError,
+    DeserializedObject,
+    SerializationError,
+)
+from django.db import DEFAULT_DB_ALIAS, models
+
+from xlsx_serializer.natural_keys import NATURAL_KEY_CACHE_SIZE, NaturalKeyResolver
+from xlsx_serializer.readers import get_reader
+from xlsx_serializer.relations import parse_relation
+from xlsx_serializer.writers import get_writer
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Container, Iterable, Iterator
 
-    from django.db.models import Model
+    from django.db.models import Field, ManyToManyField, Model, QuerySet
+    from django.db.models.options import Options
+
+    from xlsx_serializer.writers import Writer
+
+    _DumpPlan = tuple[tuple[str, Callable[[Any], Any]], ...]
+    _LoadPlan = tuple[tuple[int, str, Callable[[Any], Any]], ...]
 
 if sys.version_info >= (3, 12):
     from typing import override
 else:
     from typing_extensions import override
 
+_T = TypeVar("_T")
+
 SHEET_NAME_MAX_LENGTH: Final[int] = 31
 
 SHEET_NAME_INVALID_CHARACTERS: Final[str] = "\\?*:/[]"
 
+SHEET_MAX_ROWS: Final[int] = 1_048_576
+
+PREFETCH_CHUNK_SIZE: Final[int] = 2000
+
+ROW_RANGE_MIN_SIZE: Final[int] = 10_000
+
+DEFAULT_READER: Final[str] = "openpyxl"
+
+DEFAULT_WRITER: Final[str] = "openpyxl"
+
+DEFAULT_COMPRESSION: Final[str] = "default"
+
+_KEEP_EMPTY: Final[object] = object()
+
+SETTINGS_PREFIX: Final[str] = "XLSX_SERIALIZER_"
+
+
+def _get_option(options: dict[str, Any], name: str, *, default: Any = None) -> Any:
+    # Options passed explicitly take precedence. Otherwise, fall back to the project
+    # settings, which is the only way to configure (de)serialization run by the
+    # management commands (e.g., `XLSX_SERIALIZER_WRITE_ONLY` for `write_only`).
+    if name in options:
+        return options[name]
+
+    return getattr(settings, f"{SETTINGS_PREFIX}{name.upper()}", default)
+
+
+class _ModelIndex:
+    # An index of the installed models for resolving model identifiers (see the
+    # `_get_model()` function) and default sheet names in constant time.
+
+    _current: ClassVar[_ModelIndex | None] = None
+
+    def __init__(self, installed_models: list[type[Model]]) -> None:
+        self.installed_models = installed_models
+
+        self.models_by_label: dict[str, list[type[Model]]] = defaultdict(list)
+        self.models_by_name: dict[str, list[type[Model]]] = defaultdict(list)
+        self.labels: dict[type[Model], str] = {}
+        for model in installed_models:
+            opts = model._meta
+            # Only the abstract models (which aren't installed) have no names.
+            if (model_name := opts.model_name) is None:
+                continue
+            self.models_by_label[f"{opts.app_label}.{model_name}"].append(model)
+            self.models_by_name[model_name].append(model)
+            self.labels[model] = opts.label
+
+    @classmethod
+    def get(cls) -> _ModelIndex:
+        # The list of installed models is cached by the app registry until the
+        # registry changes (e.g., when the apps are re-populated), so its identity is
+        # used to invalidate the index.
+        installed_models = apps.get_models()
+        if (
+            cls._current is None
+            or cls._current.installed_models is not installed_models
+        ):
+            cls._current = cls(installed_models)
+
+        return cls._current
+
 
 def _get_model(model_identifier: str) -> type[Model]:
     # Determine the model's name and app label.
@@ -44,12 +130,12 @@ def _get_model(model_identifier: str) -> type[Model]:
         app_label, model_name = None, model_label
 
     # Determine the candidates for the model to be returned.
-    models_candidates = [
-        model
-        for model in apps.get_models()
-        if model._meta.model_name == model_name
-        and (True if app_label is None else model._meta.app_label == app_label)
-    ]
+    model_index = _ModelIndex.get()
+    models_candidates = (
+        model_index.models_by_name.get(model_name, [])
+        if app_label is None
+        else model_index.models_by_label.get(f"{app_label}.{model_name}", [])
+    )
 
     # An identifier is valid if it represents a unique model.
     if (num_model_candidates := len(models_candidates)) != 1:
@@ -68,6 +154,187 @@ def _get_model(model_identifier: str) -> type[Model]:
     return models_candidates[0]
 
 
+def _dump_natural_key(value: Any) -> Any:
+    # Handle natural FKs, i.e. tuples assigned to `ForeignKey` fields.
+    return str(value) if value and isinstance(value, tuple) else value
+
+
+def _dump_isoformat(value: Any) -> Any:
+    return value.isoformat() if value else value
+
+
+def _dump_json(value: Any, *, encoder: type[json.JSONEncoder] | None) -> Any:
+    return json.dumps(value, cls=encoder) if value else value
+
+
+def _get_dump_converter(field: Any) -> Callable[[Any], Any] | None:
+    if isinstance(field, models.ForeignKey):
+        return _dump_natural_key
+
+    # Serialize the values of many-to-many fields as stringified Python objects
+    # (regardless of whether they are serialized using natural keys or not).
+    if isinstance(field, models.ManyToManyField):
+        return str
+
+    # Serialize `date`, `datetime`, and `time` objects as ISO 8601 strings.
+    if isinstance(field, (models.DateField, models.DateTimeField, models.TimeField)):
+        return _dump_isoformat
+
+    # Serialize `JSONField` values as plain strings.
+    if isinstance(field, models.JSONField):
+        return partial(_dump_json, encoder=field.encoder)
+
+    return None
+
+
+def _get_dump_plan(opts: Options[Any], field_names: Iterable[str]) -> _DumpPlan:
+    # Pair the names of the fields requiring conversion with the converters; the
+    # values of the remaining fields are serialized as they are.
+    return tuple(
+        (name, converter)
+        for name in field_names
+        if (converter := _get_dump_converter(opts.get_field(name))) is not None
+    )
+
+
+def _iter_chunks(objects: Iterable[_T], chunk_size: int) -> Iterator[list[_T]]:
+    iterator = iter(objects)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _get_concrete_model(model: type[Model]) -> type[Model]:
+    # Only the abstract models (which aren't serialized) have no concrete models.
+    return model._meta.concrete_model or model
+
+
+def _is_serialized(field: Field[Any, Any]) -> bool:
+    # Whether the field is serialized by the base serializer (the `serialize`
+    # attribute isn't declared by django-stubs).
+    return bool(getattr(field, "serialize", True))
+
+
+def _has_auto_created_through(field: ManyToManyField[Any, Any]) -> bool:
+    # Whether the many-to-many relation uses an auto-created intermediate model (the
+    # model is set once the models are prepared).
+    through = field.remote_field.through
+
+    return through is not None and bool(through._meta.auto_created)
+
+
+def _iter_queryset_chunks(
+    queryset: QuerySet[Model],
+    chunk_size: int,
+) -> Iterator[list[Model]]:
+    # Querysets that are ordered (either explicitly or by their models' default
+    # ordering), sliced, or combined (e.g., by `union()`, which can't be filtered) are
+    # read in chunks using the database cursor (server-side, if supported by the
+    # database backend), so their order is kept.
+    if queryset.ordered or queryset.query.combinator or not queryset.query.can_filter():
+        yield from _iter_chunks(queryset.iterator(chunk_size=chunk_size), chunk_size)
+        return
+
+    # Otherwise, use keyset pagination on the primary key, so each chunk is fetched
+    # by a separate, index-backed query (regardless of the table size) and the objects
+    # are serialized in a deterministic order.
+    queryset = queryset.order_by("pk")
+    chunk = list(queryset[:chunk_size])
+    while chunk:
+        yield chunk
+        if len(chunk) < chunk_size:
+            break
+        chunk = list(queryset.filter(pk__gt=chunk[-1].pk)[:chunk_size])
+
+
+def _get_model_sheet_names(
+    model_sheet_names_option: dict[Any, str],
+) -> dict[type[Model], str]:
+    # Validate and reformat the `model_sheet_names` option value.
+    # Reformatting replaces model identifiers with model classes.
+    for model_identifier, sheet_name in model_sheet_names_option.copy().items():
+        # Validate the model identifier.
+        try:
+            model = _get_model(model_identifier)
+        except LookupError as e:
+            msg = f"invalid 'model_sheet_names' option: {e}"
+
+            raise SerializationError(msg) from e
+
+        # Validate the sheet name.
+        invalid_sheet_name_reasons: list[str] = []
+        if (sheet_name_length := len(sheet_name)) > SHEET_NAME_MAX_LENGTH:
+            invalid_sheet_name_reasons.append(
+                f"it is too long, {sheet_name_length} > {SHEET_NAME_MAX_LENGTH}",
+            )
+        if invalid_sheet_name_characters := [
+            char for char in sheet_name if char in SHEET_NAME_INVALID_CHARACTERS
+        ]:
+            invalid_sheet_name_reasons.append(
+                f"it contains invalid characters: "
+                f"{', '.join(map(repr, invalid_sheet_name_characters))}",
+            )
+        if list(model_sheet_names_option.values()).count(sheet_name) > 1:
+            invalid_sheet_name_reasons.append("it is not unique")
+
+        if invalid_sheet_name_reasons:
+            msg = (
+                f"{sheet_name!r} is not a valid Excel sheet name "
+                f"({'; '.join(invalid_sheet_name_reasons)})"
+            )
+            raise SerializationError(msg)
+
+        model_sheet_names_option[model] = sheet_name
+
+    model_sheet_names = _ModelIndex.get().labels.copy()
+    model_sheet_names.update(model_sheet_names_option)
+
+    return model_sheet_names
+
+
+def _resolve_sheet_name(
+    opts: Options[Any],
+    sheet_name: str,
+    sheet_names: Container[str],
+) -> str:
+    if (model_sheet_name_length := len(sheet_name)) > SHEET_NAME_MAX_LENGTH:
+        # This block can only be reached in the case of sheet names NOT passed to
+        # the `model_sheet_names` option (as those were validated by the
+        # `_get_model_sheet_names()` function). The sheet name being checked here is
+        # a fully qualified model label, and the only issue that might arise is if it
+        # is too long.
+
+        # Very long model labels are replaced by model names and then truncated to
+        # the leading `SHEET_NAME_MAX_LENGTH` characters.
+        sheet_name = sheet_name.split(".")[1][:SHEET_NAME_MAX_LENGTH]
+
+        # An extra check for duplicate sheet names.
+        if sheet_name in sheet_names:
+            msg = (
+                f"the truncated sheet name {sheet_name!r} for serializing the "
+                f"{opts.label!r} isn't unique; use the 'model_sheet_names' "
+                f"option to manually resolve too long or conflicting names"
+            )
+            raise SerializationError(msg)
+
+        msg = (
+            f"{opts.label!r} objects are serialized into {sheet_name!r} sheet "
+            f"(fully qualified label is too long, {model_sheet_name_length} > "
+            f"{SHEET_NAME_MAX_LENGTH})"
+        )
+        warnings.warn(msg, RuntimeWarning, stacklevel=1)
+
+    return sheet_name
+
+
+def _get_continuation_sheet_name(sheet_name: str, index: int) -> str:
+    # Continuation sheets are named after the model's first sheet, followed by their
+    # index in parentheses, e.g., "app.Model (2)". The first sheet's name is truncated
+    # if necessary, so the continuation sheet's name is not too long.
+    suffix = f" ({index})"
+
+    return f"{sheet_name[: SHEET_NAME_MAX_LENGTH - len(suffix)]}{suffix}"
+
+
 class Serializer(python.Serializer):
     # Make the serializer discoverable with the `dumpdata` command.
     internal_use_only = False
@@ -76,56 +343,155 @@ class Serializer(python.Serializer):
     # (the base serializer class uses `io.StringIO` by default).
     stream_class = type(None)
 
-    def get_model_sheet_names(self) -> dict[type[Model], str]:
-        model_sheet_names_option = self.options.get("model_sheet_names", {})
+    # The fields of the object being serialized, set by the base serializer.
+    _current: dict[str, Any]
 
-        # Validate and reformat the `model_sheet_names` option value.
-        # Reformatting replaces model identifiers with model classes.
-        for model_identifier, sheet_name in model_sheet_names_option.copy().items():
-            # Validate the model identifier.
-            try:
-                model = _get_model(model_identifier)
-            except LookupError as e:
-                msg = f"invalid 'model_sheet_names' option: {e}"
+    @override
+    def serialize(self, queryset: Iterable[Model], **options: Any) -> Any:
+        # If the `chunk_size` option is set, the objects are passed through the
+        # serializer in chunks of a fixed size. Querysets are then read chunk by chunk
+        # as well, so they don't cache all the model instances at once.
+        if chunk_size := _get_option(options, "chunk_size"):
+            chunks = (
+                _iter_queryset_chunks(queryset, chunk_size)
+                if isinstance(queryset, models.QuerySet)
+                else _iter_chunks(queryset, chunk_size)
+            )
+        else:
+            chunks = _iter_chunks(queryset, PREFETCH_CHUNK_SIZE)
+
+        # The relations of each chunk's objects are prefetched in bulk.
+        return super().serialize(
+            chain.from_iterable(map(self._prefetch_relations, chunks)),
+            **options,
+        )
+
+    def _get_m2m_prefetches(
+        self,
+        model: type[Model],
+    ) -> list[models.Prefetch[Any, Any, Any]]:
+        # Prefetch the many-to-many relations handled by the base serializer's
+        # `handle_m2m_field` method (which then reads them from the prefetch cache),
+        # using the same querysets.
+        prefetches: list[models.Prefetch[Any, Any, Any]] = []
+        for field in _get_concrete_model(model)._meta.local_many_to_many:
+            if not _is_serialized(field) or not _has_auto_created_through(field):
+                continue
+            if (
+                self.selected_fields is not None
+                and field.attname not in self.selected_fields
+            ):
+                continue
 
-                raise SerializationError(msg) from e
+            related_model = field.remote_field.model
+            queryset = related_model._default_manager.all()
+            if not (
+                self.use_natural_foreign_keys and hasattr(related_model, "natural_key")
+            ):
+                queryset = queryset.select_related(None).only("pk")
+            queryset = queryset.order_by(
+                *(queryset.query.order_by or related_model._meta.ordering or ()),
+                "pk",
+            )
 
-            # Validate the sheet name.
-            invalid_sheet_name_reasons: list[str] = []
-            if (sheet_name_length := len(sheet_name)) > SHEET_NAME_MAX_LENGTH:
-                invalid_sheet_name_reasons.append(
-                    f"it is too long, {sheet_name_length} > {SHEET_NAME_MAX_LENGTH}",
-                )
-            if invalid_sheet_name_characters := [
-                char for char in sheet_name if char in SHEET_NAME_INVALID_CHARACTERS
-            ]:
-                invalid_sheet_name_reasons.append(
-                    f"it contains invalid characters: "
-                    f"{', '.join(map(repr, invalid_sheet_name_characters))}",
+            prefetches.append(models.Prefetch(field.name, queryset=queryset))
+
+        return prefetches
+
+    def _get_natural_foreign_keys(self, model: type[Model]) -> list[Any]:
+        # Get the foreign keys serialized by the natural keys of the related objects
+        # (see the base serializer's `handle_fk_field` method).
+        if not self.use_natural_foreign_keys:
+            return []
+
+        return [
+            field
+            for field in _get_concrete_model(model)._meta.local_fields
+            if _is_serialized(field)
+            and field.remote_field
+            and hasattr(field.remote_field.model, "natural_key")
+            and (
+                self.selected_fields is None
+                or field.attname[:-3] in self.selected_fields
+            )
+        ]
+
+    def _prefetch_relations(self, objects: list[Model]) -> list[Model]:
+        # The objects may be of different models (e.g., when dumping the whole
+        # database), so the relations are prefetched model by model.
+        model_objects: defaultdict[type[Model], list[Model]] = defaultdict(list)
+        for obj in objects:
+            model_objects[type(obj)].append(obj)
+
+        for model, objs in model_objects.items():
+            if (prefetches := self._m2m_prefetches.get(model)) is None:
+                prefetches = self._m2m_prefetches[model] = self._get_m2m_prefetches(
+                    model,
                 )
-            if list(model_sheet_names_option.values()).count(sheet_name) > 1:
-                invalid_sheet_name_reasons.append("it is not unique")
-
-            if invalid_sheet_name_reasons:
-                msg = (
-                    f"{sheet_name!r} is not a valid Excel sheet name "
-                    f"({'; '.join(invalid_sheet_name_reasons)})"
+            if prefetches:
+                models.prefetch_related_objects(objs, *prefetches)
+
+            # Fetch the objects related by natural foreign keys in bulk, skipping
+            # the ones whose natural keys are already cached.
+            if (foreign_keys := self._natural_foreign_keys.get(model)) is None:
+                foreign_keys = self._natural_foreign_keys[model] = (
+                    self._get_natural_foreign_keys(model)
                 )
-                raise SerializationError(msg)
+            for field in foreign_keys:
+                if objs_to_fetch := [
+                    obj
+                    for obj in objs
+                    if (value := getattr(obj, field.attname)) is not None
+                    and (field.target_field, value) not in self._natural_keys
+                ]:
+                    models.prefetch_related_objects(objs_to_fetch, field.name)
 
-            model_sheet_names_option[model] = sheet_name
+        return objects
 
-        model_sheet_names = {model: model._meta.label for model in apps.get_models()}
-        model_sheet_names.update(model_sheet_names_option)
+    @override
+    def handle_fk_field(self, obj: Model, field: Any) -> None:
+        if not (
+            self.use_natural_foreign_keys
+            and hasattr(field.remote_field.model, "natural_key")
+            and (value := getattr(obj, field.attname)) is not None
+        ):
+            super().handle_fk_field(obj, field)
+            return
+
+        # The natural keys of the related objects are cached (already stringified)
+        # by the foreign key values, so the objects repeating across the rows are
+        # neither fetched nor serialized again.
+        cache_key = (field.target_field, value)
+        if (natural_key := self._natural_keys.get(cache_key)) is None:
+            super().handle_fk_field(obj, field)
+            natural_key = _dump_natural_key(self._current[field.name])
+
+            if len(self._natural_keys) >= NATURAL_KEY_CACHE_SIZE:
+                del self._natural_keys[next(iter(self._natural_keys))]
+            self._natural_keys[cache_key] = natural_key
+
+        self._current[field.name] = natural_key
 
-        return model_sheet_names
+    def get_model_sheet_names(self) -> dict[type[Model], str]:
+        return _get_model_sheet_names(self.options.get("model_sheet_names", {}))
 
     @override
     def start_serialization(self) -> None:
         super().start_serialization()
 
-        # Instantiate the output workbook.
-        self._workbook = openpyxl.Workbook()
+        # Instantiate the output workbook's writer. The `writer` option selects the
+        # engine writing the workbook (see `writers.WRITERS`); openpyxl is used by
+        # default. In the write-only mode, the rows are flushed to the sheets' XML
+        # files as soon as they are appended, so the memory usage does not depend on
+        # the number of objects serialized. The `compression` option selects how the
+        # workbook's zip container is compressed (see `container.COMPRESSIONS`),
+        # regardless of the engine.
+        self._writer: Writer = get_writer(
+            _get_option(self.options, "writer") or DEFAULT_WRITER,
+        )(
+            write_only=bool(_get_option(self.options, "write_only", default=False)),
+            compression=_get_option(self.options, "compression") or DEFAULT_COMPRESSION,
+        )
 
         # Models will be mapped into sheet names. The `model_sheet_names` option can be
         # passed to the `serialize()` method to specify custom model sheet names. The
@@ -133,142 +499,153 @@ class Serializer(python.Serializer):
         # fully qualified labels or names) to the desired sheet names.
         self._model_sheet_names = self.get_model_sheet_names()
 
-        # Keep track of the sheet names added by the serializer.
-        self._sheet_names_added: list[str] = []
-
-    @override
-    def end_object(self, obj: Any) -> None:
-        super().end_object(obj)
-
-        # Use the last Python object returned by the base serializer.
-        obj = self.objects[-1]
-
-        # Get the object's model to determine the default name for the sheet where the
-        # object is going to be serialized.
-        opts = obj["model"]._meta
-
+        # Keep track of the sheets added by the serializer and the number of rows in
+        # the models' current sheets.
+        self._model_sheets: dict[type[Model], list[Any]] = {}
+        self._model_sheet_rows: dict[type[Model], int] = {}
+
+        # Cache the field conversion plans of the serialized models.
+        self._dump_plans: dict[type[Model], _DumpPlan] = {}
+
+        # Cache the many-to-many relations to prefetch for the serialized models.
+        self._m2m_prefetches: dict[
+            type[Model],
+            list[models.Prefetch[Any, Any, Any]],
+        ] = {}
+
+        # Cache the foreign keys serialized using natural keys and the natural keys
+        # themselves (stringified, as they are written to the sheets).
+        self._natural_foreign_keys: dict[type[Model], list[Any]] = {}
+        self._natural_keys: dict[tuple[Any, Any], Any] = {}
+
+    def _create_model_sheet(
+        self,
+        opts: Options[Any],
+        columns: Iterable[str],
+        index: int = 1,
+    ) -> Any:
         # Get sheet name corresponding to the model; by default, it's the model's label.
         sheet_name = self._model_sheet_names[opts.model]
 
-        # Create/get & update the output sheet.
-        if sheet_name not in self._workbook:
-            if (model_sheet_name_length := len(sheet_name)) > SHEET_NAME_MAX_LENGTH:
-                # This block can only be reached in the case of sheet names NOT passed
-                # to the `model_sheet_names` option (as those were validated within the
-                # `start_serialization()` method). The sheet name being checked here is
-                # a fully qualified model label, and the only issue that might arise is
-                # if it is too long.
-
-                # Very long model labels are replaced by model names and then truncated
-                # to the leading `SHEET_NAME_MAX_LENGTH` characters.
-                sheet_name = sheet_name.split(".")[1][:SHEET_NAME_MAX_LENGTH]
-
-                # An extra check for duplicate sheet names.
-                if sheet_name in self._workbook:
-                    msg = (
-                        f"the truncated sheet name {sheet_name!r} for serializing the "
-                        f"{opts.label!r} isn't unique; use the 'model_sheet_names' "
-                        f"option to manually resolve too long or conflicting names"
-                    )
-                    raise SerializationError(msg)
-
+        if index == 1:
+            sheet_name = _resolve_sheet_name(
+                opts,
+                sheet_name,
+                self._writer.sheetnames,
+            )
+        else:
+            sheet_name = _get_continuation_sheet_name(sheet_name, index)
+            if sheet_name in self._writer.sheetnames:
                 msg = (
-                    f"{opts.label!r} objects are serialized into {sheet_name!r} sheet "
-                    f"(fully qualified label is too long, {model_sheet_name_length} > "
-                    f"{SHEET_NAME_MAX_LENGTH})"
+                    f"the continuation sheet name {sheet_name!r} for serializing the "
+                    f"{opts.label!r} isn't unique; use the 'model_sheet_names' "
+                    f"option to manually resolve conflicting names"
                 )
-                warnings.warn(msg, RuntimeWarning, stacklevel=1)
+                raise SerializationError(msg)
 
-            # Create the sheet and initialize it with the column headers.
-            model_sheet = self._workbook.create_sheet(sheet_name)
-            model_sheet.append(list(obj["fields"].keys()))
+        # Create the sheet and initialize it with the column headers.
+        model_sheet = self._writer.open_sheet(sheet_name)
+        self._writer.write_header(model_sheet, columns)
 
-            # Update the `model_sheet_names` dict.
+        # Update the `model_sheet_names` dict.
+        if index == 1:
             self._model_sheet_names[opts.model] = sheet_name
 
-            # Update the list of the sheet names added.
-            self._sheet_names_added.append(sheet_name)
-        else:
-            model_sheet = self._workbook[sheet_name]
+        return model_sheet
+
+    @override
+    def end_object(self, obj: Any) -> None:
+        # Unlike the base serializer, don't accumulate the Python objects. Instead, each
+        # object is converted into a row, written to the output sheet right away, and
+        # then dropped, so the memory usage doesn't depend on the number of objects.
+        data = self.get_dump_object(obj)
+
+        # Create/get & update the output sheet. The sheets are cached by model, so the
+        # workbook is looked up only when a model's first object is serialized. When
+        # the sheet is full, the model's objects are serialized into the next
+        # (continuation) sheet, initialized with the same column headers.
+        model = data["model"]
+        if (model_sheets := self._model_sheets.get(model)) is None:
+            model_sheets = self._model_sheets[model] = []
+        if not model_sheets or self._model_sheet_rows[model] == SHEET_MAX_ROWS:
+            model_sheets.append(
+                self._create_model_sheet(
+                    model._meta,
+                    data["fields"].keys(),
+                    len(model_sheets) + 1,
+                ),
+            )
+            self._model_sheet_rows[model] = 1
 
         # Serialize the object as another row.
-        model_sheet.append(list(obj["fields"].values()))
+        self._writer.write_row(model_sheets[-1], tuple(data["fields"].values()))
+        self._model_sheet_rows[model] += 1
 
     @override
     def end_serialization(self) -> None:
         super().end_serialization()
 
-        # Remove sheets not added by the deserializer.
-        for sheet_name in self._workbook.sheetnames.copy():
-            if sheet_name not in self._sheet_names_added:
-                del self._workbook[sheet_name]
-
-        # Use the serializer's stream to determine the path for serialization output.
-        # Based on the output stream type attempt to distinguish between a file path
-        # (when called via the `serialize()` function from `django.core.serializers`)
-        # and a stream object (when called via the `dumpdata` management command).
-
-        stream = self.stream
-        if isinstance(stream := self.stream, io.TextIOBase):
-            output = None if (output := stream.name) == sys.stdout.name else output
-            if output is None:
-                msg = "printing workbooks to the standard output isn't supported"
+        # Use the serializer's stream to determine the serialization output. Based on
+        # the output stream type attempt to distinguish between a file path or a binary
+        # file object (when called via the `serialize()` function from
+        # `django.core.serializers`) and a text stream (when called via the `dumpdata`
+        # management command).
+        # The base serializer types its stream as a text one, but the stream is passed
+        # as is, e.g., as a file path or a binary file object.
+        stream: Any = self.stream
+        output: str | Path | IO[bytes] | None
+        if isinstance(stream, io.TextIOBase):
+            if isinstance(name := getattr(stream, "name", None), str) and (
+                name != sys.stdout.name
+            ):
+                # The stream is a file opened by `dumpdata` (with the `--output`
+                # option), so the workbook is saved under the file's name.
+                output = name
+            elif (buffer := getattr(stream, "buffer", None)) is not None:
+                # Otherwise (e.g., in the case of the standard output), the workbook is
+                # written directly to the binary buffer underlying the text stream.
+                stream.flush()
+                output = buffer
+            else:
+                output = None
+                msg = "writing workbooks to text streams isn't supported"
                 warnings.warn(msg, RuntimeWarning, stacklevel=1)
-        else:
-            if stream is not None and not isinstance(stream, (str, Path)):
-                msg = "the stream must be a file path 'str' or 'pathlib.Path' object"
-                raise SerializationError(msg)
+        elif stream is None or isinstance(stream, (str, Path)):
             output = stream
+        elif callable(getattr(stream, "write", None)):
+            # Binary file objects (including non-seekable ones, like pipes or sockets)
+            # are written incrementally, as the workbook parts are being produced.
+            output = stream
+        else:
+            msg = (
+                "the stream must be a file path ('str' or 'pathlib.Path' object) or "
+                "a writable binary file object"
+            )
+            raise SerializationError(msg)
 
-        if output:
-            if self.objects:
-                self._workbook.save(output)
-            else:
-                msg = "the output workbook is empty, so it won't be saved"
-                warnings.warn(msg, RuntimeWarning, stacklevel=1)
+        if output and not self._model_sheets:
+            output = None
+            msg = "the output workbook is empty, so it won't be saved"
+            warnings.warn(msg, RuntimeWarning, stacklevel=1)
+
+        self._writer.close(output)
+        if output and not isinstance(output, (str, Path)):
+            output.flush()
 
     @override
     def get_dump_object(self, obj: Model) -> dict[str, Any]:
         data = super().get_dump_object(obj)
 
-        model = apps.get_model(data["model"])
-        opts = model._meta
+        opts = obj._meta
 
-        # Update the object's field values prior to the final serialization.
+        # Update the object's field values prior to the final serialization. The
+        # conversion plan is compiled once per model, so no type dispatch is performed
+        # for the individual objects.
         fields = data["fields"]
-        for name, value in fields.items():
-            field = opts.get_field(name)
-
-            # Handle natural FKs, i.e. tuples assigned to `ForeignKey` fields.
-            if (
-                isinstance(field, models.ForeignKey)
-                and value
-                and isinstance(value, tuple)
-            ):
-                fields[name] = str(value)
-
-            # Serialize the values of many-to-many fields as stringified Python objects
-            # (regardless of whether they are serialized using natural keys or not).
-            if isinstance(field, models.ManyToManyField):
-                fields[name] = str(value)
-
-            # Serialize `date`, `datetime`, and `time` objects as ISO 8601 strings.
-            if (
-                isinstance(
-                    field,
-                    (
-                        models.DateField,
-                        models.DateTimeField,
-                        models.TimeField,
-                    ),
-                )
-                and value
-            ):
-                fields[name] = value.isoformat()
-
-            # Serialize `JSONField` values as plain strings.
-            if isinstance(field, models.JSONField) and value:
-                fields[name] = json.dumps(value, cls=field.encoder)
+        if (dump_plan := self._dump_plans.get(opts.model)) is None:
+            dump_plan = self._dump_plans[opts.model] = _get_dump_plan(opts, fields)
+        for name, convert in dump_plan:
+            fields[name] = convert(fields[name])
 
         # Update the `model` value.
         data["model"] = opts.model
@@ -287,97 +664,562 @@ class Serializer(python.Serializer):
 
     @override
     def getvalue(self) -> Any:
-        return self._workbook
+        return self._writer.getvalue()
+
+
+def _get_model_sheets(workbook: Any) -> dict[type[Model], list[Any]]:
+    model_sheets: dict[type[Model], list[Any]] = {}
+
+    # The names of the models' next continuation sheets, e.g., "app.Model (2)" for
+    # the model of the "app.Model" sheet (see `Serializer.end_object`). The sheets are
+    # continued in the order of the serialized objects, so they can be interleaved
+    # with the other models' sheets.
+    continuation_sheet_models: dict[str, type[Model]] = {}
+
+    for sheet in workbook:
+        # A model is identified based on the sheet name, which is supposed to be
+        # either its fully qualified label or name (the latter applies only if the
+        # model name is unique).
+        try:
+            model = _get_model(sheet.title)
+        except LookupError:
+            # Otherwise, the sheet may continue one of the previous models' sheets.
+            if sheet.title not in continuation_sheet_models:
+                continue
+            model = continuation_sheet_models.pop(sheet.title)
+            model_sheets[model].append(sheet)
+        else:
+            model_sheets[model] = [sheet]
+
+        continuation_sheet_models[
+            _get_continuation_sheet_name(
+                model_sheets[model][0].title,
+                len(model_sheets[model]) + 1,
+            )
+        ] = model
+
+    return model_sheets
+
+
+def _get_model_dependencies(model: type[Model]) -> set[type[Model]]:
+    # The models referred to by the model's foreign keys (including one-to-one fields
+    # and parent links) and many-to-many fields with auto-created intermediate models.
+    opts = model._meta
+
+    return {
+        field.remote_field.model for field in opts.local_fields if field.remote_field
+    } | {
+        field.remote_field.model
+        for field in opts.local_many_to_many
+        if _has_auto_created_through(field)
+    }
+
+
+def _sort_models(models: Iterable[type[Model]]) -> list[type[Model]]:
+    # Sort the models, so each one follows the models it depends on; otherwise, the
+    # models are kept in their original (i.e., workbook) order. Self-references are
+    # ignored, as they concern the order of the objects within the model's sheet.
+    models = list(models)
+    dependencies = {
+        model: (_get_model_dependencies(model) - {model}).intersection(models)
+        for model in models
+    }
+
+    sorted_models: list[type[Model]] = []
+    remaining_models = list(dependencies)
+    while remaining_models:
+        if (
+            model := next(
+                (
+                    model
+                    for model in remaining_models
+                    if dependencies[model].issubset(sorted_models)
+                ),
+                None,
+            )
+        ) is None:
+            # The remaining models depend on each other, so the cycle of their
+            # dependencies is broken by taking its first model (in the original order)
+            # next; loading its objects relies on the deferred fields. The models
+            # depending on the cycle are still sorted after it.
+            cycle = remaining_models
+            try:
+                TopologicalSorter(
+                    {model: dependencies[model] for model in remaining_models},
+                ).prepare()
+            except CycleError as e:
+                cycle = e.args[1]
+                labels = " -> ".join(model._meta.label for model in reversed(cycle))
+                msg = (
+                    f"the models can't be sorted by their dependencies due to a cycle "
+                    f"({labels}); the objects referring to the objects that follow "
+                    f"them are saved with their references deferred"
+                )
+                warnings.warn(msg, RuntimeWarning, stacklevel=1)
+            model = min(cycle, key=models.index)
+
+        sorted_models.append(model)
+        remaining_models.remove(model)
+
+    return sorted_models
+
+
+def _load_value(
+    value: Any,
+    *,
+    empty: Any,
+    convert: Callable[[Any], Any] | None,
+) -> Any:
+    # Handle valid data types representing an empty cell. If the field is neither
+    # nullable nor blank, the value is kept as it is, which may lead to integrity
+    # errors (tested).
+    if value in ("", None):
+        return value if empty is _KEEP_EMPTY else empty
+
+    return value if convert is None else convert(value)
+
+
+def _load_relation(value: Any) -> Any:
+    # Handle natural foreign keys and many-to-many relations.
+    return parse_relation(value) if isinstance(value, str) else value
+
+
+def _load_json(value: Any, *, decoder: type[json.JSONDecoder] | None) -> Any:
+    return json.loads(value, cls=decoder)
+
+
+def _get_load_converter(field: Any) -> Callable[[Any], Any] | None:
+    if isinstance(
+        field,
+        (
+            models.ForeignKey,
+            models.ManyToManyField,
+            models.OneToOneField,
+        ),
+    ):
+        return _load_relation
+
+    # Handle JSON values.
+    if isinstance(field, models.JSONField):
+        return partial(_load_json, decoder=field.decoder)
+
+    return None
+
+
+def _get_load_plan(opts: Options[Any], sheet_columns: Iterable[Any]) -> _LoadPlan:
+    # Map the indices of the columns representing the model's fields into the field
+    # names and the value converters (aware of the fields' empty values). The remaining
+    # columns (e.g., the empty left ones) are skipped when the rows are read. If a
+    # column is repeated, the last one is used.
+    fields = {
+        field.name: field for field in [*opts.local_fields, *opts.local_many_to_many]
+    }
+    column_indices = {
+        sheet_column: index
+        for index, sheet_column in enumerate(sheet_columns)
+        if sheet_column in fields
+    }
+
+    load_plan = []
+    for name, index in column_indices.items():
+        field = fields[name]
+        load_plan.append(
+            (
+                index,
+                name,
+                partial(
+                    _load_value,
+                    empty=(None if field.null else "" if field.blank else _KEEP_EMPTY),
+                    convert=_get_load_converter(field),
+                ),
+            ),
+        )
+
+    return tuple(load_plan)
+
+
+def _get_workbook_source(
+    stream_or_string: str | Path | bytes | bytearray | memoryview | IO[bytes],
+) -> str | Path | IO[bytes]:
+    if isinstance(stream_or_string, (str, Path)):
+        return stream_or_string
+
+    # In-memory buffers (e.g., uploaded files' contents) are read without any temporary
+    # files.
+    if isinstance(stream_or_string, (bytes, bytearray, memoryview)):
+        return io.BytesIO(stream_or_string)
+
+    if callable(getattr(stream_or_string, "read", None)):
+        # Text streams are read from their underlying binary buffers.
+        if isinstance(stream_or_string, io.TextIOBase):
+            if (buffer := getattr(stream_or_string, "buffer", None)) is None:
+                msg = "reading workbooks from text streams isn't supported"
+                raise DeserializationError(msg)
+            stream_or_string = buffer
+
+        # The workbook's zip container must be seekable, so non-seekable streams
+        # (e.g., pipes or sockets) are read into memory first.
+        if not (
+            callable(seekable := getattr(stream_or_string, "seekable", None))
+            and seekable()
+        ):
+            return io.BytesIO(stream_or_string.read())
+
+        return stream_or_string
+
+    msg = (
+        "the stream must be a file path ('str' or 'pathlib.Path' object), a bytes-like "
+        "object, a readable binary file object, or an 'openpyxl.Workbook' object"
+    )
+    raise DeserializationError(msg)
+
+
+def _find_header(
+    sheet_rows: Iterator[tuple[Any, ...]],
+) -> tuple[int, tuple[Any, ...]] | None:
+    # The header is the sheet's first non-empty row (the sheets aren't modified to
+    # skip the empty rows, as read-only sheets don't support it). Returns the row's
+    # number along with its values, or `None` if the sheet is empty.
+    return next(
+        (
+            (row_number, row)
+            for row_number, row in enumerate(sheet_rows, start=1)
+            if any(value is not None for value in row)
+        ),
+        None,
+    )
+
+
+def _decode_rows(
+    model: type[Model],
+    sheet_columns: tuple[Any, ...],
+    sheet_rows: Iterable[tuple[Any, ...]],
+    load_plans: dict[tuple[type[Model], tuple[Any, ...]], _LoadPlan],
+) -> tuple[tuple[str, ...], Iterator[tuple[Any, ...]]]:
+    # The decoding of the rows is planned once per model and header, so no field
+    # lookups or type dispatch are performed for the individual cells.
+    plan_key = (model, sheet_columns)
+    if (load_plan := load_plans.get(plan_key)) is None:
+        load_plan = load_plans[plan_key] = _get_load_plan(model._meta, sheet_columns)
+
+    # The rows of read-only sheets may be shorter than the header, so they are padded
+    # with empty cells.
+    width = len(sheet_columns)
+    return (
+        tuple(name for _, name, _ in load_plan),
+        (
+            tuple(load(row[index]) for index, _, load in load_plan)
+            for row in (
+                sheet_row
+                if len(sheet_row) >= width
+                else (*sheet_row, *(None,) * (width - len(sheet_row)))
+                for sheet_row in sheet_rows
+            )
+        ),
+    )
+
+
+def _read_sheet(
+    model: type[Model],
+    sheet: Any,
+    load_plans: dict[tuple[type[Model], tuple[Any, ...]], _LoadPlan],
+) -> tuple[tuple[str, ...], Iterator[tuple[Any, ...]]] | None:
+    # Read the names of the fields stored in the sheet and the (lazily decoded) rows of
+    # their values. Returns `None` if the sheet is empty.
+    sheet_rows = sheet.iter_rows(values_only=True)
+    if (header := _find_header(sheet_rows)) is None:
+        return None
+
+    return _decode_rows(model, header[1], sheet_rows, load_plans)
+
+
+def _get_row_ranges(
+    header_row: int,
+    max_row: int | None,
+    parts: int,
+) -> list[tuple[int, int | None]]:
+    # Split the rows following the header into (at most) the given number of ranges,
+    # each at least `ROW_RANGE_MIN_SIZE` rows long. The number of rows is taken from
+    # the sheet's dimensions, which may be missing (e.g., in the workbooks written in
+    # the write-only mode) or outdated, so the last range is left open.
+    if max_row is None:
+        return [(header_row + 1, None)]
+
+    if (row_count := max_row - header_row) <= 0:
+        return []
+
+    size = -(-row_count // max(1, min(parts, row_count // ROW_RANGE_MIN_SIZE)))
+    starts = range(header_row + 1, max_row + 1, size)
+
+    return [
+        (start, start + size - 1 if start + size <= max_row else None)
+        for start in starts
+    ]
+
+
+def _setup_worker() -> None:
+    # Worker processes that are spawned (rather than forked) have to set Django up on
+    # their own.
+    if not apps.ready:
+        django.setup()
+
+
+class _ReadTask(NamedTuple):
+    # The workbooks are passed to the worker processes by their paths (see
+    # `Deserializer`). The header is read once, by the parent process, and shared by
+    # all the row ranges of the sheet.
+    source: str | Path
+    reader: str
+    model_label: str
+    sheet_name: str
+    sheet_columns: tuple[Any, ...]
+    min_row: int
+    max_row: int | None
+
+
+def _read_sheet_rows(task: _ReadTask) -> tuple[tuple[str, ...], list[tuple[Any, ...]]]:
+    source, reader, model_label, sheet_name, sheet_columns, min_row, max_row = task
+
+    # Each worker process parses and decodes a range of a sheet's rows from its own
+    # read-only copy of the workbook, and returns the decoded rows as tuples (rather
+    # than the Python deserializer's dictionaries), so they are cheap to send back.
+    workbook = get_reader(reader)(source, read_only=True)
+    try:
+        names, rows = _decode_rows(
+            apps.get_model(model_label),
+            sheet_columns,
+            workbook[sheet_name].iter_rows(
+                min_row=min_row,
+                max_row=max_row,
+                values_only=True,
+            ),
+            {},
+        )
+        return names, list(rows)
+    finally:
+        workbook.close()
 
 
 class Deserializer:
-    def __init__(self, workbook_path: str | Path, **options: Any) -> None:
-        # Load the workbook data.
-        self._workbook = openpyxl.load_workbook(workbook_path)
+    def __init__(
+        self,
+        stream_or_string: str
+        | Path
+        | bytes
+        | bytearray
+        | memoryview
+        | IO[bytes]
+        | openpyxl.Workbook,
+        **options: Any,
+    ) -> None:
+        # Load the workbook data. In the read-only mode, the sheets' rows are parsed
+        # lazily, as they are read, rather than loaded into memory upfront.
+        self._read_only = bool(_get_option(options, "read_only", default=False))
+        options.pop("read_only", None)
+
+        # With the `workers` option, the sheets are parsed by a pool of worker
+        # processes; the workbook itself is then opened just to list its sheets.
+        self._workers = _get_option(options, "workers") or 1
+        options.pop("workers", None)
+        self._source: str | Path | None = None
+        self._temp_dir: tempfile.TemporaryDirectory[str] | None = None
+
+        # The `reader` option selects the engine parsing the workbook (see
+        # `readers.READERS`); openpyxl is used by default.
+        self._reader = _get_option(options, "reader") or DEFAULT_READER
+        options.pop("reader", None)
+        load_workbook = get_reader(self._reader)
+
+        # Workbooks already loaded (e.g., returned by the serializer) are deserialized
+        # as they are, so the data isn't parsed again. Such workbooks are owned by the
+        # caller, so they are never closed by the deserializer.
+        if isinstance(stream_or_string, openpyxl.Workbook):
+            if stream_or_string.write_only:
+                msg = "write-only workbooks can't be deserialized"
+                raise DeserializationError(msg)
+
+            self._workbook = stream_or_string
+            self._read_only = False
+        else:
+            source = _get_workbook_source(stream_or_string)
+            if self._workers > 1:
+                # The workbooks read from memory or file objects are spooled into a
+                # temporary file once, so the worker processes are passed just its
+                # path (rather than a copy of the workbook for each task).
+                if not isinstance(source, (str, Path)):
+                    self._temp_dir = tempfile.TemporaryDirectory()
+                    path = Path(self._temp_dir.name) / "workbook.xlsx"
+                    with path.open("wb") as file:
+                        if isinstance(source, io.BytesIO):
+                            file.write(source.getbuffer())
+                        else:
+                            shutil.copyfileobj(source, file)
+                    source = path
+                self._source = source
+                self._read_only = True
+
+            self._workbook = load_workbook(source, read_only=self._read_only)
+
+            # The workbooks of the other engines always stream their rows, just like
+            # openpyxl's read-only workbooks.
+            if not isinstance(self._workbook, openpyxl.Workbook):
+                self._read_only = True
 
         # Pass the options.
         self._options = options
 
-    def __iter__(self) -> Iterator[DeserializedObject]:  # noqa: C901
+        # Cache the decoding plans of the deserialized sheets.
+        self._load_plans: dict[tuple[type[Model], tuple[Any, ...]], _LoadPlan] = {}
+
+        # Resolve the natural foreign keys in bulk, for the chunks of the rows of the
+        # size given by the `chunk_size` option.
+        self._chunk_size = _get_option(options, "chunk_size") or PREFETCH_CHUNK_SIZE
+        options.pop("chunk_size", None)
+
+        self._natural_key_resolver = NaturalKeyResolver(
+            options.get("using", DEFAULT_DB_ALIAS),
+        )
+        self._natural_key_plans: dict[
+            tuple[type[Model], tuple[Any, ...]],
+            tuple[list[Any], tuple[Any, ...] | None],
+        ] = {}
+
+        # With the `prefetch_natural_primary_keys` option, the primary keys of the
+        # existing objects are looked up by their natural keys in bulk as well.
+        self._prefetch_natural_primary_keys = bool(
+            _get_option(options, "prefetch_natural_primary_keys", default=False),
+        )
+        options.pop("prefetch_natural_primary_keys", None)
+
+    def __iter__(self) -> Iterator[DeserializedObject]:
+        # The Python objects are generated row by row, so each object is deserialized
+        # (and, e.g., saved by the `loaddata` command) as soon as its row is parsed.
+        try:
+            yield from python.Deserializer(
+                self._iter_python_objects(),
+                **self._options,
+            )
+        finally:
+            # Read-only workbooks keep their archives open until they are closed.
+            if self._read_only:
+                self._workbook.close()
+            if self._temp_dir is not None:
+                self._temp_dir.cleanup()
+
+    def _iter_python_objects(self) -> Iterator[dict[str, Any]]:
         # Map models into the workbook's sheets.
-        model_sheets: dict[type[Model], Any] = {}
-        for sheet in self._workbook:
-            # A model is identified based on the sheet name, which is supposed to be
-            # either its fully qualified label or name (the latter applies only if the
-            # model name is unique).
-            with suppress(LookupError):
-                model = _get_model(sheet.title)
-                model_sheets[model] = sheet
-
-        # Convert Excel data into Python objects.
-        python_objects: list[dict[str, Any]] = []
-        for model, sheet in model_sheets.items():
-            opts = model._meta
+        model_sheets = _get_model_sheets(self._workbook)
+
+        # Convert Excel data into Python objects. The models are sorted by their
+        # dependencies, so the objects are generally deserialized after the objects
+        # they refer to, and can be saved in a single pass.
+        sheets = [
+            (model, sheet)
+            for model in _sort_models(model_sheets)
+            for sheet in model_sheets[model]
+        ]
+        if (
+            self._source is not None
+            and len(
+                tasks := self._get_read_tasks(self._source, sheets),
+            )
+            > 1
+        ):
+            results = self._read_in_parallel(tasks)
+        else:
+            results = (
+                (model, _read_sheet(model, sheet, self._load_plans))
+                for model, sheet in sheets
+            )
 
-            # Delete empty rows and columns.
-            if (min_row := sheet.min_row) > 1:
-                sheet.delete_rows(1, min_row - 1)
-            if (min_column := sheet.min_column) > 1:
-                sheet.delete_cols(1, min_column - 1)
-
-            # Delete columns that don't represent any of the model's fields.
-            sheet_columns = [cell.value for cell in sheet[1]]
-            non_field_columns = [
-                sheet_column
-                for sheet_column in sheet_columns
-                if sheet_column
-                not in [
-                    field.name for field in opts.local_fields + opts.local_many_to_many
-                ]
-            ]
-            for non_field_column in non_field_columns:
-                non_field_column_index = sheet_columns.index(non_field_column)
-                sheet.delete_cols(non_field_column_index + 1)
-                sheet_columns.remove(non_field_column)
-
-            # Deserialize the sheet rows into the Python deserializer's format.
-            python_model_objects = [
-                {
-                    "model": opts.label_lower,
-                    "fields": dict(zip(sheet_columns, worksheet_row, strict=True)),
-                }
-                for worksheet_row in sheet.iter_rows(
-                    min_row=sheet.min_row + 1,
-                    values_only=True,
+        for model, result in results:
+            if result is not None:
+                yield from self._iter_model_objects(model, *result)
+
+    def _get_read_tasks(
+        self,
+        source: str | Path,
+        sheets: list[tuple[type[Model], Any]],
+    ) -> list[tuple[type[Model], _ReadTask]]:
+        # Split the sheets into the ranges of rows parsed by the worker processes, so
+        # even a single sheet is parsed in parallel if it's large enough.
+        tasks = []
+        for model, sheet in sheets:
+            if (header := _find_header(sheet.iter_rows(values_only=True))) is None:
+                continue
+
+            header_row, sheet_columns = header
+            tasks += [
+                (
+                    model,
+                    _ReadTask(
+                        source,
+                        self._reader,
+                        model._meta.label,
+                        sheet.title,
+                        sheet_columns,
+                        min_row,
+                        max_row,
+                    ),
+                )
+                for min_row, max_row in _get_row_ranges(
+                    header_row,
+                    sheet.max_row,
+                    self._workers,
                 )
             ]
-            python_objects += python_model_objects
-
-        # Next, format Python objects for deserialization.
-        for python_object in python_objects:
-            model = apps.get_model(python_object["model"])
-
-            fields = python_object["fields"]
-            for name, value in fields.items():
-                field = model._meta.get_field(name)
-
-                # Handle valid data types representing an empty cell.
-                if value in ("", None):
-                    if field.null:
-                        fields[name] = None
-                    elif field.blank:
-                        fields[name] = ""
-                    # Continuing at this point may lead to integrity errors (tested).
-                    continue
-
-                # Handle natural foreign keys and many-to-many relations.
-                if isinstance(
-                    field,
-                    (
-                        models.ForeignKey,
-                        models.ManyToManyField,
-                        models.OneToOneField,
-                    ),
-                ) and isinstance(value, str):
-                    fields[name] = ast.literal_eval(value)
 
-                # Handle JSON values.
-                if isinstance(field, models.JSONField):
-                    fields[name] = json.loads(value, cls=field.decoder)
+        return tasks
+
+    def _read_in_parallel(
+        self,
+        tasks: list[tuple[type[Model], _ReadTask]],
+    ) -> Iterator[tuple[type[Model], Any]]:
+        # The row ranges are parsed concurrently, but they are yielded in the order of
+        # the sheets (i.e., the models' dependencies) and the rows. The worker
+        # processes don't use the database connections, so they are kept open (e.g.,
+        # the `loaddata` command's transaction).
+        with ProcessPoolExecutor(
+            max_workers=min(self._workers, len(tasks)),
+            initializer=_setup_worker,
+        ) as executor:
+            yield from zip(
+                (model for model, _ in tasks),
+                executor.map(_read_sheet_rows, [task for _, task in tasks]),
+                strict=True,
+            )
 
-        return python.Deserializer(python_objects, **self._options)
+    def _iter_model_objects(
+        self,
+        model: type[Model],
+        names: tuple[str, ...],
+        rows: Iterable[tuple[Any, ...]],
+    ) -> Iterator[dict[str, Any]]:
+        # Deserialize the sheet rows into the Python deserializer's format.
+        label = model._meta.label_lower
+        python_objects: Iterator[dict[str, Any]] = (
+            {"model": label, "fields": dict(zip(names, row, strict=True))}
+            for row in rows
+        )
+
+        # The natural keys are resolved in bulk for each chunk of the rows (rather
+        # than one by one by the Python deserializer).
+        resolver = self._natural_key_resolver
+        plan_key = (model, names)
+        if (natural_key_plan := self._natural_key_plans.get(plan_key)) is None:
+            natural_key_plan = self._natural_key_plans[plan_key] = (
+                resolver.get_relation_fields(model, names),
+                resolver.get_primary_key_fields(model, names)
+                if self._prefetch_natural_primary_keys
+                else None,
+            )
+        relation_fields, primary_key_fields = natural_key_plan
+        if not relation_fields and primary_key_fields is None:
+            yield from python_objects
+            return
+
+        for chunk in _iter_chunks(python_objects, self._chunk_size):
+            resolver.resolve(relation_fields, chunk)
+            if primary_key_fields is not None:
+                resolver.resolve_primary_keys(model, primary_key_fields, chunk)
+            yield from chunk
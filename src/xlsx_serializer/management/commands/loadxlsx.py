@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+__all__ = [
+    "Command",
+]
+
+import sys
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from xlsx_serializer.bulk import load
+from xlsx_serializer.readers import READERS
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+class Command(BaseCommand):
+    help = "Installs the given Excel fixture(s) in the database using bulk inserts."
+
+    @override
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "fixture_paths",
+            nargs="+",
+            metavar="fixture",
+            help="Fixture file paths.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Nominates a specific database to load fixtures into. Defaults to the "
+            '"default" database.',
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Number of objects inserted per query.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of processes parsing the fixtures and threads inserting the "
+            "objects. The objects are then committed batch by batch, rather than in a "
+            "single transaction.",
+        )
+        parser.add_argument(
+            "--reader",
+            choices=list(READERS),
+            help="Engine parsing the fixtures. Defaults to openpyxl.",
+        )
+        parser.add_argument(
+            "--ignorenonexistent",
+            "-i",
+            action="store_true",
+            help="Ignores entries in the serialized data for fields that do not "
+            "currently exist on the model.",
+        )
+
+    @override
+    def handle(self, *args: Any, **options: Any) -> None:
+        using = options["database"]
+        load_options = {
+            name: options[name]
+            for name in ("batch_size", "workers", "reader")
+            if options[name] is not None
+        }
+
+        # Load all the fixtures or none of them, unless the objects are inserted
+        # concurrently.
+        with (
+            nullcontext()
+            if load_options.get("workers", 1) > 1
+            else transaction.atomic(using=using)
+        ):
+            object_count = sum(
+                load(
+                    fixture_path,
+                    using=using,
+                    ignorenonexistent=options["ignorenonexistent"],
+                    **load_options,
+                )
+                for fixture_path in options["fixture_paths"]
+            )
+
+        if options["verbosity"] >= 1:
+            self.stdout.write(
+                f"Installed {object_count} object(s) from "
+                f"{len(options['fixture_paths'])} fixture(s)",
+            )
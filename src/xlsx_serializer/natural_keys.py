@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+__all__ = [
+    "NaturalKeyResolver",
+    "get_natural_key_fields",
+]
+
+import operator
+from collections import OrderedDict
+from functools import partial, reduce
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Final
+
+from django.core.exceptions import ValidationError
+from django.db import models
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from django.db.models import Model
+
+# The maximum number of natural keys cached, both by the serializer (for the related
+# objects) and by the resolver (for the natural keys looked up).
+NATURAL_KEY_CACHE_SIZE: Final[int] = 100_000
+
+# The number of natural keys looked up by a single query (databases limit the number
+# of the query parameters and the depth of the expressions).
+NATURAL_KEY_QUERY_SIZE: Final[int] = 250
+
+_MISSING: Final[object] = object()
+
+
+def get_natural_key_fields(model: type[Model]) -> tuple[Any, ...] | None:
+    # Infer the fields making up the model's natural key, i.e., the fields whose values
+    # are returned by the `natural_key()` method, by calling it on an instance with
+    # unique placeholder values. Returns `None` if the natural key can't be inferred
+    # (e.g., if it includes the natural keys of related objects).
+    if not (
+        callable(getattr(model, "natural_key", None))
+        and hasattr(model._default_manager, "get_by_natural_key")
+    ):
+        return None
+
+    fields = [field for field in model._meta.concrete_fields if not field.remote_field]
+    placeholders = {
+        id(placeholder := object()): (field, placeholder) for field in fields
+    }
+
+    try:
+        instance: Any = model()
+        for field, placeholder in placeholders.values():
+            instance.__dict__[field.attname] = placeholder
+        natural_key = instance.natural_key()
+    except Exception:  # noqa: BLE001
+        return None
+
+    natural_key_fields = tuple(
+        placeholders[id(value)][0] if id(value) in placeholders else None
+        for value in natural_key
+    )
+    if (
+        not natural_key_fields
+        or None in natural_key_fields
+        or len(set(natural_key_fields)) != len(natural_key_fields)
+    ):
+        return None
+
+    return natural_key_fields
+
+
+def _normalize(
+    natural_key_fields: Sequence[Any],
+    natural_key: Any,
+) -> tuple[Any, ...] | None:
+    # Convert the natural key's values, so the keys read from a workbook match the
+    # ones read from the database.
+    if not isinstance(natural_key, (tuple, list)) or len(natural_key) != len(
+        natural_key_fields,
+    ):
+        return None
+
+    try:
+        return tuple(
+            field.to_python(value)
+            for field, value in zip(natural_key_fields, natural_key, strict=True)
+        )
+    except ValidationError:
+        return None
+
+
+def _iter_natural_keys(field: Any, obj: dict[str, Any]) -> Iterable[Any]:
+    value = obj["fields"].get(field.name)
+    if field.many_to_many:
+        return value if isinstance(value, list) else ()
+
+    return (value,)
+
+
+def _get_target(field: Any) -> str:
+    # The related object's field referred to by the relation; many-to-many relations
+    # always refer to the primary keys. The primary keys are cached under the same
+    # name regardless of the relation (and for the objects' own natural keys).
+    model = field.remote_field.model
+    if field.many_to_many or field.remote_field.field_name == model._meta.pk.name:
+        return "pk"
+
+    return str(field.remote_field.field_name)
+
+
+def _get_cache_key(
+    model: type[Model],
+    target: str,
+    normalized_key: tuple[Any, ...],
+) -> tuple[Any, ...]:
+    return (model, target, normalized_key)
+
+
+class NaturalKeyResolver:
+    # Resolves natural keys into the values of the related objects' fields (e.g., their
+    # primary keys) in bulk, rather than calling `get_by_natural_key()` for each of
+    # them. The resolved values are kept in an LRU cache. Natural keys that can't be
+    # resolved are left as they are, so they are handled by the Python deserializer.
+
+    def __init__(self, using: str, cache_size: int = NATURAL_KEY_CACHE_SIZE) -> None:
+        self._using = using
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+        self._natural_key_fields: dict[type[Model], tuple[Any, ...] | None] = {}
+
+    def get_natural_key_fields(self, model: type[Model]) -> tuple[Any, ...] | None:
+        if model not in self._natural_key_fields:
+            self._natural_key_fields[model] = get_natural_key_fields(model)
+
+        return self._natural_key_fields[model]
+
+    def get_relation_fields(
+        self,
+        model: type[Model],
+        names: Iterable[str],
+    ) -> list[Any]:
+        # Get the model's relation fields (among the given ones) whose values may be
+        # resolved in bulk.
+        opts = model._meta
+
+        return [
+            field
+            for field in map(opts.get_field, names)
+            if field.remote_field
+            and not field.remote_field.model._meta.pk.remote_field
+            and self.get_natural_key_fields(field.remote_field.model) is not None
+        ]
+
+    def get_primary_key_fields(
+        self,
+        model: type[Model],
+        names: Iterable[str],
+    ) -> tuple[Any, ...] | None:
+        # Get the fields making up the model's natural key, if the primary keys of its
+        # objects may be looked up in bulk from the given fields.
+        if (natural_key_fields := self.get_natural_key_fields(model)) is None or any(
+            natural_key_field.name not in names
+            for natural_key_field in natural_key_fields
+        ):
+            return None
+
+        return natural_key_fields
+
+    def _fetch(
+        self,
+        model: type[Model],
+        target: str,
+        natural_key_fields: Sequence[Any],
+        natural_keys: Iterable[tuple[Any, ...]],
+    ) -> None:
+        names = [natural_key_field.attname for natural_key_field in natural_key_fields]
+        queryset = model._default_manager.db_manager(self._using).all()
+
+        iterator = iter(natural_keys)
+        while batch := list(islice(iterator, NATURAL_KEY_QUERY_SIZE)):
+            if len(names) == 1:
+                condition = models.Q(
+                    **{f"{names[0]}__in": [natural_key[0] for natural_key in batch]},
+                )
+            else:
+                condition = reduce(
+                    operator.or_,
+                    (
+                        models.Q(**dict(zip(names, natural_key, strict=True)))
+                        for natural_key in batch
+                    ),
+                )
+
+            for *values, value in queryset.filter(condition).values_list(
+                *names,
+                target,
+            ):
+                if (
+                    normalized_key := _normalize(natural_key_fields, values)
+                ) is not None:
+                    self._set(_get_cache_key(model, target, normalized_key), value)
+
+    def _get(self, key: tuple[Any, ...]) -> Any:
+        if (value := self._cache.get(key, _MISSING)) is not _MISSING:
+            self._cache.move_to_end(key)
+
+        return value
+
+    def _set(self, key: tuple[Any, ...], value: Any) -> None:
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _fetch_missing(
+        self,
+        model: type[Model],
+        target: str,
+        natural_key_fields: Sequence[Any],
+        natural_keys: Iterable[Any],
+    ) -> None:
+        # Fetch the objects whose natural keys aren't cached yet.
+        self._fetch(
+            model,
+            target,
+            natural_key_fields,
+            {
+                normalized_key
+                for natural_key in natural_keys
+                if (normalized_key := _normalize(natural_key_fields, natural_key))
+                is not None
+                and _get_cache_key(model, target, normalized_key) not in self._cache
+            },
+        )
+
+    def _resolve_natural_key(
+        self,
+        model: type[Model],
+        target: str,
+        natural_key_fields: Sequence[Any],
+        natural_key: Any,
+    ) -> Any:
+        if (normalized_key := _normalize(natural_key_fields, natural_key)) is None or (
+            value := self._get(_get_cache_key(model, target, normalized_key))
+        ) is _MISSING:
+            return natural_key
+
+        return value
+
+    def resolve(self, fields: Iterable[Any], objects: Sequence[dict[str, Any]]) -> None:
+        # Replace the natural keys stored in the objects' relation fields (given in
+        # the Python deserializer's format) with the related objects' field values.
+        for field in fields:
+            model = field.remote_field.model
+            if (natural_key_fields := self.get_natural_key_fields(model)) is None:
+                continue
+
+            target = _get_target(field)
+            self._fetch_missing(
+                model,
+                target,
+                natural_key_fields,
+                (
+                    natural_key
+                    for obj in objects
+                    for natural_key in _iter_natural_keys(field, obj)
+                ),
+            )
+
+            # Replace the natural keys with the resolved values.
+            resolve_natural_key = partial(
+                self._resolve_natural_key,
+                model,
+                target,
+                natural_key_fields,
+            )
+            for obj in objects:
+                if (value := obj["fields"].get(field.name)) is None:
+                    continue
+                obj["fields"][field.name] = (
+                    list(map(resolve_natural_key, value))
+                    if field.many_to_many
+                    else resolve_natural_key(value)
+                )
+
+    def resolve_primary_keys(
+        self,
+        model: type[Model],
+        natural_key_fields: Sequence[Any],
+        objects: Sequence[dict[str, Any]],
+    ) -> None:
+        # Assign the primary keys of the existing objects with the same natural keys
+        # to the objects (given in the Python deserializer's format) without them, so
+        # they aren't looked up one by one while the objects are built. The objects
+        # not found are left as they are.
+        pk_name = model._meta.pk.name
+        objects = [obj for obj in objects if obj["fields"].get(pk_name) is None]
+        natural_keys = [
+            [obj["fields"].get(field.name) for field in natural_key_fields]
+            for obj in objects
+        ]
+
+        self._fetch_missing(model, "pk", natural_key_fields, natural_keys)
+
+        for obj, natural_key in zip(objects, natural_keys, strict=True):
+            if (
+                pk := self._resolve_natural_key(
+                    model,
+                    "pk",
+                    natural_key_fields,
+                    natural_key,
+                )
+            ) is not natural_key:
+                obj["fields"][pk_name] = pk
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+__all__ = [
+    "dump",
+]
+
+import os
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, NamedTuple
+from zipfile import ZipFile
+
+from django.apps import apps
+from django.core.serializers.base import SerializationError
+from django.db import connections
+
+from xlsx_serializer.container import (
+    WorkbookArchive,
+    get_compression,
+    read_sheet_parts,
+)
+from xlsx_serializer.core import (
+    DEFAULT_COMPRESSION,
+    Serializer,
+    _get_model_sheet_names,
+    _get_option,
+    _resolve_sheet_name,
+    _setup_worker,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.db.models import Model, QuerySet
+    from django.db.models.sql import Query
+
+
+class _DumpTask(NamedTuple):
+    # Querysets are passed to the worker processes as their (pickled) queries, as
+    # pickling a queryset would evaluate it.
+    model_label: str
+    query: Query
+    using: str
+    sheet_name: str
+    path: Path
+    options: dict[str, Any]
+
+
+def _dump_model(task: _DumpTask) -> bool:
+    model_label, query, using, sheet_name, path, options = task
+
+    # Rebuild the queryset.
+    queryset = apps.get_model(model_label)._default_manager.using(using).all()
+    queryset.query = query
+
+    # Serialize the model's objects into a separate, single-model workbook. Empty
+    # workbooks aren't saved, which is reported by the parent process. The sheet
+    # parts are recompressed when merged, so the workbook is stored uncompressed.
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore",
+            message="the output workbook is empty",
+            category=RuntimeWarning,
+        )
+        Serializer().serialize(
+            queryset,
+            **{
+                **options,
+                "stream": path,
+                "model_sheet_names": {model_label: sheet_name},
+                "write_only": True,
+                "compression": "stored",
+            },
+        )
+
+    return path.exists()
+
+
+def _merge_workbooks(
+    paths: list[Path],
+    stream: str | Path | IO[bytes],
+    *,
+    compression: str,
+) -> None:
+    archive = WorkbookArchive(stream, compression=compression)
+
+    # The styles are the same for all the workbooks written by the serializer, so they
+    # are taken from the first one.
+    with ZipFile(paths[0]) as part_archive:
+        styles = part_archive.read("xl/styles.xml")
+        theme = (
+            part_archive.read("xl/theme/theme1.xml")
+            if "xl/theme/theme1.xml" in part_archive.namelist()
+            else None
+        )
+
+    for path in paths:
+        with ZipFile(path) as part_archive:
+            # Copy the sheet parts as they are (they store strings inline, so they
+            # don't depend on the other parts of their workbooks).
+            for sheet_name, sheet_path in read_sheet_parts(part_archive):
+                # Sheets exceeding the row limit are continued in the extra sheets,
+                # whose names may collide with the other models' sheets.
+                if sheet_name in archive.sheet_names:
+                    msg = (
+                        f"the sheet name {sheet_name!r} isn't unique; use the "
+                        f"'model_sheet_names' option to manually resolve conflicting "
+                        f"names"
+                    )
+                    raise SerializationError(msg)
+
+                with part_archive.open(sheet_path) as sheet_part:
+                    archive.write_sheet(sheet_name, sheet_part)
+
+    archive.close(styles=styles, theme=theme)
+
+
+def dump(
+    querysets: Iterable[QuerySet[Model] | type[Model]],
+    stream: str | Path | IO[bytes],
+    **options: Any,
+) -> None:
+    # Export each model (given either as a model class or as a queryset) to its own
+    # sheet using a pool of worker processes, and then merge the sheets into a single
+    # workbook. The `workers` option sets the number of the processes; by default,
+    # it's the number of CPUs. The remaining options are passed to the serializer.
+    model_querysets = [
+        queryset._default_manager.all() if isinstance(queryset, type) else queryset
+        for queryset in querysets
+    ]
+    if len({queryset.model for queryset in model_querysets}) != len(model_querysets):
+        msg = "each model can be exported to a single sheet only"
+        raise SerializationError(msg)
+
+    workers = _get_option(options, "workers")
+    options.pop("workers", None)
+
+    compression = _get_option(options, "compression") or DEFAULT_COMPRESSION
+    get_compression(compression)
+
+    # Resolve the sheet names upfront, so they are the same as if the models were
+    # serialized by a single serializer.
+    model_sheet_names = _get_model_sheet_names(options.pop("model_sheet_names", {}))
+    sheet_names: list[str] = []
+    for queryset in model_querysets:
+        sheet_names.append(
+            _resolve_sheet_name(
+                queryset.model._meta,
+                model_sheet_names[queryset.model],
+                sheet_names,
+            ),
+        )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tasks = [
+            _DumpTask(
+                queryset.model._meta.label,
+                queryset.query,
+                queryset.db,
+                sheet_name,
+                Path(temp_dir) / f"{index}.xlsx",
+                options,
+            )
+            for index, (queryset, sheet_name) in enumerate(
+                zip(model_querysets, sheet_names, strict=True),
+            )
+        ]
+
+        if (workers := min(workers or os.cpu_count() or 1, len(tasks))) > 1:
+            # Database connections must not be shared with the worker processes.
+            connections.close_all()
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_setup_worker,
+            ) as executor:
+                results = list(executor.map(_dump_model, tasks))
+        else:
+            results = list(map(_dump_model, tasks))
+
+        paths = [
+            task.path for task, result in zip(tasks, results, strict=True) if result
+        ]
+        if not paths:
+            msg = "the output workbook is empty, so it won't be saved"
+            warnings.warn(msg, RuntimeWarning, stacklevel=2)
+            return
+
+        _merge_workbooks(
+            paths,
+            stream,
+            compression=compression,
+        )
@@ -0,0 +1,794 @@
+from __future__ import annotations
+
+__all__ = [
+    "CalamineWorkbook",
+    "CalamineWorksheet",
+    "XmlWorkbook",
+    "XmlWorksheet",
+    "get_reader",
+]
+
+import datetime as dt
+import posixpath
+import re
+import warnings
+from typing import IO, TYPE_CHECKING, Any, Final
+from zipfile import ZipFile
+
+import openpyxl
+from openpyxl.formula.translate import Translator
+from openpyxl.styles.numbers import (
+    builtin_format_code,
+    is_date_format,
+    is_timedelta_format,
+)
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+from openpyxl.utils.datetime import MAC_EPOCH, WINDOWS_EPOCH, from_excel, from_ISO8601
+from openpyxl.worksheet.formula import ArrayFormula, DataTableFormula
+from openpyxl.xml.functions import fromstring, iterparse
+
+from django.core.serializers.base import DeserializationError
+
+try:
+    import python_calamine
+except ImportError:
+    _HAS_CALAMINE = False
+else:
+    _HAS_CALAMINE = True
+
+from xlsx_serializer.container import (
+    PACKAGE_RELATIONSHIPS_NAMESPACE,
+    RELATIONSHIPS_NAMESPACE,
+    SPREADSHEETML_NAMESPACE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+    from xml.etree.ElementTree import Element
+
+SHEET_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}sheet"
+WORKBOOK_PROPERTIES_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}workbookPr"
+DIMENSION_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}dimension"
+SHEET_DATA_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}sheetData"
+ROW_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}row"
+CELL_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}c"
+VALUE_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}v"
+FORMULA_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}f"
+FORMULA_PATH: Final[str] = f".//{FORMULA_TAG}"
+INLINE_STRING_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}is"
+STRING_ITEM_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}si"
+TEXT_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}t"
+RUN_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}r"
+NUMBER_FORMAT_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}numFmt"
+CELL_FORMATS_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}cellXfs"
+CELL_FORMAT_TAG: Final[str] = f"{{{SPREADSHEETML_NAMESPACE}}}xf"
+RELATIONSHIP_TAG: Final[str] = f"{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+
+RELATIONSHIP_ID_ATTRIBUTE: Final[str] = f"{{{RELATIONSHIPS_NAMESPACE}}}id"
+
+DEFAULT_WORKBOOK_PATH: Final[str] = "xl/workbook.xml"
+
+# The number of (decompressed) bytes of sheet data parsed at a time.
+ROW_BATCH_SIZE: Final[int] = 1 << 20
+
+ROOT_START_PATTERN: Final[re.Pattern[bytes]] = re.compile(
+    rb"<(?P<name>[A-Za-z_][\w.:-]*)",
+)
+
+SHEET_DATA_START_PATTERN: Final[re.Pattern[bytes]] = re.compile(
+    rb"<(?:(?P<prefix>[A-Za-z_][\w.-]*:))?sheetData\b[^>]*?(?P<empty>/?)>",
+)
+
+_MISSING: Final[object] = object()
+
+# openpyxl's parser of the ISO 8601 dates (of the "d" cells), which is untyped.
+_parse_iso8601: Final[Callable[[str], Any]] = from_ISO8601
+
+
+def _get_text(element: Element) -> str:
+    # Get the plain text of a string item (either shared or inline), i.e., its text
+    # and the text of its rich text runs, skipping the phonetic runs.
+    snippets = []
+    for child in element:
+        if child.tag == TEXT_TAG:
+            snippets.append(child.text or "")
+        elif child.tag == RUN_TAG and (text := child.find(TEXT_TAG)) is not None:
+            snippets.append(text.text or "")
+
+    return "".join(snippets)
+
+
+class _ColumnIndices(dict[str, int]):
+    # Maps the columns' letters into their indices, which are cached, as the same
+    # columns repeat across the rows.
+
+    def __missing__(self, column_letters: str) -> int:
+        self[column_letters] = index = column_index_from_string(column_letters)
+        return index
+
+
+_column_indices: Final[_ColumnIndices] = _ColumnIndices()
+
+
+def _get_relationships(archive: ZipFile, part_path: str) -> dict[str, tuple[str, str]]:
+    # Map the relationships' IDs into their types and the paths of their targets.
+    directory, name = posixpath.split(part_path)
+    rels_path = posixpath.join(directory, "_rels", f"{name}.rels")
+    if rels_path not in archive.NameToInfo:
+        return {}
+
+    relationships = {}
+    with archive.open(rels_path) as rels_part:
+        for _, element in iterparse(rels_part):
+            if element.tag == RELATIONSHIP_TAG:
+                target = element.get("Target", "")
+                relationships[element.get("Id", "")] = (
+                    element.get("Type", ""),
+                    target.lstrip("/")
+                    if target.startswith("/")
+                    else posixpath.normpath(posixpath.join(directory, target)),
+                )
+
+    return relationships
+
+
+def _find_relationship(
+    relationships: dict[str, tuple[str, str]],
+    relationship_type: str,
+) -> str | None:
+    return next(
+        (
+            target
+            for type_, target in relationships.values()
+            if type_.endswith(f"/{relationship_type}")
+        ),
+        None,
+    )
+
+
+class XmlWorksheet:
+    # A read-only worksheet whose rows are parsed from the sheet part as they are
+    # iterated, with the same values (and the same empty cells and rows) as in the
+    # rows of openpyxl's read-only worksheets.
+
+    def __init__(
+        self,
+        archive: ZipFile,
+        title: str,
+        path: str,
+        value_parser: _ValueParser,
+    ) -> None:
+        self.title = title
+        self._archive = archive
+        self._path = path
+        self._value_parser = value_parser
+
+        self.min_column = self.min_row = 1
+        self.max_column: int | None = None
+        self.max_row: int | None = None
+
+        # The dimensions precede the sheet data, so only the beginning of the part is
+        # parsed.
+        with archive.open(path) as sheet_part:
+            for _, element in iterparse(sheet_part, events=("start",)):
+                if element.tag == DIMENSION_TAG:
+                    min_column, min_row, max_column, max_row = range_boundaries(
+                        element.get("ref", ""),
+                    )
+                    self.min_column = min_column or 1
+                    self.min_row = min_row or 1
+                    self.max_column = max_column
+                    self.max_row = max_row
+                    break
+                if element.tag == SHEET_DATA_TAG:
+                    break
+
+    def __repr__(self) -> str:
+        return f'<XmlWorksheet "{self.title}">'
+
+    def iter_rows(
+        self,
+        min_row: int | None = None,
+        max_row: int | None = None,
+        *,
+        values_only: bool = True,
+    ) -> Iterator[tuple[Any, ...]]:
+        if not values_only:
+            msg = "the XML reader reads the cells' values only"
+            raise ValueError(msg)
+
+        return self._iter_rows(min_row or 1, max_row or self.max_row)
+
+    def _iter_rows(
+        self,
+        min_row: int,
+        max_row: int | None,
+    ) -> Iterator[tuple[Any, ...]]:
+        # The rows are as wide as the sheet's dimensions, if there are any. Otherwise,
+        # each row ends with its last non-empty cell. The missing rows are filled in
+        # with empty ones.
+        max_column = self.max_column
+        empty_row = () if max_column is None else (None,) * max_column
+
+        counter = min_row
+        row_number = 1
+        for row_number, cells in self._parse_rows(min_row):
+            if max_row is not None and row_number > max_row:
+                break
+
+            while counter < row_number:
+                counter += 1
+                yield empty_row
+
+            if counter == row_number:
+                counter += 1
+                if not cells and max_column is None:
+                    yield ()
+                    continue
+
+                width = max_column or cells[-1][0]
+                row: list[Any] = [None] * width
+                for column, value in cells:
+                    if column <= width:
+                        row[column - 1] = value
+                yield tuple(row)
+
+        if max_row is not None and max_row < row_number:
+            for _ in range(counter, max_row + 1):
+                yield empty_row
+
+    def _parse_rows(  # noqa: C901, PLR0912
+        self,
+        min_row: int = 1,
+    ) -> Iterator[tuple[int, list[tuple[int, Any]]]]:
+        value_parser = self._value_parser
+        parse_value = value_parser.parse
+        shared_strings = value_parser.shared_strings
+        date_styles = value_parser.date_styles
+        column_indices = _column_indices
+        shared_formulae: dict[str, Translator] = {}
+
+        row_number = 0
+        with self._archive.open(self._path) as sheet_part:
+            for element in _iter_row_elements(sheet_part):
+                if element.tag != ROW_TAG:
+                    continue
+
+                row_number = _get_row_number(element.get("r"), row_number)
+
+                # The rows preceding the range are skipped without decoding their
+                # cells, unless they have formulae (which may be shared with the
+                # following rows).
+                skipped = row_number < min_row
+                if skipped and element.find(FORMULA_PATH) is None:
+                    element.clear()
+                    continue
+
+                cells = []
+                column = 0
+                for cell in element:
+                    if cell.tag != CELL_TAG:
+                        continue
+                    coordinate = cell.get("r")
+                    column = (
+                        column_indices[coordinate.rstrip("0123456789")]
+                        if coordinate
+                        else column + 1
+                    )
+
+                    # The most common cells, holding just a number which isn't a
+                    # date, a boolean, or a (shared or inline) plain string, are parsed
+                    # inline.
+                    value: Any = _MISSING
+                    if len(cell) == 1:
+                        child = cell[0]
+                        data_type = cell.get("t")
+                        if child.tag == VALUE_TAG and (text := child.text):
+                            if data_type == "s":
+                                value = shared_strings[int(text)]
+                            elif data_type == "b":
+                                value = bool(int(text))
+                            elif data_type in (None, "n") and (
+                                not date_styles[cell.get("s")]
+                            ):
+                                value = (
+                                    float(text)
+                                    if "." in text or "E" in text or "e" in text
+                                    else int(text)
+                                )
+                        elif (
+                            child.tag == INLINE_STRING_TAG
+                            and data_type == "inlineStr"
+                            and len(child) == 1
+                            and child[0].tag == TEXT_TAG
+                        ):
+                            value = child[0].text or ""
+                    if value is _MISSING:
+                        value = parse_value(cell, coordinate, shared_formulae)
+                    cells.append((column, value))
+
+                if skipped:
+                    element.clear()
+                    continue
+
+                yield row_number, cells
+
+
+def _iter_row_elements(sheet_part: IO[bytes]) -> Iterator[Element]:
+    # Parse the sheet data in batches of complete rows, each parsed in one go (rather
+    # than element by element, which is dominated by the overhead of the parser's
+    # events). Each batch is parsed along with the part's header (i.e., everything
+    # preceding the sheet data, including the namespace declarations).
+    buffer = sheet_part.read(ROW_BATCH_SIZE)
+
+    # The batches are cut at the rows' end tags, so the part must be encoded in an
+    # ASCII-compatible encoding; otherwise, it's parsed element by element.
+    if buffer.startswith((b"\xff\xfe", b"\xfe\xff")) or b"\x00" in buffer[:100]:
+        yield from _iter_row_elements_incrementally(buffer, sheet_part)
+        return
+
+    while (match := SHEET_DATA_START_PATTERN.search(buffer)) is None:
+        if not (chunk := sheet_part.read(ROW_BATCH_SIZE)):
+            return
+        buffer += chunk
+
+    if match["empty"] or (root := ROOT_START_PATTERN.search(buffer)) is None:
+        return
+
+    prefix = match["prefix"] or b""
+    header = buffer[: match.end()]
+    footer = b"</" + prefix + b"sheetData></" + root["name"] + b">"
+    row_end_tag = b"</" + prefix + b"row>"
+    sheet_data_end_tag = b"</" + prefix + b"sheetData>"
+
+    buffer = buffer[match.end() :]
+    done = False
+    while not done:
+        chunk = sheet_part.read(ROW_BATCH_SIZE)
+        buffer += chunk
+        if (end := buffer.find(sheet_data_end_tag)) != -1 or not chunk:
+            data, buffer, done = buffer if end == -1 else buffer[:end], b"", True
+        elif (end := buffer.rfind(row_end_tag)) != -1:
+            end += len(row_end_tag)
+            data, buffer = buffer[:end], buffer[end:]
+        else:
+            continue
+
+        if data.strip():
+            yield from fromstring(header + data + footer)[-1]
+
+
+def _iter_row_elements_incrementally(
+    buffer: bytes,
+    sheet_part: IO[bytes],
+) -> Iterator[Element]:
+    sheet_data: Element | None = None
+    for event, element in iterparse(
+        _ChainedReader(buffer, sheet_part),
+        events=("start", "end"),
+    ):
+        if event == "start":
+            if element.tag == SHEET_DATA_TAG:
+                sheet_data = element
+        elif element.tag == ROW_TAG:
+            yield element
+
+            # The parsed rows are removed from the tree, so the memory usage doesn't
+            # depend on the sheet size.
+            element.clear()
+            if sheet_data is not None:
+                sheet_data.remove(element)
+
+
+class _ChainedReader:
+    # A binary stream reading the given bytes followed by the given stream's contents.
+
+    def __init__(self, head: bytes, stream: IO[bytes]) -> None:
+        self._head = head
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._head:
+            return self._stream.read(size)
+
+        if size < 0:
+            data, self._head = self._head + self._stream.read(), b""
+        else:
+            data, self._head = self._head[:size], self._head[size:]
+
+        return data
+
+
+def _get_row_number(value: str | None, previous_row_number: int) -> int:
+    if not value:
+        return previous_row_number + 1
+
+    try:
+        return int(value)
+    except ValueError:
+        if not (row_number := float(value)).is_integer():
+            msg = f"{value} is not a valid row number"
+            raise ValueError(msg) from None
+
+        return int(row_number)
+
+
+class _DateStyles(dict[str | None, bool]):
+    # Maps the cells' style IDs (as given by their attributes) into whether their
+    # number formats represent dates.
+
+    def __init__(self, date_formats: set[int]) -> None:
+        super().__init__()
+        self._date_formats = date_formats
+
+    def __missing__(self, style: str | None) -> bool:
+        self[style] = is_date = bool(style and int(style) in self._date_formats)
+        return is_date
+
+
+class _ValueParser:
+    # Parses the cells' values, given the workbook's shared strings, the styles whose
+    # number formats represent dates (and durations), and the epoch of the dates.
+
+    def __init__(
+        self,
+        epoch: dt.datetime,
+        shared_strings: list[str],
+        date_formats: set[int],
+        timedelta_formats: set[int],
+    ) -> None:
+        self.epoch = epoch
+        self.shared_strings = shared_strings
+        self.date_formats = date_formats
+        self.timedelta_formats = timedelta_formats
+        self.date_styles = _DateStyles(date_formats)
+
+    def parse(  # noqa: C901, PLR0911, PLR0912
+        self,
+        cell: Element,
+        coordinate: str | None,
+        shared_formulae: dict[str, Translator],
+    ) -> Any:
+        data_type = cell.get("t", "n")
+
+        value = formula = inline_string = None
+        for child in cell:
+            if child.tag == VALUE_TAG:
+                if value is None:
+                    value = child.text or None
+            elif child.tag == FORMULA_TAG:
+                formula = child
+            elif child.tag == INLINE_STRING_TAG:
+                inline_string = child
+
+        if data_type == "inlineStr":
+            value = None
+
+        if formula is not None:
+            return _parse_formula(formula, coordinate, shared_formulae)
+
+        if value is None:
+            if data_type == "inlineStr" and inline_string is not None:
+                return _get_text(inline_string)
+            return None
+
+        if data_type == "n":
+            number: Any = (
+                float(value)
+                if "." in value or "E" in value or "e" in value
+                else int(value)
+            )
+            if (style := cell.get("s")) and (style_id := int(style)) in (
+                self.date_formats
+            ):
+                try:
+                    return from_excel(
+                        number,
+                        self.epoch,
+                        timedelta=style_id in self.timedelta_formats,
+                    )
+                except (OverflowError, ValueError):
+                    msg = (
+                        f"the cell {coordinate} is marked as a date but the serial "
+                        f"value {number} is outside the limits for dates; the cell "
+                        f"will be treated as an error"
+                    )
+                    warnings.warn(msg, RuntimeWarning, stacklevel=1)
+                    return "#VALUE!"
+            return number
+
+        if data_type == "s":
+            return self.shared_strings[int(value)]
+
+        if data_type == "b":
+            return bool(int(value))
+
+        if data_type == "d":
+            return _parse_iso8601(value)
+
+        return value
+
+
+class XmlWorkbook:
+    # A read-only workbook streaming the sheets' rows straight from the XML parts of
+    # the zip container with an incremental parser, rather than building openpyxl's
+    # cells. It supports the part of openpyxl's read-only workbook API used by the
+    # deserializer. The values are read as by openpyxl (which remains the reference),
+    # including the dates, the shared strings, and the formulae.
+
+    def __init__(self, file: str | Path | IO[bytes]) -> None:
+        self._archive = ZipFile(file)
+        try:
+            self._read_workbook()
+        except BaseException:
+            self._archive.close()
+            raise
+
+    def _read_workbook(self) -> None:
+        archive = self._archive
+
+        workbook_path = (
+            _find_relationship(
+                _get_relationships(archive, "_rels/.rels"),
+                "officeDocument",
+            )
+            or DEFAULT_WORKBOOK_PATH
+        )
+        relationships = _get_relationships(archive, workbook_path)
+
+        self.epoch: dt.datetime = WINDOWS_EPOCH
+        sheets = []
+        with archive.open(workbook_path) as workbook_part:
+            for _, element in iterparse(workbook_part):
+                if element.tag == WORKBOOK_PROPERTIES_TAG and element.get(
+                    "date1904",
+                    "",
+                ).lower() in ("1", "true"):
+                    self.epoch = MAC_EPOCH
+                elif element.tag == SHEET_TAG:
+                    sheets.append(
+                        (
+                            element.get("name", ""),
+                            element.get(RELATIONSHIP_ID_ATTRIBUTE),
+                        ),
+                    )
+
+        value_parser = _ValueParser(
+            self.epoch,
+            self._read_shared_strings(
+                _find_relationship(relationships, "sharedStrings"),
+            ),
+            *self._read_date_formats(_find_relationship(relationships, "styles")),
+        )
+
+        # Chartsheets are skipped, just like by openpyxl.
+        self.worksheets = [
+            XmlWorksheet(archive, title, relationships[rel_id][1], value_parser)
+            for title, rel_id in sheets
+            if rel_id in relationships
+            and relationships[rel_id][0].endswith("/worksheet")
+            and relationships[rel_id][1] in archive.NameToInfo
+        ]
+
+    def _read_shared_strings(self, path: str | None) -> list[str]:
+        if path is None or path not in self._archive.NameToInfo:
+            return []
+
+        shared_strings = []
+        with self._archive.open(path) as strings_part:
+            for _, element in iterparse(strings_part):
+                if element.tag == STRING_ITEM_TAG:
+                    shared_strings.append(_get_text(element).replace("x005F_", ""))
+                    element.clear()
+
+        return shared_strings
+
+    def _read_date_formats(self, path: str | None) -> tuple[set[int], set[int]]:
+        # Find the cell styles whose number formats represent dates and durations.
+        if path is None or path not in self._archive.NameToInfo:
+            return set(), set()
+
+        custom_formats: dict[int, str] = {}
+        date_formats: set[int] = set()
+        timedelta_formats: set[int] = set()
+        with self._archive.open(path) as styles_part:
+            for _, element in iterparse(styles_part):
+                if element.tag == NUMBER_FORMAT_TAG:
+                    custom_formats[int(element.get("numFmtId", 0))] = element.get(
+                        "formatCode",
+                        "",
+                    )
+                elif element.tag == CELL_FORMATS_TAG:
+                    for index, cell_format in enumerate(element.iter(CELL_FORMAT_TAG)):
+                        number_format_id = int(cell_format.get("numFmtId", 0))
+                        number_format = (
+                            custom_formats[number_format_id]
+                            if number_format_id in custom_formats
+                            else builtin_format_code(number_format_id)
+                        )
+                        if is_date_format(number_format):
+                            date_formats.add(index)
+                        if is_timedelta_format(number_format):
+                            timedelta_formats.add(index)
+
+        return date_formats, timedelta_formats
+
+    def __iter__(self) -> Iterator[XmlWorksheet]:
+        return iter(self.worksheets)
+
+    def __getitem__(self, name: str) -> XmlWorksheet:
+        for worksheet in self.worksheets:
+            if worksheet.title == name:
+                return worksheet
+
+        msg = f"Worksheet {name} does not exist."
+        raise KeyError(msg)
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return [worksheet.title for worksheet in self.worksheets]
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+def _parse_formula(
+    formula: Element,
+    coordinate: str | None,
+    shared_formulae: dict[str, Translator],
+) -> Any:
+    # Formulae are read as text (prefixed with "="), as by openpyxl. The shared ones
+    # are translated from the cells defining them.
+    formula_type = formula.get("t")
+    value = f"={formula.text or ''}"
+
+    if formula_type == "array":
+        return ArrayFormula(ref=formula.get("ref"), text=value)
+
+    if formula_type == "shared":
+        index = formula.get("si")
+        if index in shared_formulae:
+            return shared_formulae[index].translate_formula(coordinate)
+        if value != "=":
+            shared_formulae[str(index)] = Translator(value, coordinate)
+
+    elif formula_type == "dataTable":
+        attributes: dict[str, Any] = dict(formula.attrib)
+        return DataTableFormula(**attributes)
+
+    return value
+
+
+class CalamineWorksheet:
+    # A worksheet read by python-calamine (which loads the whole sheet at once), whose
+    # rows have the same values as the rows of openpyxl's read-only worksheets, except
+    # for the formulae, whose cached values are read instead. The rows aren't padded
+    # to the sheet's dimensions, which the deserializer doesn't depend on.
+
+    def __init__(self, sheet: Any) -> None:
+        self.title = sheet.name
+        self._sheet = sheet
+
+        # The leading empty rows are included in the rows, unlike the leading empty
+        # columns.
+        self.max_row = sheet.end[0] + 1 if sheet.end is not None else None
+        self._padding = (None,) * (sheet.start[1] if sheet.start is not None else 0)
+
+    def __repr__(self) -> str:
+        return f'<CalamineWorksheet "{self.title}">'
+
+    def iter_rows(
+        self,
+        min_row: int | None = None,
+        max_row: int | None = None,
+        *,
+        values_only: bool = True,
+    ) -> Iterator[tuple[Any, ...]]:
+        if not values_only:
+            msg = "the calamine reader reads the cells' values only"
+            raise ValueError(msg)
+
+        return self._iter_rows(min_row or 1, max_row)
+
+    def _iter_rows(
+        self,
+        min_row: int,
+        max_row: int | None,
+    ) -> Iterator[tuple[Any, ...]]:
+        padding = self._padding
+        for row_number, row in enumerate(self._sheet.iter_rows(), start=1):
+            if max_row is not None and row_number > max_row:
+                break
+            if row_number >= min_row:
+                yield (*padding, *map(_convert_calamine_value, row))
+
+
+def _convert_calamine_value(value: Any) -> Any:
+    # Convert the values to the types returned by openpyxl: empty cells are read
+    # as empty strings, all the numbers as floats, and the dates (without times) as
+    # dates, rather than as `None`, integers (if integral), and datetimes.
+    value_type = type(value)
+    if value_type is float:
+        return int(value) if value.is_integer() else value
+    if value_type is str:
+        return value or None
+    if value_type is dt.date:
+        return dt.datetime(value.year, value.month, value.day)  # noqa: DTZ001
+
+    return value
+
+
+class CalamineWorkbook:
+    # A workbook read by python-calamine, supporting the part of openpyxl's read-only
+    # workbook API used by the deserializer. Chartsheets are skipped, just like by
+    # openpyxl.
+
+    def __init__(self, file: str | Path | IO[bytes]) -> None:
+        self._workbook = python_calamine.load_workbook(file)
+        self.sheetnames = [
+            metadata.name
+            for metadata in self._workbook.sheets_metadata
+            if metadata.typ == python_calamine.SheetTypeEnum.WorkSheet
+        ]
+
+    def __iter__(self) -> Iterator[CalamineWorksheet]:
+        return map(self.__getitem__, self.sheetnames)
+
+    def __getitem__(self, name: str) -> CalamineWorksheet:
+        if name not in self.sheetnames:
+            msg = f"Worksheet {name} does not exist."
+            raise KeyError(msg)
+
+        return CalamineWorksheet(self._workbook.get_sheet_by_name(name))
+
+    def close(self) -> None:
+        self._workbook.close()
+
+
+def _load_openpyxl_workbook(
+    file: str | Path | IO[bytes],
+    *,
+    read_only: bool,
+) -> Any:
+    return openpyxl.load_workbook(file, read_only=read_only)
+
+
+def _load_xml_workbook(
+    file: str | Path | IO[bytes],
+    *,
+    read_only: bool,  # noqa: ARG001
+) -> Any:
+    # The XML reader always streams the rows, regardless of the read-only mode.
+    return XmlWorkbook(file)
+
+
+def _load_calamine_workbook(
+    file: str | Path | IO[bytes],
+    *,
+    read_only: bool,  # noqa: ARG001
+) -> Any:
+    return CalamineWorkbook(file)
+
+
+# The engines backed by the optional dependencies are available only if the latter
+# are installed (see the project's extras).
+READERS: Final[dict[str, Callable[..., Any]]] = {
+    "openpyxl": _load_openpyxl_workbook,
+    "xml": _load_xml_workbook,
+    **({"calamine": _load_calamine_workbook} if _HAS_CALAMINE else {}),
+}
+
+
+def get_reader(name: str) -> Callable[..., Any]:
+    # Get the function loading workbooks with the given reader engine. The workbooks
+    # must support (at least) the part of openpyxl's read-only workbook API used by
+    # the deserializer.
+    try:
+        return READERS[name]
+    except KeyError:
+        msg = (
+            f"the reader engine {name!r} isn't supported; use one of: "
+            f"{', '.join(map(repr, READERS))}"
+        )
+        raise DeserializationError(msg) from None
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+__all__ = [
+    "parse_relation",
+]
+
+import ast
+import re
+from functools import lru_cache
+from typing import Any, Final
+
+RELATION_CACHE_SIZE: Final[int] = 65_536
+
+# The tokens of the literals written by the serializer to the relation columns, i.e.,
+# integers, strings (without escape sequences), and the tuple/list punctuation.
+RELATION_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"""[ \t]*(?:(-?(?:0|[1-9][0-9]*))|'([^'\\\n]*)'|"([^"\\\n]*)"|([\[\](),]))""",
+)
+
+_UNPARSABLE: Final[object] = object()
+
+
+def _parse_relation(value: str) -> Any:  # noqa: C901, PLR0911, PLR0912
+    # Parse a literal built of integers and strings nested in tuples and lists (e.g.,
+    # a natural key or a list of natural keys). Other literals (and invalid ones) are
+    # reported as unparsable.
+    stack: list[tuple[list[Any], str]] = []
+    result: Any = _UNPARSABLE
+    expects_item = True
+    after_comma = False
+
+    position = 0
+    while match := RELATION_TOKEN_PATTERN.match(value, position):
+        position = match.end()
+        integer, single_quoted, double_quoted, punctuation = match.groups()
+
+        if punctuation == ",":
+            if expects_item or not stack:
+                return _UNPARSABLE
+            expects_item = after_comma = True
+            continue
+
+        if punctuation in ("(", "["):
+            if not expects_item:
+                return _UNPARSABLE
+            stack.append(([], ")" if punctuation == "(" else "]"))
+            after_comma = False
+            continue
+
+        if punctuation is not None:
+            if not stack or stack[-1][1] != punctuation:
+                return _UNPARSABLE
+            items, _ = stack.pop()
+            if punctuation == ")":
+                # A parenthesized item without a trailing comma isn't a tuple.
+                if len(items) == 1 and not after_comma:
+                    return _UNPARSABLE
+                item: Any = tuple(items)
+            else:
+                item = items
+        elif expects_item:
+            item = (
+                int(integer)
+                if integer is not None
+                else single_quoted
+                if single_quoted is not None
+                else double_quoted
+            )
+        else:
+            return _UNPARSABLE
+
+        if stack:
+            stack[-1][0].append(item)
+        elif result is _UNPARSABLE:
+            result = item
+        else:
+            return _UNPARSABLE
+        expects_item = after_comma = False
+
+    if stack or value[position:].strip(" \t"):
+        return _UNPARSABLE
+
+    return result
+
+
+@lru_cache(maxsize=RELATION_CACHE_SIZE)
+def _parse_relation_cached(value: str) -> Any:
+    if (relation := _parse_relation(value)) is _UNPARSABLE:
+        relation = ast.literal_eval(value)
+
+    return relation
+
+
+def parse_relation(value: str) -> Any:
+    # Parse the string representation of a relation (a foreign key, a natural key, or
+    # a list of either) as serialized. Unusual literals fall back to
+    # `ast.literal_eval`. The results are cached, as the same related objects repeat
+    # across the rows; lists are copied, so the cached ones can't be modified.
+    relation = _parse_relation_cached(value)
+
+    return relation.copy() if isinstance(relation, list) else relation
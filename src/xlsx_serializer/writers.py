@@ -0,0 +1,520 @@
+from __future__ import annotations
+
+__all__ = [
+    "OpenpyxlWriter",
+    "Writer",
+    "XlsxWriterWriter",
+    "XmlWriter",
+    "get_writer",
+]
+
+import datetime as dt
+import io
+import math
+import shutil
+import tempfile
+from decimal import Decimal
+from typing import IO, TYPE_CHECKING, Any, Final, Protocol
+from xml.sax.saxutils import escape
+from zipfile import ZipFile
+
+import openpyxl
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils.cell import get_column_letter
+from openpyxl.utils.datetime import to_excel
+from openpyxl.utils.exceptions import IllegalCharacterError
+from openpyxl.writer.excel import ExcelWriter
+
+from django.core.serializers.base import SerializationError
+
+try:
+    import xlsxwriter
+except ImportError:
+    _HAS_XLSXWRITER = False
+else:
+    _HAS_XLSXWRITER = True
+
+from xlsx_serializer.container import (
+    COMPRESSIONS,
+    SPREADSHEETML_NAMESPACE,
+    XML_DECLARATION,
+    WorkbookArchive,
+    get_compression,
+    recompress_archive,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from pathlib import Path
+
+# The maximum number of characters in a cell.
+CELL_MAX_LENGTH: Final[int] = 32_767
+
+# The largest integer whose value is kept exactly by floats.
+FLOAT_MAX_EXACT_INTEGER: Final[int] = 2**53
+
+# The number formats of the dates and durations, the same as the ones used by
+# openpyxl, so the values are read back the same way regardless of the writer.
+DATE_FORMATS: Final[dict[type, tuple[int, str]]] = {
+    dt.datetime: (1, "yyyy-mm-dd h:mm:ss"),
+    dt.date: (2, "yyyy-mm-dd"),
+    dt.time: (3, "h:mm:ss"),
+    dt.timedelta: (4, "[hh]:mm:ss"),
+}
+
+CUSTOM_NUMBER_FORMAT_MIN_ID: Final[int] = 164
+
+XML_WRITER_STYLES: Final[bytes] = (
+    f"{XML_DECLARATION}"
+    f'<styleSheet xmlns="{SPREADSHEETML_NAMESPACE}">'
+    f'<numFmts count="{len(DATE_FORMATS)}">'
+    + "".join(
+        f'<numFmt numFmtId="{CUSTOM_NUMBER_FORMAT_MIN_ID + style_id - 1}" '
+        f'formatCode="{number_format}"/>'
+        for style_id, number_format in DATE_FORMATS.values()
+    )
+    + "</numFmts>"
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border>'
+    "</borders>"
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+    "</cellStyleXfs>"
+    f'<cellXfs count="{len(DATE_FORMATS) + 1}">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    + "".join(
+        f'<xf numFmtId="{CUSTOM_NUMBER_FORMAT_MIN_ID + style_id - 1}" fontId="0" '
+        f'fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+        for style_id, _ in DATE_FORMATS.values()
+    )
+    + "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>'
+    "</cellStyles>"
+    "</styleSheet>"
+).encode()
+
+
+class Writer(Protocol):
+    # The interface of the writer engines (see `WRITERS`). The writers open the
+    # sheets, write their headers and rows, and finally save the workbook to the
+    # output (if any) when closed; `getvalue()` returns the serializer's value. The
+    # sheets are opaque to the serializer, so their type is specific to the engine.
+
+    @property
+    def sheetnames(self) -> list[str]: ...
+
+    def open_sheet(self, name: str) -> Any: ...
+
+    def write_header(self, sheet: Any, columns: Iterable[str]) -> None: ...
+
+    def write_row(self, sheet: Any, row: Sequence[Any]) -> None: ...
+
+    def close(self, output: str | Path | IO[bytes] | None) -> None: ...
+
+    def getvalue(self) -> Any: ...
+
+
+def _check_string(value: str) -> None:
+    # Excel doesn't allow control characters and limits the length of the strings
+    # (which would be truncated when the workbook is opened).
+    if ILLEGAL_CHARACTERS_RE.search(value):
+        msg = f"{value} cannot be used in worksheets."
+        raise IllegalCharacterError(msg)
+    if len(value) > CELL_MAX_LENGTH:
+        msg = (
+            f"the string of {len(value)} characters exceeds the limit of "
+            f"{CELL_MAX_LENGTH} characters per cell"
+        )
+        raise SerializationError(msg)
+
+
+class OpenpyxlWriter:
+    # Writes the sheets into an openpyxl workbook, which is returned as the
+    # serializer's value (and saved to its stream, if any). In the write-only mode,
+    # the rows are flushed to the sheets' XML files as soon as they are appended, so
+    # the memory usage does not depend on the number of rows.
+
+    def __init__(
+        self,
+        *,
+        write_only: bool = False,
+        compression: str = "default",
+    ) -> None:
+        self._workbook = openpyxl.Workbook(write_only=write_only)
+        self._compression = get_compression(compression)
+
+        # Remove the sheets not added by the serializer (i.e., the default sheet of
+        # a regular workbook), so they don't conflict with the model sheets.
+        for sheet in self._workbook.worksheets.copy():
+            self._workbook.remove(sheet)
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return self._workbook.sheetnames
+
+    def open_sheet(self, name: str) -> Any:
+        return self._workbook.create_sheet(name)
+
+    def write_header(self, sheet: Any, columns: Iterable[str]) -> None:
+        sheet.append(list(columns))
+
+    def write_row(self, sheet: Any, row: Sequence[Any]) -> None:
+        # openpyxl checks the strings' characters only.
+        for value in row:
+            if type(value) is str and len(value) > CELL_MAX_LENGTH:
+                _check_string(value)
+        sheet.append(row)
+
+    def close(self, output: str | Path | IO[bytes] | None) -> None:
+        if not output:
+            return
+
+        if self._compression == COMPRESSIONS["default"]:
+            self._workbook.save(output)
+            return
+
+        # Save the workbook just like `openpyxl.Workbook.save()` does, but with the
+        # zip container compressed as selected.
+        method, level = self._compression
+        archive = ZipFile(output, "w", method, allowZip64=True, compresslevel=level)
+        modified = dt.datetime.now(tz=dt.timezone.utc).replace(tzinfo=None)
+        self._workbook.properties.modified = modified
+        ExcelWriter(self._workbook, archive).save()
+
+    def getvalue(self) -> Any:
+        return self._workbook
+
+
+class _XmlSheet:
+    # A sheet whose rows are written as SpreadsheetML to a temporary file, so the
+    # memory usage doesn't depend on the number of rows. The sheet part is assembled
+    # when the workbook is closed, once the sheet's dimensions are known.
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.file = tempfile.TemporaryFile()  # noqa: SIM115
+        self.row_count = 0
+        self.column_count = 0
+
+
+# The columns' letters are cached, as the same columns repeat across the rows.
+_column_letters: Final[list[str]] = []
+
+# openpyxl's converter of the dates and durations into serial numbers, which is
+# untyped.
+_to_excel: Final[Callable[[Any], float]] = to_excel
+
+
+def _get_column_letters(count: int) -> list[str]:
+    # Returns (at least) the given number of the leading columns' letters.
+    if count > len(_column_letters):
+        _column_letters.extend(
+            get_column_letter(index)
+            for index in range(len(_column_letters) + 1, count + 1)
+        )
+
+    return _column_letters
+
+
+def _get_date_type(value: Any, row_reference: str) -> type:
+    # Get the type of the date or duration determining its number format (see
+    # `DATE_FORMATS`). Excel doesn't support timezones.
+    if getattr(value, "tzinfo", None) is not None:
+        msg = f"the value {value!r} of the cell {row_reference} has a timezone"
+        raise SerializationError(msg)
+
+    return next(type_ for type_ in DATE_FORMATS if isinstance(value, type_))
+
+
+def _format_string(value: str, row_reference: str) -> str:
+    # The strings are stored inline, so no shared strings part is needed.
+    _check_string(value)
+
+    return (
+        f'<c r="{row_reference}" t="inlineStr"><is>'
+        f'<t xml:space="preserve">{escape(value)}</t></is></c>'
+    )
+
+
+def _format_date(value: Any, row_reference: str) -> str:
+    # Dates and durations are written as serial numbers formatted by the styles.
+    style_id, _ = DATE_FORMATS[_get_date_type(value, row_reference)]
+
+    return f'<c r="{row_reference}" s="{style_id}"><v>{_to_excel(value)}</v></c>'
+
+
+class XmlWriter:
+    # Writes the workbook's SpreadsheetML parts and the zip container directly (see
+    # `WorkbookArchive`), rather than building openpyxl's cells. The strings are
+    # stored inline, and the styles are limited to the number formats of dates, so
+    # plain data is written several times faster than by openpyxl. The values are
+    # read back the same as the ones written by openpyxl, except for the strings
+    # starting with "=", which are written as text rather than formulae, and the
+    # floats, which are written with their full precision (so the integral ones are
+    # read back as floats, too). Without an output stream, the workbook's contents
+    # are returned as bytes.
+
+    def __init__(self, *, compression: str = "default") -> None:
+        self._sheets: list[_XmlSheet] = []
+        self._value: bytes | None = None
+        # The compression is validated upfront, before any rows are written.
+        get_compression(compression)
+        self._compression = compression
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return [sheet.name for sheet in self._sheets]
+
+    def open_sheet(self, name: str) -> _XmlSheet:
+        self._sheets.append(sheet := _XmlSheet(name))
+
+        return sheet
+
+    def write_header(self, sheet: _XmlSheet, columns: Iterable[str]) -> None:
+        self.write_row(sheet, list(columns))
+
+    def write_row(self, sheet: _XmlSheet, row: Sequence[Any]) -> None:  # noqa: C901
+        sheet.row_count = row_number = sheet.row_count + 1
+        sheet.column_count = max(sheet.column_count, len(row))
+
+        cells = []
+        for letter, value in zip(_get_column_letters(len(row)), row, strict=False):
+            # Empty strings are skipped as well, as by openpyxl.
+            if value is None or value == "":
+                continue
+
+            value_type = type(value)
+            if value_type is str:
+                cells.append(_format_string(value, f"{letter}{row_number}"))
+            elif value_type is bool:
+                cells.append(f'<c r="{letter}{row_number}" t="b"><v>{value:d}</v></c>')
+            elif value_type is int:
+                cells.append(f'<c r="{letter}{row_number}"><v>{value}</v></c>')
+            elif isinstance(value, (float, Decimal)):
+                # Infinities and NaNs can't be stored, so their cells are left
+                # empty, as by openpyxl.
+                if math.isfinite(value):
+                    cells.append(f'<c r="{letter}{row_number}"><v>{value}</v></c>')
+            elif isinstance(value, (dt.date, dt.time, dt.timedelta)):
+                cells.append(_format_date(value, f"{letter}{row_number}"))
+            elif isinstance(value, int):
+                cells.append(f'<c r="{letter}{row_number}"><v>{int(value)}</v></c>')
+            elif isinstance(value, str):
+                # String subclasses (e.g., Django's safe strings) are written as plain
+                # strings.
+                cells.append(_format_string(str(value), f"{letter}{row_number}"))
+            else:
+                msg = f"cannot convert {value!r} to Excel"
+                raise SerializationError(msg)
+
+        sheet.file.write(f'<row r="{row_number}">{"".join(cells)}</row>'.encode())
+
+    def close(self, output: str | Path | IO[bytes] | None) -> None:
+        try:
+            if not self._sheets:
+                return
+
+            buffer = io.BytesIO()
+            archive = WorkbookArchive(
+                buffer if output is None else output,
+                compression=self._compression,
+            )
+            for sheet in self._sheets:
+                with archive.open_sheet(sheet.name) as sheet_part:
+                    self._write_sheet_part(sheet, sheet_part)
+            archive.close(styles=XML_WRITER_STYLES)
+
+            if output is None:
+                self._value = buffer.getvalue()
+        finally:
+            for sheet in self._sheets:
+                sheet.file.close()
+
+    def _write_sheet_part(self, sheet: _XmlSheet, sheet_part: IO[bytes]) -> None:
+        dimension = (
+            f"A1:{get_column_letter(sheet.column_count)}{sheet.row_count}"
+            if sheet.column_count
+            else "A1"
+        )
+        sheet_part.write(
+            f'{XML_DECLARATION}<worksheet xmlns="{SPREADSHEETML_NAMESPACE}">'
+            f'<dimension ref="{dimension}"/><sheetData>'.encode(),
+        )
+        sheet.file.seek(0)
+        shutil.copyfileobj(sheet.file, sheet_part)
+        sheet_part.write(b"</sheetData></worksheet>")
+
+    def getvalue(self) -> bytes | None:
+        return self._value
+
+
+class _XlsxWriterSheet:
+    def __init__(self, worksheet: Any) -> None:
+        self.worksheet = worksheet
+        self.row_count = 0
+
+
+class XlsxWriterWriter:
+    # Writes the workbook by XlsxWriter in its constant memory mode, in which the rows
+    # are flushed to the sheets' temporary files as they are written (and the strings
+    # are stored inline). The values are written just like by the XML writer (see
+    # `XmlWriter`), so they are read back the same as the ones written by openpyxl.
+    # The workbook is created along with its first sheet, as XlsxWriter would add
+    # a default sheet to an empty workbook.
+
+    def __init__(self, *, compression: str = "default") -> None:
+        self._workbook: Any = None
+        self._date_formats: dict[type, Any] = {}
+        self._value: bytes | None = None
+        # The compression is validated upfront, before any rows are written.
+        get_compression(compression)
+        self._compression = compression
+
+    @property
+    def sheetnames(self) -> list[str]:
+        if self._workbook is None:
+            return []
+
+        return [worksheet.name for worksheet in self._workbook.worksheets()]
+
+    def open_sheet(self, name: str) -> _XlsxWriterSheet:
+        if self._workbook is None:
+            # The output is set when the workbook is closed.
+            self._workbook = xlsxwriter.Workbook(
+                None,
+                {
+                    "constant_memory": True,
+                    "strings_to_formulas": False,
+                    "strings_to_numbers": False,
+                    "strings_to_urls": False,
+                },
+            )
+            self._date_formats = {
+                type_: self._workbook.add_format({"num_format": number_format})
+                for type_, (_, number_format) in DATE_FORMATS.items()
+            }
+
+        return _XlsxWriterSheet(self._workbook.add_worksheet(name))
+
+    def write_header(self, sheet: _XlsxWriterSheet, columns: Iterable[str]) -> None:
+        self.write_row(sheet, list(columns))
+
+    def write_row(self, sheet: _XlsxWriterSheet, row: Sequence[Any]) -> None:  # noqa: C901, PLR0912
+        worksheet = sheet.worksheet
+        row_index = sheet.row_count
+        sheet.row_count += 1
+
+        for column_index, value in enumerate(row):
+            if value is None or value == "":
+                continue
+
+            value_type = type(value)
+            if value_type is str:
+                # XlsxWriter would truncate the longer strings.
+                _check_string(value)
+                worksheet.write_string(row_index, column_index, value)
+            elif value_type is bool:
+                worksheet.write_boolean(row_index, column_index, value)
+            elif value_type is int:
+                # XlsxWriter writes the numbers with the precision of floats, so the
+                # larger integers are written as text to keep their values.
+                if abs(value) <= FLOAT_MAX_EXACT_INTEGER:
+                    worksheet.write_number(row_index, column_index, value)
+                else:
+                    worksheet.write_string(row_index, column_index, str(value))
+            elif isinstance(value, (float, Decimal)):
+                if math.isfinite(value):
+                    worksheet.write_number(row_index, column_index, float(value))
+            elif isinstance(value, (dt.date, dt.time, dt.timedelta)):
+                date_type = _get_date_type(
+                    value,
+                    f"{get_column_letter(column_index + 1)}{row_index + 1}",
+                )
+                worksheet.write_datetime(
+                    row_index,
+                    column_index,
+                    value,
+                    self._date_formats[date_type],
+                )
+            elif isinstance(value, int):
+                worksheet.write_number(row_index, column_index, int(value))
+            elif isinstance(value, str):
+                # String subclasses (e.g., Django's safe strings) are written as plain
+                # strings.
+                _check_string(value)
+                worksheet.write_string(row_index, column_index, str(value))
+            else:
+                msg = f"cannot convert {value!r} to Excel"
+                raise SerializationError(msg)
+
+    def close(self, output: str | Path | IO[bytes] | None) -> None:
+        if self._workbook is None:
+            return
+
+        buffer = io.BytesIO()
+        target = buffer if output is None else output
+        if self._compression == "default":
+            self._workbook.filename = target
+            self._workbook.close()
+        else:
+            # XlsxWriter always deflates the parts with the default level, so the
+            # workbook is saved to a temporary file first, and its parts are then
+            # recompressed as selected.
+            with tempfile.TemporaryFile() as file:
+                self._workbook.filename = file
+                self._workbook.close()
+                file.seek(0)
+                recompress_archive(file, target, compression=self._compression)
+
+        if output is None:
+            self._value = buffer.getvalue()
+
+    def getvalue(self) -> bytes | None:
+        return self._value
+
+
+def _create_openpyxl_writer(
+    *,
+    write_only: bool,
+    compression: str = "default",
+) -> OpenpyxlWriter:
+    return OpenpyxlWriter(write_only=write_only, compression=compression)
+
+
+def _create_xml_writer(
+    *,
+    write_only: bool,  # noqa: ARG001
+    compression: str = "default",
+) -> XmlWriter:
+    # The XML writer always streams the rows, regardless of the write-only mode.
+    return XmlWriter(compression=compression)
+
+
+def _create_xlsxwriter_writer(
+    *,
+    write_only: bool,  # noqa: ARG001
+    compression: str = "default",
+) -> XlsxWriterWriter:
+    return XlsxWriterWriter(compression=compression)
+
+
+# The engines backed by the optional dependencies are available only if the latter
+# are installed (see the project's extras).
+WRITERS: Final[dict[str, Callable[..., Writer]]] = {
+    "openpyxl": _create_openpyxl_writer,
+    "xml": _create_xml_writer,
+    **({"xlsxwriter": _create_xlsxwriter_writer} if _HAS_XLSXWRITER else {}),
+}
+
+
+def get_writer(name: str) -> Callable[..., Writer]:
+    # Get the function creating the writers (see `Writer`) of the given engine.
+    try:
+        return WRITERS[name]
+    except KeyError:
+        msg = (
+            f"the writer engine {name!r} isn't supported; use one of: "
+            f"{', '.join(map(repr, WRITERS))}"
+        )
+        raise SerializationError(msg) from None
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import io
+import sys
 from typing import TYPE_CHECKING
 from unittest import mock
 
@@ -7,6 +9,7 @@ import openpyxl
 import pytest
 
 from django.core.management import call_command
+from django.test.utils import override_settings
 
 from xlsx_serializer.core import Serializer
 
@@ -34,16 +37,18 @@ def test_dumpdata_command_invokes_serializer(fixture_path: Path) -> None:
 
 
 @pytest.mark.django_db
-def test_dumpdata_command_warns_if_output_is_not_provided() -> None:
+def test_dumpdata_command_writes_workbook_to_stdout_if_output_is_not_provided(
+    capsysbinary: pytest.CaptureFixture[bytes],
+) -> None:
     # Arrange.
-    DummyModel._default_manager.create()
+    DummyModel._default_manager.create(pk=1)
 
-    # Act & assert.
-    with pytest.warns(
-        RuntimeWarning,
-        match=r"printing workbooks to the standard output isn't supported",
-    ):
-        call_command("dumpdata", format="xlsx")
+    # Act.
+    call_command("dumpdata", "tests.DummyModel", format="xlsx")
+
+    # Assert.
+    wb = openpyxl.load_workbook(io.BytesIO(capsysbinary.readouterr().out))
+    assert list(wb["tests.DummyModel"].iter_rows(values_only=True)) == [("id",), (1,)]
 
 
 @pytest.mark.django_db
@@ -61,29 +66,35 @@ def test_dumpdata_command_warns_if_there_is_nothing_to_serialize(
         call_command("dumpdata", format="xlsx", output=fixture_path)
 
 
+@pytest.mark.parametrize("is_output_provided", [True, False], ids=["output", "stdout"])
 @pytest.mark.django_db
-def test_dumpdata_command_saves_workbook_if_output_is_provided(
+def test_dumpdata_command_saves_workbook_to_output_or_stdout_buffer(
     fixture_path: Path,
+    is_output_provided: bool,
 ) -> None:
     # Arrange.
     DummyModel._default_manager.create()
+    output = str(fixture_path) if is_output_provided else None
 
     # Act.
     with mock.patch.object(openpyxl.Workbook, "save") as workbook_save_mock:
-        call_command("dumpdata", format="xlsx", output=str(fixture_path))
+        call_command("dumpdata", format="xlsx", output=output)
 
     # Assert.
-    workbook_save_mock.assert_called_with(str(fixture_path))
+    workbook_save_mock.assert_called_with(output or sys.stdout.buffer)
 
 
 @pytest.mark.django_db
-def test_dumpdata_command_does_not_save_workbook_if_output_is_not_provided() -> None:
+def test_dumpdata_command_saves_write_only_workbook_if_write_only_setting_is_enabled(
+    fixture_path: Path,
+) -> None:
     # Arrange.
-    DummyModel._default_manager.create()
+    DummyModel._default_manager.create(pk=1)
 
     # Act.
-    with mock.patch.object(openpyxl.Workbook, "save") as workbook_save_mock:
-        call_command("dumpdata", format="xlsx")
+    with override_settings(XLSX_SERIALIZER_WRITE_ONLY=True):
+        call_command("dumpdata", "tests.DummyModel", format="xlsx", output=fixture_path)
 
     # Assert.
-    workbook_save_mock.assert_not_called()
+    ws = openpyxl.load_workbook(fixture_path)["tests.DummyModel"]
+    assert list(ws.iter_rows(values_only=True)) == [("id",), (1,)]
@@ -7,6 +7,9 @@ import openpyxl
 import pytest
 
 from django.core.management import call_command
+from django.test.utils import override_settings
+
+from tests.models import DummyModel
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -27,3 +30,23 @@ def test_loaddata_command_invokes_deserializer(fixture_path: Path) -> None:
 
     # Assert.
     deserializer_mock.assert_called()
+
+
+@pytest.mark.django_db
+@override_settings(XLSX_SERIALIZER_READ_ONLY=True)
+def test_loaddata_command_loads_objects_in_read_only_mode(fixture_path: Path) -> None:
+    # Arrange.
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.DummyModel")
+    ws.append(["id"])
+    ws.append([1])
+    ws.append([2])
+    wb.save(fixture_path)
+
+    # Act.
+    call_command("loaddata", fixture_path)
+
+    # Assert.
+    assert list(
+        DummyModel._default_manager.order_by("pk").values_list("pk", flat=True),
+    ) == [1, 2]
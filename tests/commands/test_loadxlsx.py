@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import openpyxl
+import pytest
+
+from django.core.management import call_command
+from django.db import connection
+
+from tests.models import DummyModel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.django_db(transaction=True)
+def test_loadxlsx_command_loads_fixtures(tmp_path: Path) -> None:
+    # Arrange.
+    fixture_paths = []
+    for index, pks in enumerate([[1, 2], [3]]):
+        wb = openpyxl.Workbook()
+        ws = wb.create_sheet("tests.DummyModel")
+        ws.append(["id"])
+        for pk in pks:
+            ws.append([pk])
+        wb.save(fixture_path := tmp_path / f"fixture_{index}.xlsx")
+        fixture_paths.append(fixture_path)
+    stdout = io.StringIO()
+
+    # Act.
+    call_command("loadxlsx", *fixture_paths, batch_size=1, stdout=stdout)
+
+    # Assert.
+    assert list(
+        DummyModel._default_manager.order_by("pk").values_list("pk", flat=True),
+    ) == [1, 2, 3]
+    assert stdout.getvalue() == "Installed 3 object(s) from 2 fixture(s)\n"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_loadxlsx_command_loads_fixtures_outside_transaction_if_workers_are_set(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    in_atomic_blocks = []
+
+    def _load(*args: Any, **kwargs: Any) -> int:
+        in_atomic_blocks.append(connection.in_atomic_block)
+
+        return 0
+
+    # Act.
+    with mock.patch(
+        "xlsx_serializer.management.commands.loadxlsx.load",
+        side_effect=_load,
+    ) as load_mock:
+        call_command("loadxlsx", fixture_path, workers=2, stdout=io.StringIO())
+
+    # Assert.
+    assert load_mock.call_args.kwargs["workers"] == 2
+    assert in_atomic_blocks == [False]
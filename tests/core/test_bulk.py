@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import openpyxl
+import pytest
+
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from xlsx_serializer.bulk import load
+
+from tests.models import (
+    CyclicForeignKeyModelA,
+    CyclicForeignKeyModelB,
+    DummyModel,
+    ManyToManyFieldModel,
+    NaturalKeyModel,
+    PrimaryKeyModel,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+    from pathlib import Path
+
+
+def _count_inserts(context: CaptureQueriesContext, table: str) -> int:
+    return sum(
+        re.match(rf'INSERT (?:OR IGNORE )?INTO "{table}"', query["sql"]) is not None
+        for query in context.captured_queries
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_inserts_objects_in_batches(fixture_path: Path) -> None:
+    # Arrange.
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.DummyModel")
+    ws.append(["id"])
+    for pk in range(1, 6):
+        ws.append([pk])
+    wb.save(fixture_path)
+
+    # Act.
+    with CaptureQueriesContext(connection) as context:
+        object_count = load(fixture_path, batch_size=2)
+
+    # Assert.
+    assert object_count == 5
+    assert _count_inserts(context, DummyModel._meta.db_table) == 3
+    assert list(
+        DummyModel._default_manager.order_by("pk").values_list("pk", flat=True),
+    ) == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(XLSX_SERIALIZER_BATCH_SIZE=1)
+def test_load_reads_batch_size_from_settings(fixture_path: Path) -> None:
+    # Arrange.
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.DummyModel")
+    ws.append(["id"])
+    ws.append([1])
+    ws.append([2])
+    wb.save(fixture_path)
+
+    # Act.
+    with CaptureQueriesContext(connection) as context:
+        load(fixture_path)
+
+    # Assert.
+    assert _count_inserts(context, DummyModel._meta.db_table) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_updates_existing_objects(fixture_path: Path) -> None:
+    # Arrange.
+    NaturalKeyModel._default_manager.create(pk=1, nk_field_1="old", nk_field_2=1)
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.NaturalKeyModel")
+    ws.append(["id", "nk_field_1", "nk_field_2"])
+    ws.append([1, "new", 2])
+    ws.append([2, "new", 3])
+    wb.save(fixture_path)
+
+    # Act.
+    load(fixture_path)
+
+    # Assert.
+    assert list(
+        NaturalKeyModel._default_manager.order_by("pk").values_list(
+            "pk",
+            "nk_field_1",
+            "nk_field_2",
+        ),
+    ) == [(1, "new", 2), (2, "new", 3)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_replaces_many_to_many_relations_in_bulk(fixture_path: Path) -> None:
+    # Arrange.
+    pk_model_objs = [PrimaryKeyModel._default_manager.create(pk=pk) for pk in (1, 2, 3)]
+    ManyToManyFieldModel._default_manager.create(pk=1).to_pk_model_field.set(
+        pk_model_objs[2:],
+    )
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.ManyToManyFieldModel")
+    ws.append(["id", "to_pk_model_field", "to_nk_model_field"])
+    ws.append([1, "[1, 2]", "[]"])
+    ws.append([2, "[2, 3]", "[]"])
+    wb.save(fixture_path)
+
+    # Act.
+    with CaptureQueriesContext(connection) as context:
+        load(fixture_path)
+
+    # Assert.
+    assert (
+        _count_inserts(
+            context,
+            ManyToManyFieldModel.to_pk_model_field.through._meta.db_table,
+        )
+        == 1
+    )
+    assert [
+        list(obj.to_pk_model_field.order_by("pk").values_list("pk", flat=True))
+        for obj in ManyToManyFieldModel._default_manager.order_by("pk")
+    ] == [[1, 2], [2, 3]]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_sets_many_to_many_relations_of_objects_without_primary_keys(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    for pk in (1, 2, 3):
+        PrimaryKeyModel._default_manager.create(pk=pk)
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.ManyToManyFieldModel")
+    ws.append(["to_pk_model_field", "to_nk_model_field"])
+    ws.append(["[1, 2]", "[]"])
+    ws.append(["[2, 3]", "[]"])
+    wb.save(fixture_path)
+
+    # Act.
+    load(fixture_path)
+
+    # Assert.
+    assert [
+        list(obj.to_pk_model_field.order_by("pk").values_list("pk", flat=True))
+        for obj in ManyToManyFieldModel._default_manager.order_by("pk")
+    ] == [[1, 2], [2, 3]]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_keeps_database_unchanged_if_loading_fails(fixture_path: Path) -> None:
+    # Arrange.
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.DummyModel")
+    ws.append(["id"])
+    ws.append([1])
+    ws = wb.create_sheet("tests.ManyToManyFieldModel")
+    ws.append(["id", "to_pk_model_field", "to_nk_model_field"])
+    ws.append([1, "[42]", "[]"])
+    wb.save(fixture_path)
+
+    # Act & assert.
+    with pytest.raises(IntegrityError):
+        load(fixture_path)
+    assert not DummyModel._default_manager.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_inserts_batches_concurrently_if_workers_option_is_set(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.DummyModel")
+    ws.append(["id"])
+    for pk in range(1, 6):
+        ws.append([pk])
+    ws = wb.create_sheet("tests.CyclicForeignKeyModelA")
+    ws.append(["id", "to_b_model_field"])
+    ws.append([1, 2])
+    ws.append([2, 1])
+    ws = wb.create_sheet("tests.CyclicForeignKeyModelB")
+    ws.append(["id", "to_a_model_field"])
+    ws.append([1, 2])
+    ws.append([2, 1])
+    wb.save(fixture_path)
+
+    executor = ThreadPoolExecutor(max_workers=4)
+    submit = executor.submit
+
+    def _submit(fn: Callable[..., Any], *args: Any) -> Future[Any]:
+        # The in-memory SQLite test database locks its tables for concurrent writes,
+        # so the batches are inserted one at a time there (still over the pool's
+        # threads, each with its own connection and transaction).
+        future = submit(fn, *args)
+        if connection.vendor == "sqlite":
+            wait([future])
+
+        return future
+
+    # Act.
+    with (
+        mock.patch(
+            "xlsx_serializer.bulk.ThreadPoolExecutor",
+            return_value=executor,
+        ) as executor_mock,
+        mock.patch.object(executor, "submit", side_effect=_submit) as submit_mock,
+        pytest.warns(RuntimeWarning, match="due to a cycle"),
+    ):
+        object_count = load(fixture_path, batch_size=2, workers=4)
+
+    # Assert.
+    assert executor_mock.call_args.kwargs["max_workers"] == 4
+    assert submit_mock.call_count == 3
+    assert object_count == 9
+    assert list(
+        DummyModel._default_manager.order_by("pk").values_list("pk", flat=True),
+    ) == [1, 2, 3, 4, 5]
+    assert list(
+        CyclicForeignKeyModelA._default_manager.order_by("pk").values_list(
+            "pk",
+            "to_b_model_field",
+        ),
+    ) == [(1, 2), (2, 1)]
+    assert list(
+        CyclicForeignKeyModelB._default_manager.order_by("pk").values_list(
+            "pk",
+            "to_a_model_field",
+        ),
+    ) == [(1, 2), (2, 1)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_inserts_batches_sequentially_inside_transaction(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.DummyModel")
+    ws.append(["id"])
+    ws.append([1])
+    wb.save(fixture_path)
+
+    # Act.
+    with (
+        mock.patch("xlsx_serializer.bulk.ThreadPoolExecutor") as executor_mock,
+        transaction.atomic(),
+    ):
+        object_count = load(fixture_path, workers=4)
+
+    # Assert.
+    executor_mock.assert_not_called()
+    assert object_count == 1
@@ -1,19 +1,46 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import io
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, TYPE_CHECKING, Any
+from unittest import mock
 
 import openpyxl
 import pytest
+from openpyxl.worksheet.worksheet import Worksheet
 
+from django.core.serializers import serialize
+from django.core.serializers.base import DeserializationError
 from django.db import IntegrityError
+from django.test.utils import override_settings
 
-from xlsx_serializer.core import Deserializer
+from xlsx_serializer.core import (
+    Deserializer,
+    _get_load_plan,
+    _get_row_ranges,
+)
 
-from tests.models import BlankFieldModel, DummyModel, NullFieldModel
+from tests.models import (
+    BlankFieldModel,
+    CyclicForeignKeyDependentModel,
+    CyclicForeignKeyModelA,
+    CyclicForeignKeyModelB,
+    DummyModel,
+    DummyModelA,
+    DummyModelB,
+    ForeignKeyModel,
+    ManyToManyFieldModel,
+    NaturalKeyModel,
+    NullFieldModel,
+    PrimaryKeyModel,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
     from pathlib import Path
 
+    from typing_extensions import Self
+
 
 @pytest.mark.parametrize(
     "sheet_name",
@@ -173,3 +200,634 @@ def test_django_handles_empty_non_nullable_fields(
     # Assert.
     with pytest.raises(IntegrityError):
         deserialized_object.save()
+
+
+def test_deserializer_reads_continuation_sheets(fixture_path: Path) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    for sheet_name, pk in [("tests.DummyModel", 1), ("tests.DummyModel (2)", 2)]:
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet["A1"].value = "id"
+        worksheet["A2"].value = pk
+    workbook.save(fixture_path)
+
+    # Act.
+    deserialized_objects = list(Deserializer(fixture_path))
+
+    # Assert.
+    assert [
+        (type(deserialized_object.object), deserialized_object.object.pk)
+        for deserialized_object in deserialized_objects
+    ] == [(DummyModel, 1), (DummyModel, 2)]
+
+
+@pytest.mark.parametrize("writer", ["openpyxl", "xml"])
+@pytest.mark.django_db
+def test_deserializer_reads_continuation_sheets_interleaved_with_other_models(
+    fixture_path: Path,
+    writer: str,
+) -> None:
+    # Arrange.
+    obj_a_1, obj_a_2 = (DummyModelA._default_manager.create() for _ in range(2))
+    obj_b = DummyModelB._default_manager.create()
+    obj_a_3 = DummyModelA._default_manager.create()
+    with mock.patch("xlsx_serializer.core.SHEET_MAX_ROWS", 3):
+        serialize(
+            "xlsx",
+            [obj_a_1, obj_a_2, obj_b, obj_a_3],
+            stream=fixture_path,
+            writer=writer,
+        )
+
+    # Act.
+    deserialized_objects = list(Deserializer(fixture_path))
+
+    # Assert.
+    assert openpyxl.load_workbook(fixture_path, read_only=True).sheetnames == [
+        "tests.DummyModelA",
+        "tests.DummyModelB",
+        "tests.DummyModelA (2)",
+    ]
+    assert [
+        deserialized_object.object for deserialized_object in deserialized_objects
+    ] == [obj_a_1, obj_a_2, obj_a_3, obj_b]
+
+
+def test_deserializer_ignores_continuation_sheets_out_of_order(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    for sheet_name, pk in [("tests.DummyModel", 1), ("tests.DummyModel (3)", 3)]:
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet["A1"].value = "id"
+        worksheet["A2"].value = pk
+    workbook.save(fixture_path)
+
+    # Act.
+    deserialized_objects = list(Deserializer(fixture_path))
+
+    # Assert.
+    assert [
+        deserialized_object.object.pk for deserialized_object in deserialized_objects
+    ] == [1]
+
+
+@pytest.mark.parametrize(
+    ("options", "settings_overrides"),
+    [
+        ({"read_only": True}, {}),
+        ({}, {"XLSX_SERIALIZER_READ_ONLY": True}),
+    ],
+    ids=["option", "setting"],
+)
+def test_deserializer_loads_read_only_workbook_if_read_only_mode_is_enabled(
+    fixture_path: Path,
+    options: dict[str, Any],
+    settings_overrides: dict[str, Any],
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.create_sheet("tests.DummyModel")
+    worksheet["A1"].value = "id"
+    worksheet["A2"].value = 1
+    workbook.save(fixture_path)
+
+    # Act.
+    with (
+        override_settings(**settings_overrides),
+        mock.patch(
+            "xlsx_serializer.core.openpyxl.load_workbook",
+            wraps=openpyxl.load_workbook,
+        ) as load_workbook_mock,
+    ):
+        deserialized_objects = list(Deserializer(fixture_path, **options))
+
+    # Assert.
+    load_workbook_mock.assert_called_once_with(fixture_path, read_only=True)
+    assert [
+        deserialized_object.object.pk for deserialized_object in deserialized_objects
+    ] == [1]
+
+
+def test_deserializer_reads_read_only_workbook_with_empty_top_rows_and_left_columns(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.create_sheet("tests.DummyModel")
+    worksheet["B2"].value = "id"
+    worksheet["B3"].value = 1
+    worksheet["C2"].value = "not_a_field"
+    worksheet["C3"].value = None
+    workbook.save(fixture_path)
+
+    # Act.
+    deserialized_objects = list(Deserializer(fixture_path, read_only=True))
+
+    # Assert.
+    assert [
+        deserialized_object.object.pk for deserialized_object in deserialized_objects
+    ] == [1]
+
+
+def test_deserializer_closes_read_only_workbook_after_iteration(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.create_sheet("tests.DummyModel")
+    worksheet["A1"].value = "id"
+    worksheet["A2"].value = 1
+    workbook.save(fixture_path)
+    read_only_workbook = openpyxl.load_workbook(fixture_path, read_only=True)
+
+    # Act.
+    with (
+        mock.patch(
+            "xlsx_serializer.core.openpyxl.load_workbook",
+            return_value=read_only_workbook,
+        ),
+        mock.patch.object(
+            read_only_workbook,
+            "close",
+            wraps=read_only_workbook.close,
+        ) as close_mock,
+    ):
+        list(Deserializer(fixture_path, read_only=True))
+
+    # Assert.
+    close_mock.assert_called_once()
+
+
+def test_deserializer_yields_objects_row_by_row(fixture_path: Path) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.create_sheet("tests.DummyModel")
+    worksheet.append(["id"])
+    worksheet.append([1])
+    worksheet.append(["not_a_primary_key"])
+    workbook.save(fixture_path)
+
+    # Act.
+    deserializer = iter(Deserializer(fixture_path, read_only=True))
+    deserialized_object = next(deserializer)
+
+    # Assert.
+    assert deserialized_object.object.pk == 1
+    with pytest.raises(DeserializationError):
+        next(deserializer)
+
+
+@pytest.mark.parametrize("read_only", [False, True], ids=["default", "read_only"])
+def test_deserializer_reads_field_columns_without_modifying_sheet(
+    fixture_path: Path,
+    read_only: bool,
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.create_sheet("tests.NaturalKeyModel")
+    worksheet.append([])
+    worksheet.append([None, "notes", "nk_field_1", "notes", "id", "nk_field_2"])
+    worksheet.append([None, "note", "value", None, 1, 42])
+    workbook.save(fixture_path)
+
+    # Act.
+    with (
+        mock.patch.object(Worksheet, "delete_rows") as delete_rows_mock,
+        mock.patch.object(Worksheet, "delete_cols") as delete_cols_mock,
+    ):
+        objects = [
+            deserialized_object.object
+            for deserialized_object in Deserializer(fixture_path, read_only=read_only)
+        ]
+
+    # Assert.
+    delete_rows_mock.assert_not_called()
+    delete_cols_mock.assert_not_called()
+    assert [
+        (nk_object.pk, nk_object.nk_field_1, nk_object.nk_field_2)
+        for nk_object in objects
+        if isinstance(nk_object, NaturalKeyModel)
+    ] == [(1, "value", 42)]
+
+
+def test_deserializer_skips_sheet_without_header(fixture_path: Path) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    workbook.create_sheet("tests.DummyModel")
+    workbook.save(fixture_path)
+
+    # Act.
+    deserialized_objects = list(Deserializer(fixture_path))
+
+    # Assert.
+    assert deserialized_objects == []
+
+
+def test_deserializer_compiles_load_plan_once_per_model_and_header(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    for sheet_name, header, pks in [
+        ("tests.DummyModel", ["id"], [1, 2]),
+        ("tests.DummyModel (2)", ["id"], [3, 4]),
+        ("tests.DummyModel (3)", ["id", "notes"], [5, 6]),
+    ]:
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(header)
+        for pk in pks:
+            worksheet.append([pk])
+    workbook.save(fixture_path)
+
+    # Act.
+    with mock.patch(
+        "xlsx_serializer.core._get_load_plan",
+        wraps=_get_load_plan,
+    ) as get_load_plan_mock:
+        deserialized_objects = list(Deserializer(fixture_path))
+
+    # Assert.
+    assert get_load_plan_mock.call_count == 2
+    assert len(deserialized_objects) == 6
+
+
+@pytest.mark.parametrize(
+    "wrap",
+    [bytes, bytearray, memoryview, io.BytesIO],
+    ids=["bytes", "bytearray", "memoryview", "binary_file_object"],
+)
+@pytest.mark.parametrize("read_only", [False, True], ids=["default", "read_only"])
+def test_deserializer_reads_workbook_from_memory(
+    fixture_path: Path,
+    wrap: Callable[[bytes], Any],
+    read_only: bool,
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.create_sheet("tests.DummyModel")
+    worksheet["A1"].value = "id"
+    worksheet["A2"].value = 1
+    workbook.save(fixture_path)
+
+    # Act.
+    deserialized_objects = list(
+        Deserializer(wrap(fixture_path.read_bytes()), read_only=read_only),
+    )
+
+    # Assert.
+    assert [
+        deserialized_object.object.pk for deserialized_object in deserialized_objects
+    ] == [1]
+
+
+def test_deserializer_reads_workbook_from_non_seekable_stream(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.create_sheet("tests.DummyModel")
+    worksheet["A1"].value = "id"
+    worksheet["A2"].value = 1
+    workbook.save(fixture_path)
+    stream = mock.Mock(spec=["read", "seekable"])
+    stream.read.return_value = fixture_path.read_bytes()
+    stream.seekable.return_value = False
+
+    # Act.
+    deserialized_objects = list(Deserializer(stream))
+
+    # Assert.
+    assert [
+        deserialized_object.object.pk for deserialized_object in deserialized_objects
+    ] == [1]
+
+
+@pytest.mark.django_db
+def test_deserializer_reads_workbook_returned_by_serializer() -> None:
+    # Arrange.
+    obj = NaturalKeyModel._default_manager.create(nk_field_1="value", nk_field_2=42)
+    workbook = serialize("xlsx", [obj])
+
+    # Act.
+    with mock.patch("xlsx_serializer.core.openpyxl.load_workbook") as load_mock:
+        objects = [
+            deserialized_object.object
+            for deserialized_object in Deserializer(workbook, read_only=True)
+        ]
+
+    # Assert.
+    load_mock.assert_not_called()
+    assert [
+        (nk_object.pk, nk_object.nk_field_1, nk_object.nk_field_2)
+        for nk_object in objects
+        if isinstance(nk_object, NaturalKeyModel)
+    ] == [(obj.pk, "value", 42)]
+
+
+def test_deserializer_raises_error_if_workbook_is_write_only() -> None:
+    # Act & assert.
+    with pytest.raises(
+        DeserializationError,
+        match="write-only workbooks can't be deserialized",
+    ):
+        Deserializer(openpyxl.Workbook(write_only=True))
+
+
+@pytest.mark.parametrize(
+    "stream",
+    [io.StringIO(), 42],
+    ids=["text_stream", "integer"],
+)
+def test_deserializer_raises_error_if_stream_is_invalid(stream: Any) -> None:
+    # Act & assert.
+    with pytest.raises(DeserializationError):
+        Deserializer(stream)
+
+
+def test_deserializer_sorts_models_by_dependencies(fixture_path: Path) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    for sheet_name in [
+        "tests.DummyModel",
+        "tests.ManyToManyFieldModel",
+        "tests.ForeignKeyModel",
+        "tests.NaturalKeyModel",
+        "tests.PrimaryKeyModel",
+    ]:
+        workbook.create_sheet(sheet_name).append(["id"])
+        workbook[sheet_name].append([1])
+    workbook.save(fixture_path)
+
+    # Act.
+    deserialized_objects = list(Deserializer(fixture_path))
+
+    # Assert.
+    assert [
+        type(deserialized_object.object) for deserialized_object in deserialized_objects
+    ] == [
+        DummyModel,
+        NaturalKeyModel,
+        PrimaryKeyModel,
+        ManyToManyFieldModel,
+        ForeignKeyModel,
+    ]
+
+
+def test_deserializer_warns_if_models_depend_on_each_other(fixture_path: Path) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    for sheet_name in [
+        "tests.CyclicForeignKeyModelB",
+        "tests.CyclicForeignKeyModelA",
+        "tests.DummyModel",
+    ]:
+        workbook.create_sheet(sheet_name).append(["id"])
+        workbook[sheet_name].append([1])
+    workbook.save(fixture_path)
+
+    # Act.
+    with pytest.warns(
+        RuntimeWarning,
+        match=(
+            r"the models can't be sorted by their dependencies due to a cycle "
+            r"\(tests\.CyclicForeignKeyModel[AB] -> tests\.CyclicForeignKeyModel[AB] "
+            r"-> tests\.CyclicForeignKeyModel[AB]\)"
+        ),
+    ):
+        deserialized_objects = list(Deserializer(fixture_path))
+
+    # Assert.
+    assert [
+        type(deserialized_object.object) for deserialized_object in deserialized_objects
+    ] == [DummyModel, CyclicForeignKeyModelB, CyclicForeignKeyModelA]
+
+
+def test_deserializer_sorts_models_depending_on_cycle_after_it(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    for sheet_name in [
+        "tests.CyclicForeignKeyDependentModel",
+        "tests.CyclicForeignKeyModelB",
+        "tests.CyclicForeignKeyModelA",
+    ]:
+        workbook.create_sheet(sheet_name).append(["id"])
+        workbook[sheet_name].append([1])
+    workbook.save(fixture_path)
+
+    # Act.
+    with pytest.warns(RuntimeWarning, match="due to a cycle"):
+        deserialized_objects = list(Deserializer(fixture_path))
+
+    # Assert.
+    assert [
+        type(deserialized_object.object) for deserialized_object in deserialized_objects
+    ] == [
+        CyclicForeignKeyModelB,
+        CyclicForeignKeyModelA,
+        CyclicForeignKeyDependentModel,
+    ]
+
+
+@pytest.mark.parametrize(
+    "wrap",
+    [lambda path: path, lambda path: path.read_bytes()],
+    ids=["path", "bytes"],
+)
+def test_deserializer_reads_sheets_in_parallel_if_workers_option_is_set(
+    fixture_path: Path,
+    wrap: Callable[[Path], Any],
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    for sheet_name, pks in [
+        ("tests.DummyModel", [1, 2]),
+        ("tests.DummyModel (2)", [3]),
+        ("tests.PrimaryKeyModel", [4, 5]),
+    ]:
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(["id"])
+        for pk in pks:
+            worksheet.append([pk])
+    workbook.save(fixture_path)
+
+    # Act.
+    with mock.patch(
+        "xlsx_serializer.core.ProcessPoolExecutor",
+        wraps=ProcessPoolExecutor,
+    ) as executor_mock:
+        deserialized_objects = list(Deserializer(wrap(fixture_path), workers=4))
+
+    # Assert.
+    assert executor_mock.call_args.kwargs["max_workers"] == 3
+    assert [
+        (type(deserialized_object.object), deserialized_object.object.pk)
+        for deserialized_object in deserialized_objects
+    ] == [
+        (DummyModel, 1),
+        (DummyModel, 2),
+        (DummyModel, 3),
+        (PrimaryKeyModel, 4),
+        (PrimaryKeyModel, 5),
+    ]
+
+
+class SynchronousExecutor:
+    def __init__(self, max_workers: int, initializer: Callable[[], None]) -> None:
+        self.tasks: list[Any] = []
+
+        initializer()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def map(self, fn: Callable[[Any], Any], iterable: Iterable[Any]) -> Iterator[Any]:
+        self.tasks += iterable
+
+        return map(fn, self.tasks)
+
+
+@pytest.mark.parametrize(
+    "wrap",
+    [lambda file: file.read(), lambda file: file],
+    ids=["bytes", "file_object"],
+)
+def test_deserializer_passes_spooled_workbook_path_to_workers(
+    fixture_path: Path,
+    wrap: Callable[[IO[bytes]], Any],
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    for sheet_name in ["tests.DummyModel", "tests.PrimaryKeyModel"]:
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(["id"])
+        worksheet.append([1])
+    workbook.save(fixture_path)
+
+    executors: list[SynchronousExecutor] = []
+
+    def _create_executor(**kwargs: Any) -> SynchronousExecutor:
+        executors.append(executor := SynchronousExecutor(**kwargs))
+        return executor
+
+    # Act.
+    with (
+        fixture_path.open("rb") as file,
+        mock.patch(
+            "xlsx_serializer.core.ProcessPoolExecutor",
+            side_effect=_create_executor,
+        ),
+    ):
+        deserialized_objects = list(Deserializer(wrap(file), workers=2))
+
+    # Assert.
+    assert len(deserialized_objects) == 2
+    assert len({task.source for task in executors[0].tasks}) == 1
+    source = executors[0].tasks[0].source
+    assert source != fixture_path
+    assert source.suffix == ".xlsx"
+    assert not source.exists()
+
+
+@override_settings(XLSX_SERIALIZER_WORKERS=2)
+def test_deserializer_reads_workers_from_settings(fixture_path: Path) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    for sheet_name in ["tests.DummyModel", "tests.PrimaryKeyModel"]:
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(["id"])
+        worksheet.append([1])
+    workbook.save(fixture_path)
+
+    # Act.
+    with mock.patch(
+        "xlsx_serializer.core.ProcessPoolExecutor",
+        wraps=ProcessPoolExecutor,
+    ) as executor_mock:
+        deserialized_objects = list(Deserializer(fixture_path))
+
+    # Assert.
+    executor_mock.assert_called_once()
+    assert len(deserialized_objects) == 2
+
+
+def test_deserializer_reads_single_sheet_without_process_pool(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.create_sheet("tests.DummyModel")
+    worksheet.append(["id"])
+    worksheet.append([1])
+    workbook.save(fixture_path)
+
+    # Act.
+    with mock.patch("xlsx_serializer.core.ProcessPoolExecutor") as executor_mock:
+        deserialized_objects = list(Deserializer(fixture_path, workers=2))
+
+    # Assert.
+    executor_mock.assert_not_called()
+    assert len(deserialized_objects) == 1
+
+
+@pytest.mark.parametrize(
+    ("header_row", "max_row", "parts", "expected_row_ranges"),
+    [
+        (1, None, 4, [(2, None)]),
+        (1, 1, 4, []),
+        (1, 10_001, 4, [(2, None)]),
+        (1, 25_001, 4, [(2, 12_501), (12_502, None)]),
+        (
+            3,
+            40_002,
+            4,
+            [(4, 13_336), (13_337, 26_669), (26_670, None)],
+        ),
+    ],
+)
+def test_get_row_ranges_splits_rows_following_header(
+    header_row: int,
+    max_row: int | None,
+    parts: int,
+    expected_row_ranges: list[tuple[int, int | None]],
+) -> None:
+    # Act.
+    row_ranges = _get_row_ranges(header_row, max_row, parts)
+
+    # Assert.
+    assert row_ranges == expected_row_ranges
+
+
+def test_deserializer_reads_single_sheet_in_parallel_by_row_ranges(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.create_sheet("tests.DummyModel")
+    worksheet.append([])
+    worksheet.append(["id"])
+    for pk in range(1, 8):
+        worksheet.append([pk])
+    workbook.save(fixture_path)
+
+    # Act.
+    with (
+        mock.patch("xlsx_serializer.core.ROW_RANGE_MIN_SIZE", 2),
+        mock.patch(
+            "xlsx_serializer.core.ProcessPoolExecutor",
+            wraps=ProcessPoolExecutor,
+        ) as executor_mock,
+    ):
+        deserialized_objects = list(Deserializer(fixture_path, workers=3))
+
+    # Assert.
+    assert executor_mock.call_args.kwargs["max_workers"] == 3
+    assert [
+        deserialized_object.object.pk for deserialized_object in deserialized_objects
+    ] == [1, 2, 3, 4, 5, 6, 7]
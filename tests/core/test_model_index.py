@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from django.apps import apps
+
+from xlsx_serializer.core import _get_model, _ModelIndex
+
+from tests.models import DummyModel
+
+
+def test_model_index_is_reused_while_app_registry_is_unchanged() -> None:
+    # Act.
+    model_index_1 = _ModelIndex.get()
+    model_index_2 = _ModelIndex.get()
+
+    # Assert.
+    assert model_index_1 is model_index_2
+
+
+def test_model_index_is_rebuilt_if_app_registry_cache_is_cleared() -> None:
+    # Arrange.
+    model_index = _ModelIndex.get()
+
+    # Act.
+    apps.clear_cache()
+
+    # Assert.
+    assert _ModelIndex.get() is not model_index
+
+
+def test_model_index_is_not_rebuilt_by_model_lookups() -> None:
+    # Arrange.
+    _ModelIndex.get()
+
+    # Act.
+    with mock.patch.object(_ModelIndex, "__init__") as model_index_init_mock:
+        _get_model("tests.DummyModel")
+        _get_model("DummyModel")
+
+    # Assert.
+    model_index_init_mock.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "model_identifier",
+    [
+        "tests.DummyModel",
+        "tests.dummymodel",
+        "DummyModel",
+        "dummymodel",
+    ],
+)
+def test_model_is_found_by_model_identifier(model_identifier: str) -> None:
+    # Act & assert.
+    assert _get_model(model_identifier) is DummyModel
+
+
+def test_model_label_index_is_used_for_default_sheet_names() -> None:
+    # Act & assert.
+    assert _ModelIndex.get().labels[DummyModel] == "tests.DummyModel"
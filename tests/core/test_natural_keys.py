@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import openpyxl
+import pytest
+
+from django.core.serializers import deserialize
+from django.core.serializers.base import DeserializationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from xlsx_serializer.natural_keys import NaturalKeyResolver, get_natural_key_fields
+
+from tests.models import (
+    ForeignKeyModel,
+    ManyToManyFieldModel,
+    NaturalKeyModel,
+    PrimaryKeyModel,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_get_natural_key_fields_infers_fields_from_natural_key() -> None:
+    # Act.
+    natural_key_fields = get_natural_key_fields(NaturalKeyModel)
+
+    # Assert.
+    assert natural_key_fields == (
+        NaturalKeyModel._meta.get_field("nk_field_1"),
+        NaturalKeyModel._meta.get_field("nk_field_2"),
+    )
+
+
+def test_get_natural_key_fields_returns_none_if_model_has_no_natural_key() -> None:
+    # Act.
+    natural_key_fields = get_natural_key_fields(PrimaryKeyModel)
+
+    # Assert.
+    assert natural_key_fields is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("object_count", [1, 10])
+def test_deserializer_resolves_natural_foreign_keys_in_bulk(
+    fixture_path: Path,
+    object_count: int,
+) -> None:
+    # Arrange.
+    pk_object = PrimaryKeyModel._default_manager.create()
+    for index in range(object_count):
+        NaturalKeyModel._default_manager.create(nk_field_1=str(index), nk_field_2=index)
+
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.ForeignKeyModel")
+    ws.append(["id", "to_pk_model_field", "to_nk_model_field"])
+    for index in range(object_count):
+        ws.append([index + 1, pk_object.pk, f"('{index}', {index})"])
+    wb.save(fixture_path)
+
+    # Act.
+    with CaptureQueriesContext(connection) as context:
+        objects = [
+            deserialized_object.object
+            for deserialized_object in deserialize("xlsx", fixture_path)
+        ]
+
+    # Assert.
+    assert len(context.captured_queries) == 1
+    assert [
+        obj.to_nk_model_field_id for obj in objects if isinstance(obj, ForeignKeyModel)
+    ] == list(
+        NaturalKeyModel._default_manager.order_by("pk").values_list("pk", flat=True),
+    )
+
+
+@pytest.mark.django_db
+def test_deserializer_resolves_natural_many_to_many_keys_in_bulk(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    nk_objects = [
+        NaturalKeyModel._default_manager.create(nk_field_1=str(index), nk_field_2=index)
+        for index in range(3)
+    ]
+
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.ManyToManyFieldModel")
+    ws.append(["id", "to_pk_model_field", "to_nk_model_field"])
+    ws.append([1, "[]", "[('0', 0), ('1', 1)]"])
+    ws.append([2, "[]", "[('1', 1), ('2', 2)]"])
+    wb.save(fixture_path)
+
+    # Act.
+    with CaptureQueriesContext(connection) as context:
+        m2m_data = [
+            (deserialized_object.m2m_data or {}).get("to_nk_model_field")
+            for deserialized_object in deserialize("xlsx", fixture_path)
+        ]
+
+    # Assert.
+    assert len(context.captured_queries) == 1
+    assert m2m_data == [
+        [nk_objects[0].pk, nk_objects[1].pk],
+        [nk_objects[1].pk, nk_objects[2].pk],
+    ]
+
+
+@pytest.mark.django_db
+def test_deserializer_falls_back_to_get_by_natural_key_if_key_is_unresolved(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    pk_object = PrimaryKeyModel._default_manager.create()
+
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.ForeignKeyModel")
+    ws.append(["id", "to_pk_model_field", "to_nk_model_field"])
+    ws.append([1, pk_object.pk, "('missing', 0)"])
+    wb.save(fixture_path)
+
+    # Act & Assert.
+    with pytest.raises(DeserializationError, match="matching query does not exist"):
+        list(deserialize("xlsx", fixture_path))
+
+
+@pytest.mark.django_db
+def test_resolver_evicts_least_recently_used_natural_keys() -> None:
+    # Arrange.
+    nk_objects = [
+        NaturalKeyModel._default_manager.create(nk_field_1=str(index), nk_field_2=index)
+        for index in range(3)
+    ]
+    field = ForeignKeyModel._meta.get_field("to_nk_model_field")
+    resolver = NaturalKeyResolver("default", cache_size=2)
+
+    def _resolve(*natural_keys: tuple[str, int]) -> list[object]:
+        objects: list[dict[str, Any]] = [
+            {"model": "tests.foreignkeymodel", "fields": {field.name: natural_key}}
+            for natural_key in natural_keys
+        ]
+        resolver.resolve([field], objects)
+
+        return [obj["fields"][field.name] for obj in objects]
+
+    # Act.
+    with CaptureQueriesContext(connection) as context:
+        first = _resolve(("0", 0), ("1", 1))
+        second = _resolve(("2", 2), ("1", 1))
+        third = _resolve(("0", 0))
+
+    # Assert.
+    assert len(context.captured_queries) == 3
+    assert first == [nk_objects[0].pk, nk_objects[1].pk]
+    assert second == [nk_objects[2].pk, nk_objects[1].pk]
+    assert third == [nk_objects[0].pk]
+
+
+def test_resolver_ignores_fields_of_models_without_natural_key() -> None:
+    # Arrange.
+    resolver = NaturalKeyResolver("default")
+
+    # Act.
+    fields = resolver.get_relation_fields(
+        ManyToManyFieldModel,
+        ["id", "to_pk_model_field", "to_nk_model_field"],
+    )
+
+    # Assert.
+    assert fields == [ManyToManyFieldModel._meta.get_field("to_nk_model_field")]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("object_count", [1, 10])
+def test_deserializer_prefetches_natural_primary_keys_if_enabled(
+    fixture_path: Path,
+    object_count: int,
+) -> None:
+    # Arrange.
+    nk_objects = [
+        NaturalKeyModel._default_manager.create(nk_field_1=str(index), nk_field_2=index)
+        for index in range(object_count)
+    ]
+
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.NaturalKeyModel")
+    ws.append(["nk_field_1", "nk_field_2"])
+    for index in range(object_count):
+        ws.append([str(index), index])
+    wb.save(fixture_path)
+
+    # Act.
+    with CaptureQueriesContext(connection) as context:
+        objects = [
+            deserialized_object.object
+            for deserialized_object in deserialize(
+                "xlsx",
+                fixture_path,
+                prefetch_natural_primary_keys=True,
+            )
+        ]
+
+    # Assert.
+    assert len(context.captured_queries) == 1
+    assert [obj.pk for obj in objects] == [nk_object.pk for nk_object in nk_objects]
+
+
+@pytest.mark.django_db
+@override_settings(XLSX_SERIALIZER_PREFETCH_NATURAL_PRIMARY_KEYS=True)
+def test_deserializer_looks_up_missing_natural_primary_keys_one_by_one(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    nk_object = NaturalKeyModel._default_manager.create(nk_field_1="0", nk_field_2=0)
+
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.NaturalKeyModel")
+    ws.append(["nk_field_1", "nk_field_2"])
+    ws.append(["0", 0])
+    ws.append(["1", 1])
+    wb.save(fixture_path)
+
+    # Act.
+    with CaptureQueriesContext(connection) as context:
+        objects = [
+            deserialized_object.object
+            for deserialized_object in deserialize("xlsx", fixture_path)
+        ]
+
+    # Assert.
+    assert len(context.captured_queries) == 2
+    assert [obj.pk for obj in objects] == [nk_object.pk, None]
+
+
+@pytest.mark.django_db
+def test_deserializer_looks_up_natural_primary_keys_one_by_one_by_default(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    for index in range(3):
+        NaturalKeyModel._default_manager.create(nk_field_1=str(index), nk_field_2=index)
+
+    wb = openpyxl.Workbook()
+    ws = wb.create_sheet("tests.NaturalKeyModel")
+    ws.append(["nk_field_1", "nk_field_2"])
+    for index in range(3):
+        ws.append([str(index), index])
+    wb.save(fixture_path)
+
+    # Act.
+    with CaptureQueriesContext(connection) as context:
+        list(deserialize("xlsx", fixture_path))
+
+    # Assert.
+    assert len(context.captured_queries) == 3
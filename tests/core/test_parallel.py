@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+from zipfile import ZIP_STORED, ZipFile
+
+import openpyxl
+import pytest
+
+from django.core.serializers.base import SerializationError
+
+from xlsx_serializer.parallel import dump
+
+from tests.models import (
+    DummyModel,
+    DummyModelA,
+    DummyModelB,
+    LabelLongerThan31CharactersModel,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
+
+    from typing_extensions import Self
+
+
+class SynchronousExecutor:
+    def __init__(self, max_workers: int, initializer: Callable[[], None]) -> None:
+        self.max_workers = max_workers
+
+        initializer()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def map(self, fn: Callable[[Any], Any], iterable: Iterable[Any]) -> Iterator[Any]:
+        return map(fn, iterable)
+
+
+@pytest.mark.parametrize("writer", ["openpyxl", "xml"])
+@pytest.mark.django_db
+def test_dump_merges_model_sheets_into_single_workbook(
+    fixture_path: Path,
+    writer: str,
+) -> None:
+    # Arrange.
+    obj_a_1 = DummyModelA._default_manager.create()
+    obj_a_2 = DummyModelA._default_manager.create()
+    obj_b = DummyModelB._default_manager.create()
+
+    # Act.
+    dump(
+        [DummyModelA, DummyModelB._default_manager.all()],
+        fixture_path,
+        workers=1,
+        writer=writer,
+    )
+
+    # Assert.
+    wb = openpyxl.load_workbook(fixture_path)
+    assert wb.sheetnames == ["tests.DummyModelA", "tests.DummyModelB"]
+    assert list(wb["tests.DummyModelA"].iter_rows(values_only=True)) == [
+        ("id",),
+        (obj_a_1.pk,),
+        (obj_a_2.pk,),
+    ]
+    assert list(wb["tests.DummyModelB"].iter_rows(values_only=True)) == [
+        ("id",),
+        (obj_b.pk,),
+    ]
+
+
+@pytest.mark.django_db
+def test_dump_exports_models_using_process_pool(fixture_path: Path) -> None:
+    # Arrange.
+    DummyModelA._default_manager.create()
+    DummyModelB._default_manager.create()
+
+    # Act.
+    with (
+        mock.patch(
+            "xlsx_serializer.parallel.ProcessPoolExecutor",
+            side_effect=SynchronousExecutor,
+        ) as executor_mock,
+        mock.patch("xlsx_serializer.parallel.connections") as connections_mock,
+    ):
+        dump([DummyModelA, DummyModelB], fixture_path, workers=4)
+
+    # Assert.
+    assert executor_mock.call_args.kwargs["max_workers"] == 2
+    connections_mock.close_all.assert_called_once()
+    assert openpyxl.load_workbook(fixture_path).sheetnames == [
+        "tests.DummyModelA",
+        "tests.DummyModelB",
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dump_exports_models_in_worker_processes(fixture_path: Path) -> None:
+    # Arrange.
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("the worker processes must be forked to share the test database")
+    obj_a = DummyModelA._default_manager.create()
+    obj_b = DummyModelB._default_manager.create()
+
+    # Act.
+    # The worker processes are forked, so they inherit the test database settings
+    # (spawned ones would set Django up from scratch).
+    with mock.patch(
+        "xlsx_serializer.parallel.ProcessPoolExecutor",
+        wraps=functools.partial(
+            ProcessPoolExecutor,
+            mp_context=multiprocessing.get_context("fork"),
+        ),
+    ) as executor_mock:
+        dump([DummyModelA, DummyModelB], fixture_path, workers=2)
+
+    # Assert.
+    assert executor_mock.call_args.kwargs["max_workers"] == 2
+    wb = openpyxl.load_workbook(fixture_path)
+    assert {
+        worksheet.title: list(worksheet.iter_rows(values_only=True)) for worksheet in wb
+    } == {
+        "tests.DummyModelA": [("id",), (obj_a.pk,)],
+        "tests.DummyModelB": [("id",), (obj_b.pk,)],
+    }
+
+
+@pytest.mark.django_db
+def test_dump_applies_sheet_names_from_model_sheet_names_option(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    DummyModel._default_manager.create()
+
+    # Act.
+    dump(
+        [DummyModel],
+        fixture_path,
+        workers=1,
+        model_sheet_names={"tests.DummyModel": "Dummies"},
+    )
+
+    # Assert.
+    assert openpyxl.load_workbook(fixture_path).sheetnames == ["Dummies"]
+
+
+@pytest.mark.django_db
+def test_dump_applies_shortened_sheet_name_if_model_label_is_too_long(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    LabelLongerThan31CharactersModel._default_manager.create()
+
+    # Act.
+    with pytest.warns(RuntimeWarning, match=r"fully qualified label is too long"):
+        dump([LabelLongerThan31CharactersModel], fixture_path, workers=1)
+
+    # Assert.
+    assert openpyxl.load_workbook(fixture_path).sheetnames == [
+        "LabelLongerThan31CharactersMode",
+    ]
+
+
+@pytest.mark.django_db
+def test_dump_skips_empty_models(fixture_path: Path) -> None:
+    # Arrange.
+    DummyModelB._default_manager.create()
+
+    # Act.
+    dump([DummyModelA, DummyModelB], fixture_path, workers=1)
+
+    # Assert.
+    assert openpyxl.load_workbook(fixture_path).sheetnames == ["tests.DummyModelB"]
+
+
+@pytest.mark.django_db
+def test_dump_warns_if_there_is_nothing_to_save(fixture_path: Path) -> None:
+    # Act & assert.
+    with pytest.warns(
+        RuntimeWarning,
+        match=r"the output workbook is empty, so it won't be saved",
+    ):
+        dump([DummyModel], fixture_path, workers=1)
+
+    # Assert.
+    assert not fixture_path.exists()
+
+
+@pytest.mark.django_db
+def test_dump_compresses_merged_workbook_as_selected(fixture_path: Path) -> None:
+    # Arrange.
+    DummyModelA._default_manager.create()
+    DummyModelB._default_manager.create()
+
+    # Act.
+    dump([DummyModelA, DummyModelB], fixture_path, workers=1, compression="stored")
+
+    # Assert.
+    with ZipFile(fixture_path) as archive:
+        assert {info.compress_type for info in archive.infolist()} == {ZIP_STORED}
+    assert openpyxl.load_workbook(fixture_path).sheetnames == [
+        "tests.DummyModelA",
+        "tests.DummyModelB",
+    ]
+
+
+def test_dump_raises_error_if_compression_is_not_supported(
+    fixture_path: Path,
+) -> None:
+    # Act & assert.
+    with pytest.raises(
+        SerializationError,
+        match=r"the compression 'unknown' isn't supported",
+    ):
+        dump([DummyModel], fixture_path, compression="unknown")
+
+
+def test_dump_raises_error_if_model_is_exported_more_than_once(
+    fixture_path: Path,
+) -> None:
+    # Act & assert.
+    with pytest.raises(
+        SerializationError,
+        match=r"each model can be exported to a single sheet only",
+    ):
+        dump([DummyModel, DummyModel._default_manager.all()], fixture_path)
+
+
+@pytest.mark.django_db
+def test_dump_merges_continuation_sheets(fixture_path: Path) -> None:
+    # Arrange.
+    objs = [DummyModel._default_manager.create() for _ in range(3)]
+
+    # Act.
+    with mock.patch("xlsx_serializer.core.SHEET_MAX_ROWS", 3):
+        dump([DummyModel], fixture_path, workers=1)
+
+    # Assert.
+    wb = openpyxl.load_workbook(fixture_path)
+    assert wb.sheetnames == ["tests.DummyModel", "tests.DummyModel (2)"]
+    assert list(wb["tests.DummyModel (2)"].iter_rows(values_only=True)) == [
+        ("id",),
+        (objs[2].pk,),
+    ]
+
+
+@pytest.mark.django_db
+def test_dump_raises_error_if_continuation_sheet_name_is_not_unique(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    DummyModelA._default_manager.create()
+    DummyModelA._default_manager.create()
+    DummyModelB._default_manager.create()
+
+    # Act & assert.
+    with (
+        mock.patch("xlsx_serializer.core.SHEET_MAX_ROWS", 2),
+        pytest.raises(
+            SerializationError,
+            match=r"the sheet name 'A \(2\)' isn't unique",
+        ),
+    ):
+        dump(
+            [DummyModelA, DummyModelB],
+            fixture_path,
+            workers=1,
+            model_sheet_names={"tests.DummyModelA": "A", "tests.DummyModelB": "A (2)"},
+        )
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import openpyxl
+import pytest
+from openpyxl.utils.datetime import MAC_EPOCH
+from openpyxl.worksheet.formula import ArrayFormula
+
+from django.core.serializers.base import DeserializationError
+from django.test.utils import override_settings
+
+from xlsx_serializer.core import Deserializer
+from xlsx_serializer.readers import READERS, XmlWorkbook, _ValueParser, get_reader
+
+from tests.models import DummyModel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_workbook(
+    fixture_path: Path,
+    *,
+    epoch: dt.datetime | None = None,
+    formulae: bool = True,
+) -> None:
+    workbook = openpyxl.Workbook()
+    if epoch is not None:
+        workbook.epoch = epoch
+
+    worksheet = workbook.worksheets[0]
+    worksheet.title = "Values"
+    worksheet.append(["int", "float", "str", "bool", "date", "time", "duration"])
+    worksheet.append(
+        [
+            1,
+            1.5,
+            "text",
+            True,
+            dt.datetime(2024, 2, 29, 12, 30),  # noqa: DTZ001
+            dt.time(8, 15),
+            dt.timedelta(days=1, hours=2),
+        ],
+    )
+    worksheet.append([-2, 1e-10, " padded ", False, dt.date(1999, 12, 31)])
+    if formulae:
+        worksheet["A6"] = "=SUM(A2:A3)"
+        worksheet["B6"] = ArrayFormula("B6:B6", "=SUM(B2:B3)")
+    worksheet["D8"] = "gap"
+
+    workbook.create_sheet("Empty")
+    dimensionless = workbook.create_sheet("Other")
+    dimensionless.append(["id"])
+    dimensionless.append([None, None, 3])
+
+    workbook.save(fixture_path)
+
+
+def _read_rows(workbook: Any, **kwargs: Any) -> dict[str, list[tuple[Any, ...]]]:
+    try:
+        return {
+            worksheet.title: [
+                tuple(
+                    (type(value), value.ref, value.text)
+                    if isinstance(value, ArrayFormula)
+                    else (type(value), value)
+                    for value in row
+                )
+                for row in worksheet.iter_rows(values_only=True, **kwargs)
+            ]
+            for worksheet in workbook
+        }
+    finally:
+        workbook.close()
+
+
+@pytest.mark.parametrize(
+    "epoch",
+    [None, MAC_EPOCH],
+    ids=["windows_epoch", "mac_epoch"],
+)
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"min_row": 2}, {"max_row": 3}, {"min_row": 3, "max_row": 10}],
+    ids=["all_rows", "min_row", "max_row", "row_range"],
+)
+@pytest.mark.parametrize("batch_size", [1, 64, 1 << 20])
+def test_xml_workbook_reads_same_rows_as_openpyxl(
+    fixture_path: Path,
+    epoch: dt.datetime | None,
+    kwargs: dict[str, Any],
+    batch_size: int,
+) -> None:
+    # Arrange.
+    _write_workbook(fixture_path, epoch=epoch)
+
+    # Act.
+    with mock.patch("xlsx_serializer.readers.ROW_BATCH_SIZE", batch_size):
+        rows = _read_rows(XmlWorkbook(fixture_path), **kwargs)
+
+    # Assert.
+    assert rows == _read_rows(
+        openpyxl.load_workbook(fixture_path, read_only=True),
+        **kwargs,
+    )
+
+
+def test_xml_workbook_skips_rows_before_min_row_without_decoding_cells(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.worksheets[0]
+    for day in range(1, 6):
+        worksheet.append([dt.date(2024, 1, day)])
+    workbook.save(fixture_path)
+
+    # Act.
+    with mock.patch.object(
+        _ValueParser,
+        "parse",
+        autospec=True,
+        side_effect=_ValueParser.parse,
+    ) as parse_mock:
+        rows = _read_rows(XmlWorkbook(fixture_path), min_row=4)
+
+    # Assert.
+    assert parse_mock.call_count == 2
+    assert rows == _read_rows(
+        openpyxl.load_workbook(fixture_path, read_only=True),
+        min_row=4,
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"min_row": 2}, {"max_row": 3}, {"min_row": 3, "max_row": 10}],
+    ids=["all_rows", "min_row", "max_row", "row_range"],
+)
+def test_calamine_workbook_reads_same_rows_as_openpyxl(
+    fixture_path: Path,
+    kwargs: dict[str, Any],
+) -> None:
+    # Arrange.
+    if "calamine" not in READERS:
+        pytest.skip("the 'calamine' reader isn't installed")
+    # Calamine reads the formulae's cached values (which openpyxl doesn't store).
+    _write_workbook(fixture_path, formulae=False)
+
+    # Act.
+    rows = _read_rows(get_reader("calamine")(fixture_path, read_only=True), **kwargs)
+
+    # Assert.
+    assert rows == _read_rows(
+        openpyxl.load_workbook(fixture_path, read_only=True),
+        **kwargs,
+    )
+
+
+def test_xml_workbook_lists_sheets(fixture_path: Path) -> None:
+    # Arrange.
+    _write_workbook(fixture_path)
+    workbook = XmlWorkbook(fixture_path)
+
+    # Act & Assert.
+    try:
+        assert workbook.sheetnames == ["Values", "Empty", "Other"]
+        assert workbook["Other"].title == "Other"
+        with pytest.raises(KeyError, match="Worksheet Missing does not exist"):
+            workbook["Missing"]
+        with pytest.raises(ValueError, match="reads the cells' values only"):
+            workbook["Other"].iter_rows(values_only=False)
+    finally:
+        workbook.close()
+
+
+def test_get_reader_raises_error_if_reader_is_not_supported() -> None:
+    # Act & Assert.
+    with pytest.raises(
+        DeserializationError,
+        match="the reader engine 'unknown' isn't supported",
+    ):
+        get_reader("unknown")
+
+
+@pytest.mark.parametrize(
+    ("options", "settings_overrides"),
+    [
+        ({"reader": "xml"}, {}),
+        ({}, {"XLSX_SERIALIZER_READER": "xml"}),
+    ],
+    ids=["option", "setting"],
+)
+@pytest.mark.django_db
+def test_deserializer_reads_workbook_with_selected_reader(
+    fixture_path: Path,
+    options: dict[str, Any],
+    settings_overrides: dict[str, Any],
+) -> None:
+    # Arrange.
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.create_sheet("tests.DummyModel")
+    worksheet.append(["id"])
+    worksheet.append([1])
+    worksheet.append([2])
+    workbook.save(fixture_path)
+
+    # Act.
+    with (
+        override_settings(**settings_overrides),
+        mock.patch(
+            "xlsx_serializer.core.openpyxl.load_workbook",
+        ) as load_workbook_mock,
+        mock.patch.object(
+            XmlWorkbook,
+            "close",
+            autospec=True,
+            side_effect=XmlWorkbook.close,
+        ) as close_mock,
+    ):
+        deserialized_objects = list(Deserializer(fixture_path, **options))
+
+    # Assert.
+    load_workbook_mock.assert_not_called()
+    close_mock.assert_called_once()
+    assert [
+        deserialized_object.object for deserialized_object in deserialized_objects
+    ] == [DummyModel(pk=1), DummyModel(pk=2)]
+
+
+def test_deserializer_raises_error_if_reader_is_not_supported(
+    fixture_path: Path,
+) -> None:
+    # Arrange.
+    openpyxl.Workbook().save(fixture_path)
+
+    # Act & Assert.
+    with pytest.raises(DeserializationError, match="isn't supported"):
+        Deserializer(fixture_path, reader="unknown")
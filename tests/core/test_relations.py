@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import ast
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from xlsx_serializer.relations import _parse_relation_cached, parse_relation
+
+
+@pytest.fixture(autouse=True)
+def _clear_relation_cache() -> None:
+    _parse_relation_cached.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "42",
+        "-1",
+        "('value', 42)",
+        '("it\'s", 42)',
+        "('value',)",
+        "()",
+        "[]",
+        "[1, 2]",
+        "[1, 2,]",
+        "[('value', 1), ('value', 2)]",
+        " [ (1, 2) , [3] ] ",
+    ],
+)
+def test_parse_relation_parses_serialized_literals_without_literal_eval(
+    value: str,
+) -> None:
+    # Act.
+    with mock.patch(
+        "xlsx_serializer.relations.ast.literal_eval",
+    ) as literal_eval_mock:
+        relation = parse_relation(value)
+
+    # Assert.
+    literal_eval_mock.assert_not_called()
+    assert relation == ast.literal_eval(value)
+    assert type(relation) is type(ast.literal_eval(value))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected_relation"),
+    [
+        ("(42)", 42),
+        ("1.5", 1.5),
+        ("None", None),
+        ("'escaped\\tstring'", "escaped\tstring"),
+        ("'implicitly' 'concatenated'", "implicitlyconcatenated"),
+        ("1, 2", (1, 2)),
+    ],
+)
+def test_parse_relation_falls_back_to_literal_eval_for_unusual_literals(
+    value: str,
+    expected_relation: Any,
+) -> None:
+    # Act.
+    with mock.patch(
+        "xlsx_serializer.relations.ast.literal_eval",
+        wraps=ast.literal_eval,
+    ) as literal_eval_mock:
+        relation = parse_relation(value)
+
+    # Assert.
+    literal_eval_mock.assert_called_once_with(value)
+    assert relation == expected_relation
+
+
+@pytest.mark.parametrize("value", ["01", "[1 2]", "(,)", "[1, 2", "not_a_literal"])
+def test_parse_relation_raises_error_if_literal_is_invalid(value: str) -> None:
+    # Act & assert.
+    with pytest.raises((SyntaxError, ValueError)):
+        parse_relation(value)
+
+
+def test_parse_relation_caches_parsed_literals() -> None:
+    # Act.
+    with mock.patch(
+        "xlsx_serializer.relations._parse_relation",
+        return_value=("value", 42),
+    ) as parse_relation_mock:
+        relations = [parse_relation("('value', 42)") for _ in range(3)]
+
+    # Assert.
+    parse_relation_mock.assert_called_once()
+    assert relations == [("value", 42)] * 3
+
+
+def test_parse_relation_returns_copies_of_cached_lists() -> None:
+    # Arrange.
+    relation = parse_relation("[1, 2]")
+
+    # Act.
+    relation.append(3)
+
+    # Assert.
+    assert parse_relation("[1, 2]") == [1, 2]
@@ -1,18 +1,30 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import io
+from typing import TYPE_CHECKING, Any
 from unittest import mock
 
+import openpyxl
 import pytest
 
 from django.core.serializers import serialize
 from django.core.serializers.base import SerializationError
+from django.test.utils import override_settings
+
+from xlsx_serializer.core import Serializer, _get_dump_plan, _iter_chunks
 
 from tests.models import (
     DummyModel,
+    DummyModelA,
+    DummyModelB,
+    ForeignKeyModel,
     LabelLongerThan31CharactersModel,
     LabelLongerThan31CharactersModelA,
     LabelLongerThan31CharactersModelB,
+    ManyToManyFieldModel,
+    NaturalKeyModel,
+    OrderedModel,
+    PrimaryKeyModel,
 )
 
 if TYPE_CHECKING:
@@ -35,7 +47,10 @@ def test_serializer_raises_error_if_stream_is_invalid() -> None:
     # Act & assert.
     with pytest.raises(
         SerializationError,
-        match=r"the stream must be a file path 'str' or 'pathlib.Path' object",
+        match=(
+            r"the stream must be a file path \('str' or 'pathlib.Path' object\) or "
+            r"a writable binary file object"
+        ),
     ):
         serialize("xlsx", [], stream=mock.ANY)
 
@@ -229,3 +244,472 @@ def test_serializer_removes_sheets_not_added_by_itself() -> None:
 
     # Assert.
     assert wb.sheetnames == ["tests.DummyModel"]
+
+
+@pytest.mark.django_db
+def test_serializer_uses_write_only_workbook_if_write_only_option_is_enabled() -> None:
+    # Arrange.
+    obj = DummyModel._default_manager.create()
+
+    # Act.
+    wb = serialize("xlsx", [obj], write_only=True)
+
+    # Assert.
+    assert wb.write_only
+    assert wb.sheetnames == ["tests.DummyModel"]
+
+
+@pytest.mark.django_db
+def test_serializer_uses_write_only_workbook_if_write_only_setting_is_enabled() -> None:
+    # Arrange.
+    obj = DummyModel._default_manager.create()
+
+    # Act.
+    with override_settings(XLSX_SERIALIZER_WRITE_ONLY=True):
+        wb = serialize("xlsx", [obj])
+
+    # Assert.
+    assert wb.write_only
+
+
+@pytest.mark.django_db
+def test_serializer_saves_write_only_workbook(fixture_path: Path) -> None:
+    # Arrange.
+    obj_1 = DummyModel._default_manager.create()
+    obj_2 = DummyModel._default_manager.create()
+
+    # Act.
+    serialize("xlsx", [obj_1, obj_2], stream=fixture_path, write_only=True)
+
+    # Assert.
+    ws = openpyxl.load_workbook(fixture_path)["tests.DummyModel"]
+    assert list(ws.iter_rows(values_only=True)) == [
+        ("id",),
+        (obj_1.pk,),
+        (obj_2.pk,),
+    ]
+
+
+@pytest.mark.django_db
+def test_serializer_compiles_dump_plan_once_per_model() -> None:
+    # Arrange.
+    objs = [
+        DummyModel._default_manager.create(),
+        DummyModel._default_manager.create(),
+        DummyModelA._default_manager.create(),
+    ]
+
+    # Act.
+    with mock.patch(
+        "xlsx_serializer.core._get_dump_plan",
+        wraps=_get_dump_plan,
+    ) as get_dump_plan_mock:
+        serialize("xlsx", objs)
+
+    # Assert.
+    assert get_dump_plan_mock.call_count == 2
+
+
+@pytest.mark.django_db
+def test_serializer_does_not_accumulate_python_objects() -> None:
+    # Arrange.
+    objs = [DummyModel._default_manager.create() for _ in range(3)]
+    serializer = Serializer()
+
+    # Act.
+    wb = serializer.serialize(objs)
+
+    # Assert.
+    assert serializer.objects == []
+    assert wb["tests.DummyModel"].max_row == 4
+
+
+@pytest.mark.django_db
+def test_serializer_writes_interleaved_objects_into_model_sheets() -> None:
+    # Arrange.
+    obj_1 = DummyModelA._default_manager.create()
+    obj_2 = DummyModelB._default_manager.create()
+    obj_3 = DummyModelA._default_manager.create()
+
+    # Act.
+    wb = serialize("xlsx", [obj_1, obj_2, obj_3])
+
+    # Assert.
+    assert wb.sheetnames == ["tests.DummyModelA", "tests.DummyModelB"]
+    assert [cell.value for cell in wb["tests.DummyModelA"]["A"]] == [
+        "id",
+        obj_1.pk,
+        obj_3.pk,
+    ]
+    assert [cell.value for cell in wb["tests.DummyModelB"]["A"]] == ["id", obj_2.pk]
+
+
+def test_serializer_warns_if_there_is_nothing_to_save(fixture_path: Path) -> None:
+    # Act & assert.
+    with pytest.warns(
+        RuntimeWarning,
+        match=r"the output workbook is empty, so it won't be saved",
+    ):
+        serialize("xlsx", [], stream=fixture_path)
+
+    # Assert.
+    assert not fixture_path.exists()
+
+
+@pytest.mark.django_db
+def test_serializer_writes_workbook_to_binary_file_object() -> None:
+    # Arrange.
+    obj = DummyModel._default_manager.create()
+    stream = io.BytesIO()
+
+    # Act.
+    serialize("xlsx", [obj], stream=stream)
+
+    # Assert.
+    wb = openpyxl.load_workbook(stream)
+    assert list(wb["tests.DummyModel"].iter_rows(values_only=True)) == [
+        ("id",),
+        (obj.pk,),
+    ]
+
+
+@pytest.mark.parametrize("write_only", [False, True])
+@pytest.mark.django_db
+def test_serializer_writes_workbook_to_non_seekable_stream_incrementally(
+    write_only: bool,
+) -> None:
+    # Arrange.
+    class NonSeekableStream(io.RawIOBase):
+        def __init__(self) -> None:
+            self.chunks: list[bytes] = []
+
+        def writable(self) -> bool:
+            return True
+
+        def write(self, b: Any) -> int:
+            self.chunks.append(bytes(b))
+            return len(b)
+
+    obj = DummyModel._default_manager.create()
+    stream = NonSeekableStream()
+
+    # Act.
+    serialize("xlsx", [obj], stream=stream, write_only=write_only)
+
+    # Assert.
+    assert len(stream.chunks) > 1
+    wb = openpyxl.load_workbook(io.BytesIO(b"".join(stream.chunks)))
+    assert list(wb["tests.DummyModel"].iter_rows(values_only=True)) == [
+        ("id",),
+        (obj.pk,),
+    ]
+
+
+@pytest.mark.django_db
+def test_serializer_reads_queryset_with_keyset_pagination_if_chunk_size_is_set(
+    django_assert_num_queries: Any,
+) -> None:
+    # Arrange.
+    pks = [DummyModel._default_manager.create().pk for _ in range(5)]
+
+    # Act.
+    with django_assert_num_queries(3):
+        wb = serialize("xlsx", DummyModel._default_manager.all(), chunk_size=2)
+
+    # Assert.
+    assert [cell.value for cell in wb["tests.DummyModel"]["A"]] == ["id", *pks]
+
+
+@pytest.mark.django_db
+def test_serializer_reads_ordered_queryset_with_iterator_if_chunk_size_is_set() -> None:
+    # Arrange.
+    pks = [DummyModel._default_manager.create().pk for _ in range(3)]
+    queryset = DummyModel._default_manager.order_by("-pk")
+
+    # Act.
+    with mock.patch.object(
+        type(queryset),
+        "iterator",
+        autospec=True,
+        side_effect=type(queryset).iterator,
+    ) as iterator_mock:
+        wb = serialize("xlsx", queryset, chunk_size=2)
+
+    # Assert.
+    iterator_mock.assert_called_once_with(queryset, chunk_size=2)
+    assert [cell.value for cell in wb["tests.DummyModel"]["A"]] == ["id", *pks[::-1]]
+
+
+@pytest.mark.django_db
+def test_serializer_keeps_default_ordering_of_model_if_chunk_size_is_set() -> None:
+    # Arrange.
+    pks = [OrderedModel._default_manager.create().pk for _ in range(5)]
+
+    # Act.
+    wb = serialize("xlsx", OrderedModel._default_manager.all(), chunk_size=2)
+
+    # Assert.
+    assert [cell.value for cell in wb["tests.OrderedModel"]["A"]] == [
+        "id",
+        *pks[::-1],
+    ]
+
+
+@pytest.mark.django_db
+def test_serializer_reads_combined_queryset_in_chunks_if_chunk_size_is_set() -> None:
+    # Arrange.
+    pks = [DummyModel._default_manager.create().pk for _ in range(5)]
+    queryset = DummyModel._default_manager.filter(pk__lte=pks[1]).union(
+        DummyModel._default_manager.filter(pk__gte=pks[3]),
+    )
+
+    # Act.
+    wb = serialize("xlsx", queryset, chunk_size=2)
+
+    # Assert.
+    assert sorted(cell.value for cell in wb["tests.DummyModel"]["A"][1:]) == [
+        pks[0],
+        pks[1],
+        pks[3],
+        pks[4],
+    ]
+
+
+@pytest.mark.django_db
+def test_serializer_reads_queryset_with_chunk_size_from_settings(
+    django_assert_num_queries: Any,
+) -> None:
+    # Arrange.
+    for _ in range(4):
+        DummyModel._default_manager.create()
+
+    # Act & assert.
+    with (
+        override_settings(XLSX_SERIALIZER_CHUNK_SIZE=2),
+        django_assert_num_queries(3),
+    ):
+        serialize("xlsx", DummyModel._default_manager.all())
+
+
+@pytest.mark.django_db
+def test_serializer_serializes_objects_in_chunks_if_chunk_size_is_set() -> None:
+    # Arrange.
+    objs = [DummyModel._default_manager.create() for _ in range(3)]
+
+    # Act.
+    with mock.patch(
+        "xlsx_serializer.core._iter_chunks",
+        wraps=_iter_chunks,
+    ) as iter_chunks_mock:
+        wb = serialize("xlsx", iter(objs), chunk_size=2)
+
+    # Assert.
+    iter_chunks_mock.assert_called_once()
+    assert wb["tests.DummyModel"].max_row == 4
+
+
+@pytest.mark.django_db
+def test_serializer_continues_model_sheet_if_row_limit_is_reached() -> None:
+    # Arrange.
+    objs = [DummyModel._default_manager.create() for _ in range(5)]
+
+    # Act.
+    with mock.patch("xlsx_serializer.core.SHEET_MAX_ROWS", 3):
+        wb = serialize("xlsx", objs)
+
+    # Assert.
+    assert wb.sheetnames == [
+        "tests.DummyModel",
+        "tests.DummyModel (2)",
+        "tests.DummyModel (3)",
+    ]
+    assert [[cell.value for cell in ws["A"]] for ws in wb] == [
+        ["id", objs[0].pk, objs[1].pk],
+        ["id", objs[2].pk, objs[3].pk],
+        ["id", objs[4].pk],
+    ]
+
+
+@pytest.mark.django_db
+def test_serializer_applies_shortened_continuation_sheet_name_if_model_label_is_too_long() -> None:  # fmt: skip
+    # Arrange.
+    objs = [
+        LabelLongerThan31CharactersModel._default_manager.create() for _ in range(2)
+    ]
+
+    # Act.
+    with (
+        mock.patch("xlsx_serializer.core.SHEET_MAX_ROWS", 2),
+        pytest.warns(RuntimeWarning),
+    ):
+        wb = serialize("xlsx", objs)
+
+    # Assert.
+    assert wb.sheetnames == [
+        "LabelLongerThan31CharactersMode",
+        "LabelLongerThan31Characters (2)",
+    ]
+
+
+@pytest.mark.django_db
+def test_serializer_raises_error_if_continuation_sheet_name_is_not_unique() -> None:
+    # Arrange.
+    objs = [
+        DummyModelB._default_manager.create(),
+        *(DummyModelA._default_manager.create() for _ in range(2)),
+    ]
+
+    # Act & assert.
+    with (
+        mock.patch("xlsx_serializer.core.SHEET_MAX_ROWS", 2),
+        pytest.raises(
+            SerializationError,
+            match=(
+                r"the continuation sheet name 'A \(2\)' for serializing the "
+                r"'tests.DummyModelA' isn't unique"
+            ),
+        ),
+    ):
+        serialize(
+            "xlsx",
+            objs,
+            model_sheet_names={"tests.DummyModelA": "A", "tests.DummyModelB": "A (2)"},
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "use_natural_foreign_keys",
+    [False, True],
+    ids=["auto_fks", "natural_fks"],
+)
+def test_serializer_prefetches_many_to_many_relations_in_bulk(
+    django_assert_num_queries: Any,
+    use_natural_foreign_keys: bool,
+) -> None:
+    # Arrange.
+    pk_model_objs = [PrimaryKeyModel._default_manager.create() for _ in range(2)]
+    nk_model_obj = NaturalKeyModel._default_manager.create(
+        nk_field_1="value",
+        nk_field_2=42,
+    )
+    for _ in range(3):
+        obj = ManyToManyFieldModel._default_manager.create()
+        obj.to_pk_model_field.set(pk_model_objs)
+        obj.to_nk_model_field.set([nk_model_obj])
+
+    # Act.
+    with django_assert_num_queries(3):
+        wb = serialize(
+            "xlsx",
+            ManyToManyFieldModel._default_manager.all(),
+            use_natural_foreign_keys=use_natural_foreign_keys,
+        )
+
+    # Assert.
+    assert list(wb["tests.ManyToManyFieldModel"].iter_rows(values_only=True))[1:] == [
+        (
+            obj.pk,
+            str([pk_model_obj.pk for pk_model_obj in pk_model_objs]),
+            str(
+                [("value", 42)] if use_natural_foreign_keys else [nk_model_obj.pk],
+            ),
+        )
+        for obj in ManyToManyFieldModel._default_manager.order_by("pk")
+    ]
+
+
+@pytest.mark.django_db
+def test_serializer_prefetches_many_to_many_relations_per_chunk(
+    django_assert_num_queries: Any,
+) -> None:
+    # Arrange.
+    pk_model_obj = PrimaryKeyModel._default_manager.create()
+    for _ in range(3):
+        ManyToManyFieldModel._default_manager.create().to_pk_model_field.add(
+            pk_model_obj,
+        )
+
+    # Act.
+    with django_assert_num_queries(4):
+        serialize(
+            "xlsx",
+            ManyToManyFieldModel._default_manager.all(),
+            fields=["to_pk_model_field"],
+            chunk_size=2,
+        )
+
+
+@pytest.mark.django_db
+def test_serializer_fetches_objects_related_by_natural_foreign_keys_in_bulk(
+    django_assert_num_queries: Any,
+) -> None:
+    # Arrange.
+    pk_model_obj = PrimaryKeyModel._default_manager.create()
+    nk_model_objs = [
+        NaturalKeyModel._default_manager.create(nk_field_1="value", nk_field_2=i)
+        for i in range(2)
+    ]
+    for i in range(4):
+        ForeignKeyModel._default_manager.create(
+            to_pk_model_field=pk_model_obj,
+            to_nk_model_field=nk_model_objs[i % 2],
+        )
+
+    # Act.
+    with django_assert_num_queries(2):
+        wb = serialize(
+            "xlsx",
+            ForeignKeyModel._default_manager.all(),
+            use_natural_foreign_keys=True,
+        )
+
+    # Assert.
+    assert [
+        row[1:]
+        for row in wb["tests.ForeignKeyModel"].iter_rows(min_row=2, values_only=True)
+    ] == [
+        (pk_model_obj.pk, "('value', 0)"),
+        (pk_model_obj.pk, "('value', 1)"),
+    ] * 2
+
+
+@pytest.mark.django_db
+def test_serializer_caches_natural_keys_of_related_objects(
+    django_assert_num_queries: Any,
+) -> None:
+    # Arrange.
+    pk_model_obj = PrimaryKeyModel._default_manager.create()
+    nk_model_obj = NaturalKeyModel._default_manager.create(
+        nk_field_1="value",
+        nk_field_2=42,
+    )
+    for _ in range(3):
+        ForeignKeyModel._default_manager.create(
+            to_pk_model_field=pk_model_obj,
+            to_nk_model_field=nk_model_obj,
+        )
+
+    # Act.
+    with (
+        mock.patch.object(
+            NaturalKeyModel,
+            "natural_key",
+            autospec=True,
+            side_effect=NaturalKeyModel.natural_key,
+        ) as natural_key_mock,
+        django_assert_num_queries(5),
+    ):
+        wb = serialize(
+            "xlsx",
+            ForeignKeyModel._default_manager.all(),
+            use_natural_foreign_keys=True,
+            chunk_size=1,
+        )
+
+    # Assert.
+    natural_key_mock.assert_called_once()
+    assert [
+        row[2]
+        for row in wb["tests.ForeignKeyModel"].iter_rows(min_row=2, values_only=True)
+    ] == ["('value', 42)"] * 3
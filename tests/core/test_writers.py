@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import datetime as dt
+import io
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+from zipfile import ZipFile
+
+import openpyxl
+import pytest
+from openpyxl.utils.exceptions import IllegalCharacterError
+
+from django.core.serializers import serialize
+from django.core.serializers.base import SerializationError
+from django.test.utils import override_settings
+from django.utils.safestring import mark_safe
+
+from xlsx_serializer.container import COMPRESSIONS
+from xlsx_serializer.core import Deserializer
+from xlsx_serializer.writers import CELL_MAX_LENGTH, WRITERS, get_writer
+
+from tests.models import DummyModel, NaturalKeyModel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+ROWS: list[tuple[Any, ...]] = [
+    ("int", "float", "decimal", "str", "bool", "empty", "date"),
+    (1, 1.5, Decimal("2.25"), " <padded> & ", True, "", dt.date(2024, 2, 29)),
+    (
+        -2,
+        float("nan"),
+        None,
+        "zażółć",
+        False,
+        None,
+        dt.datetime(1999, 12, 31, 23, 59, 59),  # noqa: DTZ001
+    ),
+    (None, 1e-10, None, "=not a formula", None, None, dt.time(8, 15)),
+    (None, None, None, mark_safe("<safe>"), None, None, dt.timedelta(days=1, hours=2)),
+]
+
+
+def _write(writer_name: str, output: Path) -> None:
+    writer = get_writer(writer_name)(write_only=True)
+    for sheet_name in ["First", "Second"]:
+        sheet = writer.open_sheet(sheet_name)
+        writer.write_header(sheet, ROWS[0])
+        for row in ROWS[1:]:
+            writer.write_row(sheet, row)
+    writer.close(output)
+
+
+@pytest.mark.parametrize("writer", ["xml", "xlsxwriter"])
+def test_writer_writes_same_values_as_openpyxl(tmp_path: Path, writer: str) -> None:
+    # Arrange.
+    if writer not in WRITERS:
+        pytest.skip(f"the {writer!r} writer isn't installed")
+    _write("openpyxl", openpyxl_path := tmp_path / "openpyxl.xlsx")
+
+    # Act.
+    _write(writer, output_path := tmp_path / f"{writer}.xlsx")
+
+    # Assert.
+    openpyxl_workbook = openpyxl.load_workbook(openpyxl_path)
+    output_workbook = openpyxl.load_workbook(output_path)
+    assert output_workbook.sheetnames == openpyxl_workbook.sheetnames
+    for sheet_name in ["First", "Second"]:
+        rows = list(output_workbook[sheet_name].iter_rows(values_only=True))
+        assert rows == list(openpyxl_workbook[sheet_name].iter_rows(values_only=True))
+        assert rows[3][3] == "=not a formula"
+
+
+@pytest.mark.parametrize("writer", ["xml", "xlsxwriter"])
+def test_writer_stores_sheet_dimensions(fixture_path: Path, writer: str) -> None:
+    # Arrange.
+    if writer not in WRITERS:
+        pytest.skip(f"the {writer!r} writer isn't installed")
+
+    # Act.
+    _write(writer, fixture_path)
+
+    # Assert.
+    worksheet = openpyxl.load_workbook(fixture_path, read_only=True)["First"]
+    assert (worksheet.max_row, worksheet.max_column) == (len(ROWS), len(ROWS[0]))
+
+
+@pytest.mark.parametrize(
+    ("value", "error", "match"),
+    [
+        ("\x00", IllegalCharacterError, "cannot be used in worksheets"),
+        (
+            dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc),
+            SerializationError,
+            "timezone",
+        ),
+        (object(), SerializationError, "cannot convert"),
+    ],
+    ids=["illegal_character", "timezone", "unsupported_type"],
+)
+@pytest.mark.parametrize("writer_name", ["xml", "xlsxwriter"])
+def test_writer_raises_error_if_value_cannot_be_written(
+    writer_name: str,
+    value: Any,
+    error: type[Exception],
+    match: str,
+) -> None:
+    # Arrange.
+    if writer_name not in WRITERS:
+        pytest.skip(f"the {writer_name!r} writer isn't installed")
+    writer = get_writer(writer_name)(write_only=True)
+    sheet = writer.open_sheet("Sheet")
+
+    # Act & Assert.
+    try:
+        with pytest.raises(error, match=match):
+            writer.write_row(sheet, [value])
+    finally:
+        writer.close(None)
+
+
+@pytest.mark.parametrize("writer_name", sorted(WRITERS))
+def test_writer_raises_error_if_string_exceeds_cell_limit(writer_name: str) -> None:
+    # Arrange.
+    writer = get_writer(writer_name)(write_only=False)
+    sheet = writer.open_sheet("Sheet")
+
+    # Act & Assert.
+    try:
+        writer.write_row(sheet, ["x" * CELL_MAX_LENGTH])
+        with pytest.raises(SerializationError, match="exceeds the limit"):
+            writer.write_row(sheet, ["x" * (CELL_MAX_LENGTH + 1)])
+    finally:
+        writer.close(None)
+
+
+def test_get_writer_raises_error_if_writer_is_not_supported() -> None:
+    # Act & Assert.
+    with pytest.raises(
+        SerializationError,
+        match="the writer engine 'unknown' isn't supported",
+    ):
+        get_writer("unknown")
+
+
+@pytest.mark.parametrize(
+    ("options", "settings_overrides"),
+    [
+        ({"writer": "xml"}, {}),
+        ({}, {"XLSX_SERIALIZER_WRITER": "xml"}),
+        ({"writer": "xlsxwriter"}, {}),
+    ],
+    ids=["option", "setting", "xlsxwriter"],
+)
+@pytest.mark.django_db
+def test_serializer_writes_workbook_with_selected_writer(
+    fixture_path: Path,
+    options: dict[str, Any],
+    settings_overrides: dict[str, Any],
+) -> None:
+    # Arrange.
+    objs = [
+        DummyModel._default_manager.create(),
+        NaturalKeyModel._default_manager.create(nk_field_1="a", nk_field_2=1),
+        NaturalKeyModel._default_manager.create(nk_field_1="b", nk_field_2=2),
+    ]
+
+    if options.get("writer", "xml") not in WRITERS:
+        pytest.skip("the writer isn't installed")
+
+    # Act.
+    with override_settings(**settings_overrides):
+        serialize("xlsx", objs, stream=fixture_path, **options)
+
+    # Assert.
+    workbook = openpyxl.load_workbook(fixture_path)
+    assert {
+        worksheet.title: list(worksheet.iter_rows(values_only=True))
+        for worksheet in workbook
+    } == {
+        "tests.DummyModel": [("id",), (objs[0].pk,)],
+        "tests.NaturalKeyModel": [
+            ("id", "nk_field_1", "nk_field_2"),
+            (objs[1].pk, "a", 1),
+            (objs[2].pk, "b", 2),
+        ],
+    }
+
+
+@pytest.mark.parametrize("writer", ["xml", "xlsxwriter"])
+@pytest.mark.django_db
+def test_serializer_returns_workbook_contents_if_writer_has_no_stream(
+    writer: str,
+) -> None:
+    # Arrange.
+    if writer not in WRITERS:
+        pytest.skip(f"the {writer!r} writer isn't installed")
+    obj = DummyModel._default_manager.create()
+
+    # Act.
+    value = serialize("xlsx", [obj], writer=writer)
+
+    # Assert.
+    assert isinstance(value, bytes)
+    assert [
+        deserialized_object.object for deserialized_object in Deserializer(value)
+    ] == [obj]
+
+
+@pytest.mark.parametrize("writer", ["xml", "xlsxwriter"])
+def test_serializer_warns_if_writer_output_is_empty(writer: str) -> None:
+    # Arrange.
+    if writer not in WRITERS:
+        pytest.skip(f"the {writer!r} writer isn't installed")
+    stream = io.BytesIO()
+
+    # Act.
+    with pytest.warns(RuntimeWarning, match="the output workbook is empty"):
+        serialize("xlsx", [], stream=stream, writer=writer)
+
+    # Assert.
+    assert stream.getvalue() == b""
+
+
+@pytest.mark.parametrize("compression", list(COMPRESSIONS))
+@pytest.mark.parametrize("writer", sorted(WRITERS))
+@pytest.mark.django_db
+def test_serializer_compresses_workbook_as_selected(
+    fixture_path: Path,
+    writer: str,
+    compression: str,
+) -> None:
+    # Arrange.
+    obj = DummyModel._default_manager.create()
+
+    # Act.
+    serialize(
+        "xlsx",
+        [obj],
+        stream=fixture_path,
+        writer=writer,
+        compression=compression,
+    )
+
+    # Assert.
+    with ZipFile(fixture_path) as archive:
+        assert {info.compress_type for info in archive.infolist()} == {
+            COMPRESSIONS[compression][0],
+        }
+    worksheet = openpyxl.load_workbook(fixture_path)["tests.DummyModel"]
+    assert list(worksheet.iter_rows(values_only=True)) == [("id",), (obj.pk,)]
+
+
+@pytest.mark.django_db
+def test_serializer_compresses_workbook_as_set_in_settings(fixture_path: Path) -> None:
+    # Arrange.
+    obj = DummyModel._default_manager.create()
+
+    # Act.
+    with override_settings(XLSX_SERIALIZER_COMPRESSION="stored"):
+        serialize("xlsx", [obj], stream=fixture_path)
+
+    # Assert.
+    with ZipFile(fixture_path) as archive:
+        assert {info.compress_type for info in archive.infolist()} == {
+            COMPRESSIONS["stored"][0],
+        }
+
+
+@pytest.mark.parametrize("writer", sorted(WRITERS))
+def test_serializer_raises_error_if_compression_is_not_supported(writer: str) -> None:
+    # Act & Assert.
+    with pytest.raises(
+        SerializationError,
+        match="the compression 'unknown' isn't supported",
+    ):
+        serialize("xlsx", [], writer=writer, compression="unknown")
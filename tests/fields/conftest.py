@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import io
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import openpyxl
+import pytest
+
+from django.test.utils import override_settings
+
+from xlsx_serializer.core import Serializer
+from xlsx_serializer.readers import READERS
+from xlsx_serializer.writers import WRITERS
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+# Each of the installed engines (either reader or writer, or both) is used instead
+# of the default one.
+ENGINES = ["openpyxl", *sorted((READERS.keys() | WRITERS.keys()) - {"openpyxl"})]
+
+
+@pytest.fixture(autouse=True, params=ENGINES)
+def engine(request: pytest.FixtureRequest) -> Generator[str, None, None]:
+    # Run the field tests against every installed engine. The workbooks written by
+    # the other writers are read back by openpyxl (which remains the reference), so
+    # their values are compared with the ones written by openpyxl.
+    engine = request.param
+    with ExitStack() as stack:
+        stack.enter_context(
+            override_settings(
+                XLSX_SERIALIZER_READER=engine if engine in READERS else None,
+                XLSX_SERIALIZER_WRITER=engine if engine in WRITERS else None,
+            ),
+        )
+        if engine in WRITERS and engine != "openpyxl":
+            getvalue = Serializer.getvalue
+
+            def _getvalue(self: Serializer) -> Any:
+                value = getvalue(self)
+
+                return openpyxl.load_workbook(io.BytesIO(value)) if value else value
+
+            stack.enter_context(mock.patch.object(Serializer, "getvalue", _getvalue))
+
+        yield engine
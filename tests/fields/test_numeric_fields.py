@@ -9,6 +9,8 @@ import pytest
 from django.core.management import call_command
 from django.core.serializers import serialize
 
+from xlsx_serializer.writers import WRITERS
+
 from tests.models import (
     BigIntegerFieldModel,
     DecimalFieldModel,
@@ -257,7 +259,7 @@ def test_decimal_field_is_deserialized(fixture_path: Path) -> None:
 
 
 @pytest.mark.django_db
-def test_decimal_field_is_serialized() -> None:
+def test_decimal_field_is_serialized(engine: str) -> None:
     # Arrange.
     obj = DecimalFieldModel._default_manager.create(pk=1, decimal_field=Decimal("4.2"))
 
@@ -268,7 +270,13 @@ def test_decimal_field_is_serialized() -> None:
     assert wb["tests.DecimalFieldModel"]["A1"].value == "id"
     assert wb["tests.DecimalFieldModel"]["A2"].value == 1
     assert wb["tests.DecimalFieldModel"]["B1"].value == "decimal_field"
-    assert wb["tests.DecimalFieldModel"]["B2"].value == Decimal("4.2")
+    value = wb["tests.DecimalFieldModel"]["B2"].value
+    if engine in WRITERS and engine != "openpyxl":
+        # Decimals are stored as numbers, so they are read back as floats from the
+        # workbooks saved by the other writers (see the `engine` fixture).
+        assert Decimal(str(value)) == Decimal("4.2")
+    else:
+        assert value == Decimal("4.2")
 
 
 @pytest.mark.django_db
@@ -7,6 +7,9 @@ __all__ = [
     "BlankFieldModel",
     "BooleanFieldModel",
     "CharFieldModel",
+    "CyclicForeignKeyDependentModel",
+    "CyclicForeignKeyModelA",
+    "CyclicForeignKeyModelB",
     "DateFieldModel",
     "DateTimeFieldModel",
     "DecimalFieldModel",
@@ -31,6 +34,7 @@ __all__ = [
     "NotNullFieldModel",
     "NullFieldModel",
     "OneToOneFieldModel",
+    "OrderedModel",
     "PositiveBigIntegerFieldModel",
     "PositiveIntegerFieldModel",
     "PositiveSmallIntegerFieldModel",
@@ -57,6 +61,7 @@ from .dummy import (
     LabelLongerThan31CharactersModelB,
     NotNullFieldModel,
     NullFieldModel,
+    OrderedModel,
 )
 from .file_fields import FileFieldModel, FilePathFieldModel, ImageFieldModel
 from .numeric_fields import (
@@ -70,6 +75,9 @@ from .numeric_fields import (
     SmallIntegerFieldModel,
 )
 from .related_fields import (
+    CyclicForeignKeyDependentModel,
+    CyclicForeignKeyModelA,
+    CyclicForeignKeyModelB,
     ForeignKeyModel,
     ManyToManyFieldModel,
     NaturalKeyModel,
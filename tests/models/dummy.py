@@ -15,6 +15,11 @@ class DummyModelB(models.Model):
     pass
 
 
+class OrderedModel(models.Model):
+    class Meta:
+        ordering = ("-pk",)
+
+
 class BlankFieldModel(models.Model):
     blank_field = models.CharField(max_length=255, blank=True)
 
@@ -58,3 +58,30 @@ class OneToOneFieldModel(models.Model):
 class ManyToManyFieldModel(models.Model):
     to_pk_model_field = models.ManyToManyField(PrimaryKeyModel, related_name="+")
     to_nk_model_field = models.ManyToManyField(NaturalKeyModel, related_name="+")
+
+
+class CyclicForeignKeyModelA(models.Model):
+    to_b_model_field = models.ForeignKey(
+        "tests.CyclicForeignKeyModelB",
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+
+
+class CyclicForeignKeyModelB(models.Model):
+    to_a_model_field = models.ForeignKey(
+        CyclicForeignKeyModelA,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+
+
+class CyclicForeignKeyDependentModel(models.Model):
+    to_a_model_field = models.ForeignKey(
+        CyclicForeignKeyModelA,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )